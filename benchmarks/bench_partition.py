@@ -0,0 +1,195 @@
+"""Benchmarks of partitioning and ordering, for `asv <https://asv.readthedocs.io>`__.
+
+The ``time_*_csr`` and ``time_*_mesh`` benchmarks pass inputs that need no
+conversion and thus measure (nearly only) the time spent in METIS. The
+``time_*_pythonic`` benchmarks pass lists of lists, and the
+``Conversion`` benchmarks measure the cost of converting those alone.
+``WrapperOverhead`` measures calls on tiny inputs, where the time spent in
+METIS is negligible.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar, Literal
+
+import numpy as np
+
+import pymetis
+from pymetis import generators
+
+
+NPARTS = 16
+GRAPHS = ["grid2d", "grid3d", "geometric", "power_law"]
+SIZES = [10_000, 100_000]
+
+
+def make_graph(name: str, size: int) -> pymetis.CSRAdjacency:
+    if name == "grid2d":
+        side = round(size ** (1 / 2))
+        return generators.grid_graph((side, side))
+    elif name == "grid3d":
+        side = round(size ** (1 / 3))
+        return generators.grid_graph((side, side, side))
+    elif name == "geometric":
+        return generators.random_geometric_graph(size, seed=1)
+    elif name == "power_law":
+        return generators.power_law_graph(size, seed=1)
+    else:
+        raise ValueError(f"unknown graph: {name}")
+
+
+def to_pythonic(csr: pymetis.CSRAdjacency) -> list[list[int]]:
+    return [nbrs.tolist()
+            for nbrs in np.split(np.asarray(csr.adjacent), csr.adj_starts[1:-1])]
+
+
+class PartGraph:
+    params: ClassVar = (GRAPHS, SIZES, ["kway", "recursive"])
+    param_names: ClassVar = ["graph", "size", "method"]
+    timeout = 300
+
+    csr: pymetis.CSRAdjacency
+    pythonic: list[list[int]]
+    recursive: bool
+
+    def setup(self, graph, size, method):
+        self.csr = make_graph(graph, size)
+        self.pythonic = to_pythonic(self.csr)
+        self.recursive = method == "recursive"
+
+    def part(self, adjacency):
+        return pymetis.part_graph(NPARTS, adjacency, recursive=self.recursive,
+                                  options=pymetis.Options(seed=1))
+
+    def time_csr(self, graph, size, method):
+        self.part(self.csr)
+
+    def time_pythonic(self, graph, size, method):
+        self.part(self.pythonic)
+
+    def peakmem_csr(self, graph, size, method):
+        self.part(self.csr)
+
+    def track_edge_cut(self, graph, size, method):
+        return self.part(self.csr).edge_cuts
+
+    track_edge_cut.unit = "edges"
+
+    def track_imbalance(self, graph, size, method):
+        stats = pymetis.partition_stats(
+            self.csr, self.part(self.csr).vertex_part, nparts=NPARTS)
+        return float(max(stats.imbalance))
+
+    track_imbalance.unit = "max/avg part weight"
+
+
+class PartMesh:
+    # boxes per axis of a tetrahedral mesh, with six elements per box
+    params: ClassVar = ([12, 24], ["nodal", "dual"])
+    param_names: ClassVar = ["boxes", "gtype"]
+    timeout = 300
+
+    mesh: pymetis.Mesh
+    pythonic: list[list[int]]
+    gtype: Literal[pymetis.GType.NODAL, pymetis.GType.DUAL]
+
+    def setup(self, boxes, gtype):
+        self.mesh = generators.tet_mesh((boxes, boxes, boxes))
+        self.pythonic = np.asarray(self.mesh.csr.elem_vertices).reshape(-1, 4).tolist()
+        self.gtype = pymetis.GType.DUAL if gtype == "dual" else pymetis.GType.NODAL
+
+    def part(self, connectivity):
+        return pymetis.part_mesh(NPARTS, connectivity, pymetis.Options(seed=1),
+                                 gtype=self.gtype, ncommon=3)
+
+    def time_mesh(self, boxes, gtype):
+        self.part(self.mesh)
+
+    def time_pythonic(self, boxes, gtype):
+        self.part(self.pythonic)
+
+    def peakmem_mesh(self, boxes, gtype):
+        self.part(self.mesh)
+
+    def track_edge_cut(self, boxes, gtype):
+        return self.part(self.mesh).edge_cuts
+
+    track_edge_cut.unit = "edges"
+
+
+class NestedDissection:
+    params: ClassVar = (GRAPHS, SIZES)
+    param_names: ClassVar = ["graph", "size"]
+    timeout = 300
+
+    csr: pymetis.CSRAdjacency
+    pythonic: list[list[int]]
+
+    def setup(self, graph, size):
+        self.csr = make_graph(graph, size)
+        self.pythonic = to_pythonic(self.csr)
+
+    def time_csr(self, graph, size):
+        pymetis.nested_dissection(self.csr)
+
+    def time_pythonic(self, graph, size):
+        pymetis.nested_dissection(self.pythonic)
+
+    def peakmem_csr(self, graph, size):
+        pymetis.nested_dissection(self.csr)
+
+    def track_nnz_l(self, graph, size):
+        perm, iperm = pymetis.nested_dissection(self.csr)
+        return pymetis.ordering_stats(self.csr, perm, iperm).nnz_l
+
+    track_nnz_l.unit = "nonzeros"
+
+
+class Conversion:
+    params: ClassVar = (GRAPHS, SIZES)
+    param_names: ClassVar = ["graph", "size"]
+
+    pythonic: list[list[int]]
+
+    def setup(self, graph, size):
+        self.pythonic = to_pythonic(make_graph(graph, size))
+
+    def time_to_csr_adjacency(self, graph, size):
+        pymetis.to_csr_adjacency(self.pythonic)
+
+
+class MeshConversion:
+    params: ClassVar = [12, 24]
+    param_names: ClassVar = ["boxes"]
+
+    pythonic: list[list[int]]
+
+    def setup(self, boxes):
+        mesh = generators.tet_mesh((boxes, boxes, boxes))
+        self.pythonic = np.asarray(mesh.csr.elem_vertices).reshape(-1, 4).tolist()
+
+    def time_mesh(self, boxes):
+        pymetis.Mesh(self.pythonic)
+
+
+class WrapperOverhead:
+    csr: pymetis.CSRAdjacency
+    pythonic: list[list[int]]
+    mesh: pymetis.Mesh
+
+    def setup(self):
+        self.csr = generators.grid_graph((3, 3))
+        self.pythonic = to_pythonic(self.csr)
+        self.mesh = generators.tet_mesh((1, 1, 1))
+
+    def time_part_graph_csr(self):
+        pymetis.part_graph(2, self.csr)
+
+    def time_part_graph_pythonic(self):
+        pymetis.part_graph(2, self.pythonic)
+
+    def time_part_mesh(self):
+        pymetis.part_mesh(2, self.mesh)
+
+    def time_nested_dissection(self):
+        pymetis.nested_dissection(self.csr)
@@ -17,14 +17,49 @@
     See above.
 
 .. autoclass:: CSRAdjacency
+.. autofunction:: to_csr_adjacency
+.. autoclass:: CSRMesh
+.. autoclass:: WeightedGraph
+.. autofunction:: save_graph
+.. autofunction:: load_graph
+.. autoclass:: WeightedMesh
+.. autofunction:: read_graph
+.. autofunction:: read_mesh
+.. autofunction:: write_partition
+.. autofunction:: write_permutation
+.. autoclass:: Mesh
 .. autofunction:: nested_dissection
+.. autofunction:: compute_vertex_separator
+.. autofunction:: refine_vertex_separator
+.. autofunction:: ordering_stats
+.. autofunction:: symbolic_analysis
+.. autofunction:: reorder_for_locality
 .. autofunction:: part_graph
 .. autofunction:: part_mesh
+.. autofunction:: element_weights_from_arity
+.. autofunction:: part_graph_many
+.. autofunction:: part_graph_best_of
+.. autofunction:: partition_stats
+.. autofunction:: make_contiguous
+.. autofunction:: refine_partition
+.. autofunction:: repartition
+.. autofunction:: part_mesh_many
+.. autofunction:: estimate_memory
 .. autofunction:: zero_copy_dtype
 
 .. autoclass:: Options
 .. autoclass:: MeshPartition
 .. autoclass:: GraphPartition
+.. autoclass:: BestOfPartition
+.. autoclass:: PartitionStats
+.. autoclass:: ContiguousPartition
+.. autoclass:: Repartition
+.. autoclass:: VertexSeparator
+.. autoclass:: SeparatorTreeOrdering
+.. autoclass:: OrderingStats
+.. autoclass:: MetisTimings
+.. autoclass:: SymbolicAnalysis
+.. autoclass:: LocalityOrdering
 .. autoclass:: OPType
 .. autoclass:: OptionKey
 .. autoclass:: PType
@@ -35,6 +70,28 @@
 .. autoclass:: DebugLevel
 .. autoclass:: ObjType
 
+Thread Safety
+^^^^^^^^^^^^^
+
+:func:`part_graph`, :func:`part_mesh` and :func:`nested_dissection` release
+the global interpreter lock while METIS runs, so that independent calls made
+from multiple threads (e.g. from a :class:`concurrent.futures.ThreadPoolExecutor`)
+proceed concurrently. Input arrays must not be modified while a call is in
+progress.
+
+With the METIS shipped with PyMETIS (the default), the random number
+generator used by METIS is kept per-thread, so results are identical to
+those of serial calls with the same :attr:`Options.seed`. If PyMETIS is
+built against another METIS (with ``-Duse-shipped-metis=false``), METIS uses
+the C library's :c:func:`rand`, whose state is shared by all threads, so
+concurrent calls are safe but their results depend on how they interleave.
+
+.. versionchanged:: 2026.1
+
+    The shipped METIS now uses GKlib's random number generator rather than
+    :c:func:`rand`. As a result, partitions and orderings differ from those
+    computed by previous versions of PyMETIS with the same inputs and seed.
+
 References
 ^^^^^^^^^^
 
@@ -75,7 +132,8 @@ THE SOFTWARE.
 """
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Literal, NamedTuple, TypeAlias, overload
+from numbers import Real
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypeAlias, cast, overload
 from warnings import warn
 
 from typing_extensions import deprecated, override
@@ -85,10 +143,13 @@ from pymetis.version import version, version_tuple
 
 
 if TYPE_CHECKING:
+    import os
     from collections.abc import Mapping, Sequence
 
     import numpy as np
 
+    from pymetis.cache import PartitionCache
+
 
 from pymetis._internal import OPType
 
@@ -247,7 +308,9 @@ class GraphPartition(NamedTuple):
     "Number of edges which needed cutting to form partitions"
 
     vertex_part: Sequence[int]
-    "List with vertex partition indices"
+    """Vertex partition indices, as a :mod:`numpy` array of
+    :func:`zero_copy_dtype` (or an :class:`array.array` if :mod:`numpy`
+    is not available)"""
 
 
 class MeshPartition(NamedTuple):
@@ -262,10 +325,340 @@ class MeshPartition(NamedTuple):
     "Number of edges which needed cutting to form partitions"
 
     element_part: Sequence[int]
-    "List with element partition indices"
+    "Element partition indices, see :attr:`GraphPartition.vertex_part`"
+
+    vertex_part: Sequence[int]
+    "Vertex partition indices, see :attr:`GraphPartition.vertex_part`"
+
+
+class BestOfPartition(NamedTuple):
+    """A named tuple describing the best of several independently seeded
+    partitionings of a graph, see :func:`part_graph_best_of`.
+
+    .. autoattribute:: edge_cuts
+    .. autoattribute:: vertex_part
+    .. autoattribute:: best_trial
+    .. autoattribute:: trial_objvals
+    .. autoattribute:: seeds
+
+    .. versionadded:: 2026.1
+    """
+    edge_cuts: int
+    """Objective value of the best trial: the number of edges cut, or the
+    total communication volume if :attr:`ObjType.VOL` is selected"""
 
     vertex_part: Sequence[int]
-    "List with vertex partition indices"
+    "List with vertex partition indices of the best trial"
+
+    best_trial: int
+    "Index of the best trial"
+
+    trial_objvals: Sequence[int]
+    "Objective value reached by each trial"
+
+    seeds: Sequence[int]
+    "Random seed used by each trial"
+
+
+class PartitionStats(NamedTuple):
+    """A named tuple of quality metrics of a graph partition, see
+    :func:`partition_stats`. Arrays are as described in
+    :attr:`GraphPartition.vertex_part`, per-part arrays have one entry per
+    part.
+
+    .. autoattribute:: edge_cut
+    .. autoattribute:: total_comm_volume
+    .. autoattribute:: max_comm_volume
+    .. autoattribute:: comm_volume
+    .. autoattribute:: part_weights
+    .. autoattribute:: imbalance
+    .. autoattribute:: boundary_vertices
+    .. autoattribute:: neighbor_parts
+    .. autoattribute:: components
+
+    .. versionadded:: 2026.1
+    """
+    edge_cut: int
+    "Total weight of the edges between different parts"
+
+    total_comm_volume: int
+    """Total communication volume, as minimized by :attr:`ObjType.VOL`: the
+    sum over all vertices of their size times the number of other parts
+    among their neighbors"""
+
+    max_comm_volume: int
+    "Largest entry of :attr:`comm_volume`"
+
+    comm_volume: Sequence[int]
+    "Communication volume of each part, i.e. of the vertices in it"
+
+    part_weights: Sequence[int]
+    """Total vertex weight of each part, of shape ``(nparts, ncon)`` for
+    multi-constraint vertex weights"""
+
+    imbalance: Sequence[float]
+    """For each constraint, the largest part weight divided by the average
+    part weight, comparable to *ubvec* in :func:`part_graph`"""
+
+    boundary_vertices: Sequence[int]
+    "Number of vertices in each part with a neighbor in another part"
+
+    neighbor_parts: Sequence[int]
+    "Number of other parts adjacent to each part"
+
+    components: Sequence[int]
+    """Number of connected components of each part. Parts with more than one
+    are disconnected, empty parts have none."""
+
+
+class ContiguousPartition(NamedTuple):
+    """A named tuple returned by :func:`make_contiguous`.
+
+    .. autoattribute:: vertex_part
+    .. autoattribute:: moved_components
+
+    .. versionadded:: 2026.1
+    """
+    vertex_part: Sequence[int]
+    "The repaired partition, as described in :attr:`GraphPartition.vertex_part`"
+
+    moved_components: int
+    "Number of connected components that were moved to another part"
+
+
+class Repartition(NamedTuple):
+    """A named tuple returned by :func:`repartition`.
+
+    .. autoattribute:: edge_cuts
+    .. autoattribute:: vertex_part
+    .. autoattribute:: migration_volume
+    .. autoattribute:: from_scratch
+
+    .. versionadded:: 2026.1
+    """
+    edge_cuts: int
+    "Total weight of the edges between different parts"
+
+    vertex_part: Sequence[int]
+    "The new partition, as described in :attr:`GraphPartition.vertex_part`"
+
+    migration_volume: int
+    "Total *vsize* of the vertices whose part differs from the old partition"
+
+    from_scratch: bool
+    """*True* if the partition was computed from scratch and remapped,
+    *False* if it was obtained by refining the old partition"""
+
+
+class SeparatorTreeOrdering(NamedTuple):
+    """A named tuple describing a nested dissection ordering together with
+    the top levels of its separator tree, see the *npes* argument of
+    :func:`nested_dissection`.
+
+    .. autoattribute:: perm
+    .. autoattribute:: iperm
+    .. autoattribute:: sizes
+
+    .. versionadded:: 2026.1
+    """
+    perm: Sequence[int]
+    "The fill-reducing permutation"
+
+    iperm: Sequence[int]
+    "The inverse of :attr:`perm`"
+
+    sizes: Sequence[int]
+    """An array of length ``2*npes - 1``. The first *npes* entries are the
+    sizes of the subdomains at the leaves of the separator tree, the
+    remaining ones the sizes of the separators, level by level from the
+    bottom, ending with the top-level separator. The permuted vertices
+    traverse the tree in postorder, e.g. for ``npes = 4``, the blocks of
+    consecutive vertices have sizes ``sizes[0], sizes[1], sizes[4],
+    sizes[2], sizes[3], sizes[5], sizes[6]``, in this order. Entries for
+    subtrees that METIS did not dissect further (because they had no edges)
+    are zero, with the entire subtree counted in its root."""
+
+
+class OrderingStats(NamedTuple):
+    """A named tuple describing the cost of a sparse Cholesky factorization
+    ``L L^T`` of a matrix with the nonzero structure of a graph, under a
+    given ordering, see :func:`ordering_stats`.
+
+    .. autoattribute:: nnz_l
+    .. autoattribute:: flops
+    .. autoattribute:: max_front_size
+    .. autoattribute:: tree_height
+
+    .. versionadded:: 2026.1
+    """
+    nnz_l: int
+    "Number of nonzeros in ``L``, including the diagonal"
+
+    flops: int
+    """Operation count of the numerical factorization, taken to be the sum
+    of the squares of the column counts of ``L``"""
+
+    max_front_size: int
+    """The largest column count of ``L``, i.e. the size of the largest frontal
+    matrix in a multifrontal factorization"""
+
+    tree_height: int
+    """Number of vertices on the longest path from a root to a leaf of the
+    elimination tree"""
+
+
+class MetisTimings(NamedTuple):
+    """A named tuple of the time METIS spent in each phase of a call to
+    :func:`part_graph`, :func:`part_mesh` or :func:`nested_dissection` made
+    with *collect_timings*, of statistics of the coarsening, and of the
+    memory METIS used. Times are
+    CPU seconds of the calling thread (where the platform supports this,
+    else of the process), as measured by METIS when
+    :attr:`DebugLevel.TIME` is set. Phases are nested: :attr:`total`
+    includes all others, :attr:`coarsening` includes :attr:`matching` and
+    :attr:`contraction`, and :attr:`uncoarsening` includes
+    :attr:`refinement` and :attr:`projection`.
+
+    .. autoattribute:: total
+    .. autoattribute:: coarsening
+    .. autoattribute:: matching
+    .. autoattribute:: contraction
+    .. autoattribute:: initial_partitioning
+    .. autoattribute:: uncoarsening
+    .. autoattribute:: refinement
+    .. autoattribute:: projection
+    .. autoattribute:: splitting
+    .. autoattribute:: coarsenings
+    .. autoattribute:: levels
+    .. autoattribute:: coarsest_vertices
+    .. autoattribute:: coarsest_edges
+    .. autoattribute:: peak_memory
+
+    .. versionadded:: 2026.1
+    """
+    total: float
+    "Time spent in the multilevel algorithm"
+
+    coarsening: float
+    "Time spent coarsening graphs"
+
+    matching: float
+    "Time spent computing matchings during coarsening"
+
+    contraction: float
+    "Time spent contracting matched vertices during coarsening"
+
+    initial_partitioning: float
+    "Time spent partitioning (or bisecting) the coarsest graphs"
+
+    uncoarsening: float
+    "Time spent projecting partitions to finer graphs and refining them"
+
+    refinement: float
+    "Time spent refining partitions during uncoarsening"
+
+    projection: float
+    "Time spent projecting partitions to finer graphs"
+
+    splitting: float
+    """Time spent splitting graphs into the subgraphs of their parts, in
+    recursive bisection and nested dissection"""
+
+    coarsenings: int
+    """Number of times a graph was coarsened, e.g. once per bisection in
+    recursive bisection, or per :attr:`Options.ncuts` trial"""
+
+    levels: int
+    """Number of coarsening levels of the first (i.e. top-level) coarsening,
+    zero if there was none"""
+
+    coarsest_vertices: int
+    "Number of vertices of the coarsest graph of the first coarsening"
+
+    coarsest_edges: int
+    "Number of edges of the coarsest graph of the first coarsening"
+
+    peak_memory: int
+    """Largest number of bytes METIS had allocated at any one time, as
+    tracked by its memory accounting (which :attr:`DebugLevel.MEMORY`
+    reports). This does not include the input and output arrays, which
+    PyMETIS allocates. Compare :func:`estimate_memory`."""
+
+
+class SymbolicAnalysis(NamedTuple):
+    """A named tuple describing the structure of the Cholesky factor ``L`` of a
+    reordered matrix, see :func:`symbolic_analysis`. All indices refer to
+    rows/columns of the reordered matrix, and all arrays are as described
+    in :attr:`GraphPartition.vertex_part`.
+
+    .. autoattribute:: parent
+    .. autoattribute:: postorder
+    .. autoattribute:: column_counts
+    .. autoattribute:: supernode_starts
+
+    .. versionadded:: 2026.1
+    """
+    parent: Sequence[int]
+    "The parent of each column in the elimination tree, or -1 for roots"
+
+    postorder: Sequence[int]
+    """The columns in a postorder of the elimination tree, visiting children
+    in increasing order. Applying it as a further permutation leaves the
+    fill unchanged but makes subtrees contiguous."""
+
+    column_counts: Sequence[int]
+    "The number of nonzeros in each column of ``L``, including the diagonal"
+
+    supernode_starts: Sequence[int]
+    """The first column of each fundamental supernode, followed by the
+    number of columns, so that supernode ``i`` consists of columns
+    ``range(supernode_starts[i], supernode_starts[i+1])``"""
+
+
+class LocalityOrdering(NamedTuple):
+    """A named tuple describing a renumbering of the vertices of a graph, see
+    :func:`reorder_for_locality`. Arrays are as described in
+    :attr:`GraphPartition.vertex_part`.
+
+    .. autoattribute:: old2new
+    .. autoattribute:: new2old
+    .. autoattribute:: adjacency
+    .. autoattribute:: vweights
+    .. autoattribute:: eweights
+
+    .. versionadded:: 2026.1
+    """
+    old2new: Sequence[int]
+    "The new number of each vertex"
+
+    new2old: Sequence[int]
+    "The old number of each vertex, the inverse of :attr:`old2new`"
+
+    adjacency: CSRAdjacency | None = None
+    "The renumbered graph, if requested"
+
+    vweights: Sequence[int] | None = None
+    "The vertex weights in the new numbering, if requested and given"
+
+    eweights: Sequence[int] | None = None
+    "The edge weights matching :attr:`adjacency`, if requested and given"
+
+
+class VertexSeparator(NamedTuple):
+    """A named tuple describing a vertex separator of a graph, see
+    :func:`compute_vertex_separator`.
+
+    .. autoattribute:: separator_size
+    .. autoattribute:: part
+
+    .. versionadded:: 2026.1
+    """
+    separator_size: int
+    "Total weight of the vertices in the separator"
+
+    part: Sequence[int]
+    """For each vertex, 0 or 1 for the side it lies on, or 2 if it is part of
+    the separator, see :attr:`GraphPartition.vertex_part` for the array type"""
 
 
 # {{{ Options handling
@@ -334,6 +727,228 @@ class CSRAdjacency:
     adjacent: IntSequence
 
 
+def to_csr_adjacency(adjacency: CSRAdjacency | PythonicGraph) -> CSRAdjacency:
+    """Convert a :class:`PythonicGraph` to a :class:`CSRAdjacency`, whose
+    arrays are of :func:`zero_copy_dtype` (if :mod:`numpy` is available). The
+    result may be cached and passed to any number of subsequent calls without
+    further conversion cost. A :class:`CSRAdjacency` is returned unchanged.
+
+    The conversion is done natively. *adjacency* may be a sequence (such as a
+    :class:`list`) or a mapping with keys ``range(len(adjacency))``, and its
+    entries may be sequences of integers or integer arrays of any width.
+
+    :raises ValueError: if a vertex index is out of range.
+
+    .. versionadded:: 2026.1
+    """
+    if isinstance(adjacency, CSRAdjacency):
+        return adjacency
+
+    from pymetis._internal import csr_from_adjacency
+    adj_starts, adjacent = csr_from_adjacency(adjacency)
+    return CSRAdjacency(adj_starts=adj_starts, adjacent=adjacent)
+
+
+@dataclass(frozen=True)
+class CSRMesh:
+    """
+    .. autoattribute:: elem_starts
+
+        Length must be number of elements + 1.
+
+    .. autoattribute:: elem_vertices
+
+    Element `i` has vertices ``elem_vertices[elem_starts[i]:elem_starts[i+1]]``.
+
+    .. versionadded:: 2026.1
+    """
+    elem_starts: IntSequence
+    elem_vertices: IntSequence
+
+
+class WeightedGraph(NamedTuple):
+    """A named tuple of a graph and its weights, as returned by
+    :func:`load_graph`. Weights that are not present are *None*.
+
+    .. autoattribute:: adjacency
+    .. autoattribute:: vweights
+    .. autoattribute:: eweights
+    .. autoattribute:: vsize
+
+    .. versionadded:: 2026.1
+    """
+    adjacency: CSRAdjacency
+
+    vweights: IntSequence | np.ndarray | None
+    """Vertex weights as for :func:`part_graph`, of shape ``(nvtxs, ncon)``
+    for multiple constraints"""
+
+    eweights: IntSequence | None
+    "Edge weights, with one entry per entry of :attr:`CSRAdjacency.adjacent`"
+
+    vsize: IntSequence | None
+    "Vertex sizes as for :func:`part_graph`"
+
+
+class WeightedMesh(NamedTuple):
+    """A named tuple of a mesh and its element weights, as returned by
+    :func:`read_mesh`.
+
+    .. autoattribute:: mesh
+    .. autoattribute:: element_weights
+
+    .. versionadded:: 2026.1
+    """
+    mesh: Mesh
+
+    element_weights: IntSequence | None
+    """Element weights as for :func:`part_mesh`, of shape ``(n_elements,
+    ncon)`` for multiple constraints, or *None*"""
+
+
+MeshConnectivity: TypeAlias = \
+        "Mesh | CSRMesh | Sequence[IntSequence] | np.ndarray"
+
+
+def _prepare_mesh(
+            connectivity: MeshConnectivity,
+            n_vertices: int | None = None,
+        ) -> tuple[Sequence[IntSequence] | np.ndarray | None,
+                   IntSequence | None, IntSequence | None, int | None]:
+    if isinstance(connectivity, Mesh):
+        if n_vertices is None:
+            n_vertices = connectivity.n_vertices
+        connectivity = connectivity.csr
+
+    if isinstance(connectivity, CSRMesh):
+        return (None, connectivity.elem_starts, connectivity.elem_vertices,
+                n_vertices)
+    else:
+        return connectivity, None, None, n_vertices
+
+
+def _mesh_sizes(
+            connectivity: Sequence[IntSequence] | np.ndarray | None,
+            eptr: IntSequence | None,
+            eind: IntSequence | None,
+            n_vertices: int | None,
+        ) -> tuple[int, int, int]:
+    """Return the number of elements, the total number of their vertices and
+    the number of vertices of a mesh as returned by :func:`_prepare_mesh`.
+    """
+    def max_index(ary: IntSequence | np.ndarray) -> int:
+        if not len(ary):
+            return -1
+        return int(ary.max()) if hasattr(ary, "max") else max(ary)
+
+    if eind is not None:
+        assert eptr is not None
+        n_elements, entries = len(eptr) - 1, len(eind)
+        if n_vertices is None:
+            n_vertices = max_index(eind) + 1
+        return n_elements, entries, n_vertices
+
+    assert connectivity is not None
+    shape = getattr(connectivity, "shape", None)
+    if shape is not None:
+        if n_vertices is None:
+            n_vertices = max_index(cast("np.ndarray", connectivity)) + 1
+        return shape[0], shape[0] * shape[1], n_vertices
+
+    if n_vertices is None:
+        n_vertices = max((max_index(elem) for elem in connectivity),
+                         default=-1) + 1
+    return (len(connectivity), sum(len(elem) for elem in connectivity),
+            n_vertices)
+
+
+class Mesh:
+    """A mesh, with its dual and nodal graphs computed on first use (by
+    ``METIS_MeshToDual`` and ``METIS_MeshToNodal``) and cached. This avoids
+    rebuilding them when partitioning the same mesh repeatedly, e.g.::
+
+        mesh = Mesh(connectivity)
+        for n_parts in [2, 4, 8]:
+            edge_cuts, element_part = part_graph(n_parts, mesh.dual_graph(2))
+
+    A :class:`Mesh` may also be passed to :func:`part_mesh` in place of
+    a connectivity, which avoids repeated conversion (but not the
+    construction of the graph inside METIS).
+
+    .. automethod:: __init__
+
+    .. attribute:: csr
+
+        The connectivity as a :class:`CSRMesh` of :func:`zero_copy_dtype`.
+
+    .. attribute:: n_vertices
+
+    .. autoproperty:: n_elements
+    .. automethod:: dual_graph
+    .. automethod:: nodal_graph
+
+    .. versionadded:: 2026.1
+    """
+
+    csr: CSRMesh
+    n_vertices: int
+
+    def __init__(self,
+                connectivity: CSRMesh | Sequence[IntSequence] | np.ndarray,
+                n_vertices: int | None = None,
+                *,
+                warn_on_copies: bool = False,
+            ) -> None:
+        """
+        :arg connectivity: the mesh, in any form accepted by :func:`part_mesh`.
+        :arg n_vertices: the number of vertices. If not given, it is taken
+            to be one more than the largest vertex index.
+        """
+        conn, eptr, eind, n_vertices = _prepare_mesh(connectivity, n_vertices)
+
+        from pymetis._internal import mesh_csr
+        elem_starts, elem_vertices, self.n_vertices = mesh_csr(
+            conn, eptr, eind, n_vertices, warn_on_copies=warn_on_copies)
+        self.csr = CSRMesh(elem_starts=elem_starts, elem_vertices=elem_vertices)
+
+        self._dual_graphs: dict[int, CSRAdjacency] = {}
+        self._nodal_graph: CSRAdjacency | None = None
+
+    @property
+    def n_elements(self) -> int:
+        return len(self.csr.elem_starts) - 1
+
+    def _to_graph(self, dual: bool, ncommon: int) -> CSRAdjacency:
+        from pymetis._internal import mesh_to_graph
+        adj_starts, adjacent = mesh_to_graph(
+            self.csr.elem_starts, self.csr.elem_vertices, self.n_vertices,
+            dual, ncommon)
+        return CSRAdjacency(adj_starts=adj_starts, adjacent=adjacent)
+
+    def dual_graph(self, ncommon: int = 1) -> CSRAdjacency:
+        """Return the graph whose vertices are the elements of the mesh, with
+        an edge between two elements if they share at least *ncommon*
+        vertices.
+
+        The arrays of the result are owned by METIS and are not copied.
+        """
+        try:
+            return self._dual_graphs[ncommon]
+        except KeyError:
+            graph = self._dual_graphs[ncommon] = self._to_graph(True, ncommon)
+            return graph
+
+    def nodal_graph(self) -> CSRAdjacency:
+        """Return the graph whose vertices are the vertices of the mesh, with
+        an edge between two vertices if they belong to a common element.
+
+        The arrays of the result are owned by METIS and are not copied.
+        """
+        if self._nodal_graph is None:
+            self._nodal_graph = self._to_graph(False, 1)
+        return self._nodal_graph
+
+
 def verify_nd(perm, iperm):
     from pymetis._internal import verify_nd
     return verify_nd(perm, iperm)
@@ -348,18 +963,8 @@ def _prepare_graph(
         if xadj is not None or adjncy is not None:
             raise TypeError("may not pass xadj/adjacency if adjacency is passed")
 
-        if isinstance(adjacency, CSRAdjacency):
-            return adjacency.adj_starts, adjacency.adjacent
-
-        xadj = [0]
-        adjncy = []
-
-        for i in range(len(adjacency)):
-            adj = adjacency[i]
-            if __debug__ and len(adj):
-                assert max(adj) < len(adjacency)
-            adjncy += list(map(int, adj))
-            xadj.append(len(adjncy))
+        csr = to_csr_adjacency(adjacency)
+        return csr.adj_starts, csr.adjacent
     else:
         warn("Passing xadj/adjncy is deprecated and will be removed in 2027. "
              "Pass a CSRAdjacency object instead.", DeprecationWarning, stacklevel=3)
@@ -370,6 +975,250 @@ def _prepare_graph(
     return xadj, adjncy
 
 
+# {{{ memory estimates
+
+# Peak memory of METIS in words (i.e. idx_t or real_t), fitted to that of
+# METIS 5.1 on meshes and random geometric graphs, to within about 15%.
+# Besides the workspace (see AllocateWorkSpace in wspace.c), this is
+# taken up by the graph hierarchy: the vertex weights, edge weights, labels
+# and matchings of the input graph, and the coarser graphs, which together
+# are about as large again.
+_HIERARCHY_WORDS_PER_VERTEX = 12
+_HIERARCHY_WORDS_PER_CONSTRAINT = 2
+_HIERARCHY_WORDS_PER_EDGE = 3
+
+# k-way partitioning coarsens to about 30 vertices per part, which are then
+# partitioned by recursive bisection, and recursive bisection keeps
+# per-part weights while splitting.
+_KWAY_WORDS_PER_PART = 200
+_RB_WORDS_PER_PART = 10
+
+# building the graph of a mesh, which takes the inverse of its connectivity
+# (freed before partitioning starts)
+_WORDS_PER_TWO_MESH_ENTRIES = 1
+
+
+def estimate_memory(
+            kind: Literal["part_graph", "part_mesh", "nested_dissection"],
+            nvtxs: int,
+            nedges: int,
+            nparts: int = 2,
+            ncon: int = 1,
+            *,
+            recursive: bool = False,
+            mesh_entries: int = 0,
+        ) -> int:
+    """Return an estimate of the largest number of bytes that METIS
+    allocates at any one time in a call to :func:`part_graph`,
+    :func:`part_mesh` or :func:`nested_dissection`, as given by *kind*.
+    This is the memory limited by *max_memory* and reported as
+    :attr:`MetisTimings.peak_memory`.
+
+    The graph has *nvtxs* vertices, *ncon* vertex weights per vertex and
+    *nedges* entries in its adjacency (i.e. twice the number of its edges),
+    and is split into *nparts* parts, by recursive bisection if *recursive*
+    is *True*. For :func:`part_mesh`, these describe the graph METIS
+    builds from the mesh (whose vertices are the elements or vertices of the
+    mesh for a dual or nodal graph, respectively), and *mesh_entries* is the
+    total number of vertices of all elements.
+
+    The estimate is the size of the workspace METIS allocates up front and
+    of the hierarchy of coarsened graphs, with constants fitted to meshes
+    and geometric graphs, whose estimates are typically within 15% of the
+    memory used. Graphs that coarsen poorly, such as ones whose vertex
+    degrees follow a power law, may need several times as much.
+
+    .. versionadded:: 2026.1
+    """
+    if kind not in ("part_graph", "part_mesh", "nested_dissection"):
+        raise ValueError(f"unknown kind: {kind!r}")
+    if min(nvtxs, nedges, nparts, ncon, mesh_entries) < 0 or ncon < 1:
+        raise ValueError("sizes must be non-negative, and ncon positive")
+
+    from pymetis._internal import _idx_type_width  # pyright: ignore[reportPrivateUsage]
+    word = _idx_type_width() // 8
+
+    # the workspace, as allocated by AllocateWorkSpace (taking real_t to be
+    # as wide as idx_t)
+    pmetis = kind != "nested_dissection" and recursive
+    words = ((3 if pmetis else 4) * (nvtxs + 1)
+             + 2 * 5 * (nparts + 1) * ncon)
+
+    words += (_HIERARCHY_WORDS_PER_VERTEX * nvtxs
+              + _HIERARCHY_WORDS_PER_CONSTRAINT * (ncon - 1) * nvtxs
+              + _HIERARCHY_WORDS_PER_EDGE * nedges)
+
+    if kind != "nested_dissection":
+        words += (_RB_WORDS_PER_PART if recursive
+                  else _KWAY_WORDS_PER_PART) * nparts
+
+    if kind == "part_mesh":
+        words += _WORDS_PER_TWO_MESH_ENTRIES * mesh_entries // 2
+
+    return words * word
+
+
+def _check_memory(
+            max_memory: int | None,
+            kind: Literal["part_graph", "part_mesh", "nested_dissection"],
+            nvtxs: int,
+            nedges: int,
+            nparts: int = 2,
+            ncon: int = 1,
+            *,
+            recursive: bool = False,
+            mesh_entries: int = 0,
+        ) -> int:
+    """Raise :exc:`MemoryError` if :func:`estimate_memory` exceeds
+    *max_memory*, and return the limit to pass to METIS (0 for none).
+    """
+    if max_memory is None:
+        return 0
+    if max_memory <= 0:
+        raise ValueError("max_memory must be positive")
+
+    estimate = estimate_memory(kind, nvtxs, nedges, nparts, ncon,
+                               recursive=recursive, mesh_entries=mesh_entries)
+    if estimate > max_memory:
+        raise MemoryError(
+            f"METIS is estimated to need {estimate} bytes, "
+            f"more than max_memory={max_memory}")
+    return max_memory
+
+
+def _ncon(vweights: IntSequence | Sequence[IntSequence] | None, nvtxs: int) -> int:
+    if vweights is None or not nvtxs:
+        return 1
+    shape = getattr(vweights, "shape", None)
+    if shape is not None and len(shape) == 2:
+        return shape[1]
+    if len(vweights) and not isinstance(vweights[0], Real):
+        return len(cast("IntSequence", vweights[0]))
+    return max(len(vweights) // nvtxs, 1)
+
+# }}}
+
+
+@overload
+def nested_dissection(
+            adjacency: CSRAdjacency | PythonicGraph | None = None,
+            xadj: None = None,
+            adjncy: None = None,
+            vweights: IntSequence | None = None,
+            options: Options | None = None,
+            *,
+            perm_out: IntSequence | None = None,
+            iperm_out: IntSequence | None = None,
+            npes: None = None,
+            return_stats: Literal[False] = False,
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[False] = False,
+            max_memory: int | None = None,
+        ) -> tuple[Sequence[int], Sequence[int]]: ...
+
+@overload
+def nested_dissection(
+            adjacency: CSRAdjacency | PythonicGraph | None = None,
+            xadj: None = None,
+            adjncy: None = None,
+            vweights: IntSequence | None = None,
+            options: Options | None = None,
+            *,
+            perm_out: IntSequence | None = None,
+            iperm_out: IntSequence | None = None,
+            npes: int,
+            return_stats: Literal[False] = False,
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[False] = False,
+            max_memory: int | None = None,
+        ) -> SeparatorTreeOrdering: ...
+
+@overload
+def nested_dissection(
+            adjacency: CSRAdjacency | PythonicGraph | None = None,
+            xadj: None = None,
+            adjncy: None = None,
+            vweights: IntSequence | None = None,
+            options: Options | None = None,
+            *,
+            perm_out: IntSequence | None = None,
+            iperm_out: IntSequence | None = None,
+            npes: None = None,
+            return_stats: Literal[True],
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[False] = False,
+            max_memory: int | None = None,
+        ) -> tuple[tuple[Sequence[int], Sequence[int]], OrderingStats]: ...
+
+@overload
+def nested_dissection(
+            adjacency: CSRAdjacency | PythonicGraph | None = None,
+            xadj: None = None,
+            adjncy: None = None,
+            vweights: IntSequence | None = None,
+            options: Options | None = None,
+            *,
+            perm_out: IntSequence | None = None,
+            iperm_out: IntSequence | None = None,
+            npes: int,
+            return_stats: Literal[True],
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[False] = False,
+            max_memory: int | None = None,
+        ) -> tuple[SeparatorTreeOrdering, OrderingStats]: ...
+
+@overload
+def nested_dissection(
+            adjacency: CSRAdjacency | PythonicGraph | None = None,
+            xadj: None = None,
+            adjncy: None = None,
+            vweights: IntSequence | None = None,
+            options: Options | None = None,
+            *,
+            perm_out: IntSequence | None = None,
+            iperm_out: IntSequence | None = None,
+            npes: None = None,
+            return_stats: Literal[False] = False,
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[True],
+            max_memory: int | None = None,
+        ) -> tuple[tuple[Sequence[int], Sequence[int]], MetisTimings]: ...
+
+@overload
+def nested_dissection(
+            adjacency: CSRAdjacency | PythonicGraph | None = None,
+            xadj: None = None,
+            adjncy: None = None,
+            vweights: IntSequence | None = None,
+            options: Options | None = None,
+            *,
+            perm_out: IntSequence | None = None,
+            iperm_out: IntSequence | None = None,
+            npes: int,
+            return_stats: Literal[False] = False,
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[True],
+            max_memory: int | None = None,
+        ) -> tuple[SeparatorTreeOrdering, MetisTimings]: ...
+
+@overload
+def nested_dissection(
+            adjacency: CSRAdjacency | PythonicGraph | None = None,
+            xadj: None = None,
+            adjncy: None = None,
+            vweights: IntSequence | None = None,
+            options: Options | None = None,
+            *,
+            perm_out: IntSequence | None = None,
+            iperm_out: IntSequence | None = None,
+            npes: None = None,
+            return_stats: Literal[True],
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[True],
+            max_memory: int | None = None,
+        ) -> tuple[tuple[Sequence[int], Sequence[int]], OrderingStats,
+                   MetisTimings]: ...
+
 @overload
 def nested_dissection(
             adjacency: CSRAdjacency | PythonicGraph | None = None,
@@ -377,7 +1226,15 @@ def nested_dissection(
             adjncy: None = None,
             vweights: IntSequence | None = None,
             options: Options | None = None,
-        ) -> Sequence[int]: ...
+            *,
+            perm_out: IntSequence | None = None,
+            iperm_out: IntSequence | None = None,
+            npes: int,
+            return_stats: Literal[True],
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[True],
+            max_memory: int | None = None,
+        ) -> tuple[SeparatorTreeOrdering, OrderingStats, MetisTimings]: ...
 
 @overload
 @deprecated("pass a CSRAdjacency object instead")
@@ -387,7 +1244,15 @@ def nested_dissection(
             adjncy: IntSequence | None = None,
             vweights: IntSequence | None = None,
             options: Options | None = None,
-        ) -> Sequence[int]: ...
+            *,
+            perm_out: IntSequence | None = None,
+            iperm_out: IntSequence | None = None,
+            npes: None = None,
+            return_stats: Literal[False] = False,
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[False] = False,
+            max_memory: int | None = None,
+        ) -> tuple[Sequence[int], Sequence[int]]: ...
 
 
 def nested_dissection(
@@ -396,7 +1261,16 @@ def nested_dissection(
             adjncy: IntSequence | None = None,
             vweights: IntSequence | None = None,
             options: Options | None = None,
-        ) -> Sequence[int]:
+            *,
+            perm_out: IntSequence | None = None,
+            iperm_out: IntSequence | None = None,
+            npes: int | None = None,
+            return_stats: bool = False,
+            cache: PartitionCache | None = None,
+            collect_timings: bool = False,
+            max_memory: int | None = None,
+        ) -> (tuple[Sequence[int], Sequence[int]] | SeparatorTreeOrdering
+              | tuple[Any, ...]):
     """This function computes fill reducing orderings of sparse matrices using
     the multilevel nested dissection algorithm.
 
@@ -404,9 +1278,46 @@ def nested_dissection(
     or in the direct C-like way that Metis likes as *xadj* and *adjncy*. It
     is an error to specify both graph inputs.
 
+    Returns a tuple ``(perm, iperm)`` of the fill-reducing permutation and its
+    inverse. These are :mod:`numpy` arrays of :func:`zero_copy_dtype` if
+    :mod:`numpy` is available, or :class:`array.array` instances otherwise.
+    If *perm_out* or *iperm_out* are given, they must be writable, C-contiguous
+    buffers of :func:`zero_copy_dtype` with one entry per vertex. METIS
+    then writes its results directly into them, and they are returned in
+    place of newly allocated arrays.
+
+    If *npes*, a power of two, is given, ``METIS_NodeNDP`` is used instead,
+    which keeps track of the top ``log2(npes)`` levels of the separator tree,
+    e.g. to assign subtrees to *npes* workers in a parallel factorization. A
+    :class:`SeparatorTreeOrdering` is returned in that case. If *vweights*
+    are given, its sizes are sums of weights rather than vertex counts.
+
+    If *return_stats* is *True*, the fill-in and cost of the ordering are
+    computed as well, as by :func:`ordering_stats` but without converting the
+    graph again, and ``(ordering, stats)`` is returned, where *ordering* is
+    the return value described above and *stats* is an :class:`OrderingStats`.
+
+    If a :class:`~pymetis.cache.PartitionCache` is passed as *cache*, a result
+    stored for identical inputs is returned (or written to *perm_out* and
+    *iperm_out*) instead of running METIS, and new results are stored.
+
+    If *collect_timings* is *True*, the time METIS spends in each phase is
+    recorded, and ``(ordering, timings)`` (or, with *return_stats*,
+    ``(ordering, stats, timings)``) is returned, where *timings* is a
+    :class:`MetisTimings`. METIS is then always run, even if *cache* holds a
+    result.
+
+    *max_memory* limits the memory that METIS may allocate, in bytes, as for
+    :func:`part_graph`.
+
     .. versionchanged:: 2025.2.2
 
         Added *vweights*.
+
+    .. versionchanged:: 2026.1
+
+        Return :mod:`numpy` arrays, added *perm_out*, *iperm_out*, *npes*,
+        *return_stats*, *cache*, *collect_timings* and *max_memory*.
     """
     xadj, adjncy = _prepare_graph(adjacency, xadj, adjncy)
 
@@ -416,8 +1327,180 @@ def nested_dissection(
     if options.numbering not in [-1, 0]:
         raise ValueError("METIS numbering option must be set to 0 or the default")
 
-    from pymetis._internal import edge_nd
-    return edge_nd(xadj, adjncy, vweights, options)
+    arrays: Sequence[Any] | None = None
+    stats: Sequence[int] = ()
+    key = None
+    if cache is not None:
+        from pymetis.cache import array_from_bytes
+
+        key = cache.key("nested_dissection", [xadj, adjncy, vweights],
+                        options=options, scalars=[npes, return_stats])
+        record = None if collect_timings else cache.get(key)
+        if record is not None:
+            narrays = 2 if npes is None else 3
+            arrays = [
+                array_from_bytes(cast("bytes", data), ary_out, name)
+                for data, ary_out, name in zip(
+                    record[:narrays], [perm_out, iperm_out, None],
+                    ["perm_out", "iperm_out", "sizes"], strict=False)]
+            stats = cast("tuple[int, ...]", record[narrays:])
+
+    timings = None
+    if arrays is None:
+        memory_limit = _check_memory(
+            max_memory, "nested_dissection", len(xadj) - 1, xadj[-1])
+
+        if npes is not None:
+            from pymetis._internal import node_ndp
+            result = node_ndp(xadj, adjncy, vweights, npes, options,
+                              perm_out=perm_out, iperm_out=iperm_out,
+                              return_stats=return_stats,
+                              collect_timings=collect_timings,
+                              max_memory=memory_limit)
+        else:
+            from pymetis._internal import edge_nd
+            result = edge_nd(xadj, adjncy, vweights, options,
+                             perm_out=perm_out, iperm_out=iperm_out,
+                             return_stats=return_stats,
+                             collect_timings=collect_timings,
+                             max_memory=memory_limit)
+
+        if collect_timings:
+            *result, timings = result
+        if return_stats:
+            *arrays, stats = result
+        else:
+            arrays = result
+
+        if cache is not None:
+            from pymetis.cache import array_to_bytes
+
+            assert key is not None
+            cache.put(key, (*(array_to_bytes(ary) for ary in arrays), *stats))
+
+    ordering = (SeparatorTreeOrdering(*arrays) if npes is not None
+                else tuple(arrays))
+    extras = []
+    if return_stats:
+        extras.append(OrderingStats(*stats))
+    if timings is not None:
+        extras.append(MetisTimings(*timings))
+    if extras:
+        return (ordering, *extras)
+    return ordering
+
+
+def ordering_stats(
+            adjacency: CSRAdjacency | PythonicGraph,
+            perm: IntSequence,
+            iperm: IntSequence | None = None,
+        ) -> OrderingStats:
+    """Return the fill-in and cost of a sparse Cholesky factorization of a
+    matrix with the nonzero structure of *adjacency* (which must be
+    symmetric), reordered by *perm* and its inverse *iperm* as returned by
+    :func:`nested_dissection`. If *iperm* is not given, it is computed from
+    *perm*.
+
+    This is computed natively from the elimination tree and its row
+    subtrees, in time proportional to the number of nonzeros in the factor.
+
+    :raises ValueError: if *perm* and *iperm* are not mutually inverse
+        permutations.
+
+    .. versionadded:: 2026.1
+    """
+    csr = to_csr_adjacency(adjacency)
+
+    from pymetis._internal import ordering_stats
+    return OrderingStats(*ordering_stats(csr.adj_starts, csr.adjacent, perm, iperm))
+
+
+def symbolic_analysis(
+            adjacency: CSRAdjacency | PythonicGraph,
+            perm: IntSequence,
+            iperm: IntSequence | None = None,
+        ) -> SymbolicAnalysis:
+    """Return the elimination tree, its postorder, the column counts and the
+    fundamental supernodes of the Cholesky factor of a matrix with the
+    nonzero structure of *adjacency* (which must be symmetric), reordered by
+    *perm* and its inverse *iperm* as returned by :func:`nested_dissection`.
+    If *iperm* is not given, it is computed from *perm*.
+
+    All of this is computed natively, in time proportional to the number of
+    nonzeros in the factor. A :class:`CSRAdjacency` of
+    :func:`zero_copy_dtype` is used without copying.
+
+    :raises ValueError: if *perm* and *iperm* are not mutually inverse
+        permutations.
+
+    .. versionadded:: 2026.1
+    """
+    csr = to_csr_adjacency(adjacency)
+
+    from pymetis._internal import symbolic_analysis
+    return SymbolicAnalysis(
+        *symbolic_analysis(csr.adj_starts, csr.adjacent, perm, iperm))
+
+
+def compute_vertex_separator(
+            adjacency: CSRAdjacency | PythonicGraph,
+            vweights: IntSequence | None = None,
+            options: Options | None = None,
+            *,
+            out: IntSequence | None = None,
+        ) -> VertexSeparator:
+    """Compute a balanced vertex separator of the graph *adjacency*, i.e. a
+    set of vertices whose removal splits the remaining vertices into two
+    parts of roughly equal weight with no edges between them, using
+    ``METIS_ComputeVertexSeparator``. This is the bisection step of
+    :func:`nested_dissection`, without the recursion.
+
+    *vweights* and *options* are as for :func:`nested_dissection`. If *out*
+    is given, it must be a writable, C-contiguous buffer of
+    :func:`zero_copy_dtype` with one entry per vertex, which receives the
+    result and is returned as :attr:`VertexSeparator.part`.
+
+    .. versionadded:: 2026.1
+    """
+    csr = to_csr_adjacency(adjacency)
+
+    if options is None:
+        options = Options()
+
+    if options.numbering not in [-1, 0]:
+        raise ValueError("METIS numbering option must be set to 0 or the default")
+
+    from pymetis._internal import compute_vertex_separator
+    return VertexSeparator(*compute_vertex_separator(
+        csr.adj_starts, csr.adjacent, vweights, options, out=out))
+
+
+def refine_vertex_separator(
+            adjacency: CSRAdjacency | PythonicGraph,
+            part: IntSequence,
+            vweights: IntSequence | None = None,
+            *,
+            ubfactor: float = 1.05,
+            out: IntSequence | None = None,
+        ) -> VertexSeparator:
+    """Improve an existing vertex separator of *adjacency*, such as a
+    :attr:`VertexSeparator.part` computed for a slightly different graph,
+    using the FM refinement of ``METIS_NodeRefine``. *part* assigns 0 or 1
+    to the vertices on either side and 2 to the separator vertices, and no
+    edge may join the two sides. Separator vertices are moved to a side as
+    long as neither side becomes heavier than *ubfactor* times the heavier
+    side of *part*.
+
+    *vweights* and *out* are as for :func:`compute_vertex_separator`. *out*
+    may be *part* itself.
+
+    .. versionadded:: 2026.1
+    """
+    csr = to_csr_adjacency(adjacency)
+
+    from pymetis._internal import node_refine
+    return VertexSeparator(*node_refine(
+        csr.adj_starts, csr.adjacent, vweights, part, ubfactor, out=out))
 
 
 @overload
@@ -427,14 +1510,19 @@ def part_graph(
             xadj: None = None,
             adjncy: None = None,
             *,
-            vweights: IntSequence | None = None,
+            vweights: IntSequence | Sequence[IntSequence] | None = None,
             vsize: IntSequence | None = None,
             eweights: IntSequence | None = None,
-            tpwgts: Sequence[float] | None = None,
+            tpwgts: Sequence[float] | Sequence[Sequence[float]] | None = None,
+            ubvec: Sequence[float] | None = None,
             recursive: bool | None = None,
             contiguous: bool | None = None,
             options: Options | None = None,
             warn_on_copies: bool = False,
+            out: IntSequence | None = None,
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[False] = False,
+            max_memory: int | None = None,
         ) -> GraphPartition: ...
 
 @overload
@@ -445,16 +1533,43 @@ def part_graph(
             xadj: IntSequence | None = None,
             adjncy: IntSequence | None = None,
             *,
-            vweights: IntSequence | None = None,
+            vweights: IntSequence | Sequence[IntSequence] | None = None,
             vsize: IntSequence | None = None,
             eweights: IntSequence | None = None,
-            tpwgts: Sequence[float] | None = None,
+            tpwgts: Sequence[float] | Sequence[Sequence[float]] | None = None,
+            ubvec: Sequence[float] | None = None,
             recursive: bool | None = None,
             contiguous: bool | None = None,
             options: Options | None = None,
             warn_on_copies: bool = False,
+            out: IntSequence | None = None,
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[False] = False,
+            max_memory: int | None = None,
         ) -> GraphPartition: ...
 
+@overload
+def part_graph(
+            nparts: int,
+            adjacency: PythonicGraph | CSRAdjacency | None = None,
+            xadj: None = None,
+            adjncy: None = None,
+            *,
+            vweights: IntSequence | Sequence[IntSequence] | None = None,
+            vsize: IntSequence | None = None,
+            eweights: IntSequence | None = None,
+            tpwgts: Sequence[float] | Sequence[Sequence[float]] | None = None,
+            ubvec: Sequence[float] | None = None,
+            recursive: bool | None = None,
+            contiguous: bool | None = None,
+            options: Options | None = None,
+            warn_on_copies: bool = False,
+            out: IntSequence | None = None,
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[True],
+            max_memory: int | None = None,
+        ) -> tuple[GraphPartition, MetisTimings]: ...
+
 
 def part_graph(
             nparts: int,
@@ -462,15 +1577,20 @@ def part_graph(
             xadj: IntSequence | None = None,
             adjncy: IntSequence | None = None,
             *,
-            vweights: IntSequence | None = None,
+            vweights: IntSequence | Sequence[IntSequence] | None = None,
             vsize: IntSequence | None = None,
             eweights: IntSequence | None = None,
-            tpwgts: Sequence[float] | None = None,
+            tpwgts: Sequence[float] | Sequence[Sequence[float]] | None = None,
+            ubvec: Sequence[float] | None = None,
             recursive: bool | None = None,
             contiguous: bool | None = None,
             options: Options | None = None,
             warn_on_copies: bool = False,
-        ) -> GraphPartition:
+            out: IntSequence | None = None,
+            cache: PartitionCache | None = None,
+            collect_timings: bool = False,
+            max_memory: int | None = None,
+        ) -> GraphPartition | tuple[GraphPartition, MetisTimings]:
     """Return a partition (cutcount, part_vert) into nparts for an input graph.
 
     The input graph is given in either a Pythonic way as the *adjacency* parameter
@@ -509,6 +1629,45 @@ def part_graph(
     each partition. Its entries must sum to a value less than or equal to 1.
 
     (quoted with slight adaptations from the Metis docs)
+
+    To balance several vertex weights (e.g. compute load and memory footprint)
+    at once, pass *vweights* of shape ``(nvtxs, ncon)``, either as a
+    two-dimensional array (which is used without copying if it is
+    C-contiguous and of :func:`zero_copy_dtype`) or as a flat array in the
+    same row-major order. *tpwgts* then has shape ``(nparts, ncon)``, where
+    the weights for each constraint sum to one. *ubvec* of length ``ncon``
+    specifies the allowed load imbalance for each constraint, e.g. ``1.05``
+    for 5%. (By default, this is determined by :attr:`Options.ufactor`.)
+
+    The vertex partition is returned as a :mod:`numpy` array of
+    :func:`zero_copy_dtype` if :mod:`numpy` is available, or as an
+    :class:`array.array` otherwise. If *out* is given, it must be a writable,
+    C-contiguous buffer of :func:`zero_copy_dtype` with one entry per vertex
+    (e.g. a preallocated or memory-mapped array reused across calls). METIS
+    then writes the partition directly into it, and it is returned as
+    :attr:`GraphPartition.vertex_part`.
+
+    If a :class:`~pymetis.cache.PartitionCache` is passed as *cache*, a
+    partition stored for identical inputs is returned (or written to *out*)
+    instead of running METIS, and new partitions are stored.
+
+    If *collect_timings* is *True*, the time METIS spends in each phase is
+    recorded, and ``(partition, timings)`` is returned, where *timings* is a
+    :class:`MetisTimings`. METIS is then always run, even if *cache* holds a
+    partition.
+
+    If *max_memory* is given, METIS may allocate at most that many bytes
+    at any one time (not counting the input and output arrays).
+    :exc:`MemoryError` is raised without running METIS if
+    :func:`estimate_memory` exceeds it, and otherwise once METIS would
+    exceed it, at which point METIS stops and frees what it allocated. This
+    requires the METIS shipped with PyMETIS.
+
+    .. versionchanged:: 2026.1
+
+        Added *ubvec* and support for multiple constraints. Return a
+        :mod:`numpy` array, added *out*, *cache*, *collect_timings* and
+        *max_memory*.
     """
     xadj, adjncy = _prepare_graph(adjacency, xadj, adjncy)
 
@@ -534,40 +1693,121 @@ def part_graph(
     if options.numbering not in [-1, 0]:
         raise ValueError("METIS numbering option must be set to 0 or the default")
 
-    if tpwgts:
-        if len(tpwgts) != nparts:
+    if tpwgts is not None and len(tpwgts) and isinstance(tpwgts[0], Real):
+        # a single constraint
+        flat_tpwgts = cast("Sequence[float]", tpwgts)
+        if len(flat_tpwgts) != nparts:
             raise RuntimeError("The length of tpwgts mismatches `nparts`")
 
-        if __debug__ and any(w < 0.0 for w in tpwgts):
+        if __debug__ and any(w < 0.0 for w in flat_tpwgts):
             raise ValueError("The values of tpwgts should be non-negative")
 
-        total_weights = sum(tpwgts)
+        total_weights = sum(flat_tpwgts)
         if abs(total_weights - 1) > 1e-12:
             warn("tpwghts does not sum to one. PyMetis used to automatically "
                  "fix this, but this behavior is deprecated and will stop "
                  "working in 2027.", DeprecationWarning, stacklevel=2,
              )
-            tpwgts = [w / total_weights for w in tpwgts]
+            tpwgts = [w / total_weights for w in flat_tpwgts]
+
+    key = None
+    if cache is not None:
+        from pymetis.cache import array_from_bytes
 
-    if nparts == 1:
-        # metis has a bug in this case--it disregards the index base
-        return GraphPartition(0, [0] * (len(xadj) - 1))
+        key = cache.key("part_graph", [xadj, adjncy, vweights, vsize, eweights],
+                        [tpwgts, ubvec], options, [nparts, recursive])
+        record = None if collect_timings else cache.get(key)
+        if record is not None:
+            edge_cuts, part = cast("tuple[int, bytes]", record)
+            return GraphPartition(edge_cuts, array_from_bytes(part, out))
+
+    nvtxs = len(xadj) - 1
+    memory_limit = _check_memory(
+        max_memory, "part_graph", nvtxs, xadj[-1] if nvtxs else 0, nparts,
+        _ncon(vweights, nvtxs), recursive=recursive)
 
     from pymetis._internal import part_graph
-    return GraphPartition(*part_graph(nparts, xadj, adjncy, vweights,
-                      vsize, eweights, tpwgts, options, recursive,
-                      warn_on_copies=warn_on_copies,
-                  ))
+    result = part_graph(nparts, xadj, adjncy, vweights,
+                      vsize, eweights, tpwgts, ubvec, options, recursive,
+                      warn_on_copies=warn_on_copies, out=out,
+                      collect_timings=collect_timings,
+                      max_memory=memory_limit,
+                  )
+    timings = None
+    if collect_timings:
+        result, timings = result
+    result = GraphPartition(*result)
+
+    if cache is not None:
+        from pymetis.cache import array_to_bytes
+
+        assert key is not None
+        cache.put(key, (result.edge_cuts, array_to_bytes(result.vertex_part)))
+
+    if timings is not None:
+        return result, MetisTimings(*timings)
+    return result
+
+
+@overload
+def part_mesh(
+            n_parts: int,
+            connectivity: MeshConnectivity,
+            options: Options | None = None,
+            tpwgts: Sequence[float] | None = None,
+            gtype: Literal[GType.NODAL, GType.DUAL] | None = None,
+            ncommon: int = 1,
+            *,
+            n_vertices: int | None = None,
+            element_weights: IntSequence | None = None,
+            element_sizes: IntSequence | None = None,
+            warn_on_copies: bool = False,
+            elem_part_out: IntSequence | None = None,
+            vert_part_out: IntSequence | None = None,
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[False] = False,
+            max_memory: int | None = None,
+        ) -> MeshPartition: ...
+
+@overload
+def part_mesh(
+            n_parts: int,
+            connectivity: MeshConnectivity,
+            options: Options | None = None,
+            tpwgts: Sequence[float] | None = None,
+            gtype: Literal[GType.NODAL, GType.DUAL] | None = None,
+            ncommon: int = 1,
+            *,
+            n_vertices: int | None = None,
+            element_weights: IntSequence | None = None,
+            element_sizes: IntSequence | None = None,
+            warn_on_copies: bool = False,
+            elem_part_out: IntSequence | None = None,
+            vert_part_out: IntSequence | None = None,
+            cache: PartitionCache | None = None,
+            collect_timings: Literal[True],
+            max_memory: int | None = None,
+        ) -> tuple[MeshPartition, MetisTimings]: ...
 
 
 def part_mesh(
             n_parts: int,
-            connectivity: Sequence[IntSequence],
+            connectivity: MeshConnectivity,
             options: Options | None = None,
             tpwgts: Sequence[float] | None = None,
             gtype: Literal[GType.NODAL, GType.DUAL] | None = None,
-            ncommon: int = 1
-        ) -> MeshPartition:
+            ncommon: int = 1,
+            *,
+            n_vertices: int | None = None,
+            element_weights: IntSequence | None = None,
+            element_sizes: IntSequence | None = None,
+            warn_on_copies: bool = False,
+            elem_part_out: IntSequence | None = None,
+            vert_part_out: IntSequence | None = None,
+            cache: PartitionCache | None = None,
+            collect_timings: bool = False,
+            max_memory: int | None = None,
+        ) -> MeshPartition | tuple[MeshPartition, MetisTimings]:
     """This function is used to partition a mesh into *n_parts* parts based on a
     graph partitioning where each vertex is a node in the graph. A mesh is a
     collection of non-overlapping elements which are identified by their vertices.
@@ -588,6 +1828,24 @@ def part_mesh(
     triangles and quads. The ``part_mesh`` method will deduce these vectors based on
     the *connectivity* supplied.
 
+    *connectivity* may also be a two-dimensional integer array of shape
+    ``(n_elements, n_vertices_per_element)``, or a :class:`CSRMesh` holding
+    the flattened vectors directly. If their arrays are of
+    :func:`zero_copy_dtype` and C-contiguous, they are passed to METIS without
+    copying. If *warn_on_copies* is *True*, a warning is issued whenever a
+    copy is made nonetheless.
+
+    *n_vertices* is the number of vertices in the mesh. If not given, it is
+    taken to be one more than the largest vertex index in *connectivity*.
+    Vertex indices outside ``range(n_vertices)`` raise :exc:`ValueError`.
+
+    *element_weights* and *element_sizes* are sequences of length n_elements
+    giving the computational cost and the communication size of each
+    element. By default, all elements weigh the same. See
+    :func:`element_weights_from_arity` for deriving weights from the element
+    types in a mixed mesh. Since METIS's nodal partitioning balances vertex
+    rather than element weights, these require ``gtype = GType.DUAL``.
+
     METIS runtime options can be specified by supplying an :class:`Options`
     object in the input.
 
@@ -607,16 +1865,34 @@ def part_mesh(
     ``edge_cuts`` is the number of cuts to the connectivity graph, ``element_part``
     is an array of length n_elements, with entries identifying the element's
     partition index, and ``vertex_part`` is an array of length n_vertices with
-    entries identifying the vertex's partition index.
+    entries identifying the vertex's partition index. Both are :mod:`numpy`
+    arrays of :func:`zero_copy_dtype` if :mod:`numpy` is available, or
+    :class:`array.array` instances otherwise.
+
+    If *elem_part_out* or *vert_part_out* are given, they must be writable,
+    C-contiguous buffers of :func:`zero_copy_dtype` of length n_elements and
+    n_vertices, respectively. METIS then writes the partition directly into
+    them, and they are returned in place of newly allocated arrays.
+
+    *cache*, *collect_timings* and *max_memory* are as for
+    :func:`part_graph`. The timings do not include the construction of the
+    graph of the mesh, but its memory counts towards *max_memory*. As the
+    size of the graph is not known beforehand, the check against
+    :func:`estimate_memory` takes it to have half as many adjacency entries
+    as *connectivity* has entries, which is fewer than nodal graphs and dual
+    graphs usually have.
+
+    .. versionchanged:: 2026.1
+
+        Return :mod:`numpy` arrays, added *elem_part_out* and *vert_part_out*.
+        Accept two-dimensional arrays and :class:`CSRMesh` as *connectivity*,
+        added *n_vertices*, *element_weights*, *element_sizes*,
+        *warn_on_copies*, *cache*, *collect_timings* and *max_memory*. The
+        number of vertices now defaults to one more than the largest vertex
+        index, rather than the number of distinct vertex indices.
     """
 
-    # Generate flattened connectivity with offsets array, suitable for Metis
-    from itertools import accumulate
-    conn = [it for cell in connectivity for it in cell]
-    conn_offset = [0, *accumulate([len(cell) for cell in connectivity])]
-
-    n_elements = len(connectivity)
-    n_vertex = len(set(conn))
+    conn, eptr, eind, n_vertices = _prepare_mesh(connectivity, n_vertices)
 
     # Handle option validation
     if options is None:
@@ -639,16 +1915,798 @@ def part_mesh(
         tpwgts = [w / total_weights for w in tpwgts]
 
     if gtype is None:
-        from pymetis._internal import GType
         gtype = GType.NODAL
 
-    # Trivial partitioning
-    if n_parts < 2:
-        return MeshPartition(0, [0] * n_elements, [0] * n_vertex)
+    key = None
+    if cache is not None:
+        from pymetis._internal import mesh_csr
+        from pymetis.cache import array_from_bytes
+
+        # hash a canonical form, which ragged lists of elements do not have
+        eptr, eind, n_vertices = mesh_csr(
+            conn, eptr, eind, n_vertices, warn_on_copies=warn_on_copies)
+        conn = None
+
+        key = cache.key(
+            "part_mesh", [eptr, eind, element_weights, element_sizes],
+            [tpwgts], options, [n_parts, n_vertices, int(gtype), ncommon])
+        record = None if collect_timings else cache.get(key)
+        if record is not None:
+            edge_cuts, elem_part, vert_part = cast("tuple[int, bytes, bytes]", record)
+            return MeshPartition(edge_cuts,
+                                 array_from_bytes(elem_part, elem_part_out,
+                                                  "elem_part_out"),
+                                 array_from_bytes(vert_part, vert_part_out,
+                                                  "vert_part_out"))
+
+    memory_limit = 0
+    if max_memory is not None:
+        n_elements, mesh_entries, n_mesh_vertices = _mesh_sizes(
+            conn, eptr, eind, n_vertices)
+        memory_limit = _check_memory(
+            max_memory, "part_mesh",
+            n_mesh_vertices if gtype == GType.NODAL else n_elements,
+            mesh_entries // 2, n_parts, recursive=options.ptype == PType.RB,
+            mesh_entries=mesh_entries)
 
     from pymetis._internal import part_mesh
-    return MeshPartition(*part_mesh(n_parts, conn_offset, conn,
-        tpwgts, gtype, n_elements, n_vertex, ncommon, options))
+    result = part_mesh(n_parts, conn, eptr, eind,
+        n_vertices, tpwgts, element_weights, element_sizes, gtype, ncommon, options,
+        warn_on_copies=warn_on_copies,
+        elem_part_out=elem_part_out, vert_part_out=vert_part_out,
+        collect_timings=collect_timings, max_memory=memory_limit)
+    timings = None
+    if collect_timings:
+        result, timings = result
+    result = MeshPartition(*result)
+
+    if cache is not None:
+        from pymetis.cache import array_to_bytes
+
+        assert key is not None
+        cache.put(key, (result.edge_cuts, array_to_bytes(result.element_part),
+                        array_to_bytes(result.vertex_part)))
+
+    if timings is not None:
+        return result, MetisTimings(*timings)
+    return result
+
+
+def element_weights_from_arity(
+            connectivity: MeshConnectivity,
+            costs: Mapping[int, int],
+            default: int | None = None,
+        ) -> IntSequence:
+    """Return per-element weights for *connectivity* (in any form accepted by
+    :func:`part_mesh`), suitable for passing as *element_weights*. Each
+    element is assigned the weight ``costs[k]``, where *k* is its number of
+    vertices, e.g. ``{4: 1, 6: 2, 8: 6}`` for a mesh of tetrahedra, prisms
+    and hexahedra whose relative computational costs are 1, 2 and 6.
+    Elements whose number of vertices is not in *costs* receive *default*.
+
+    The lookup is done natively. The result is a :mod:`numpy` array of
+    :func:`zero_copy_dtype` if :mod:`numpy` is available, or an
+    :class:`array.array` otherwise.
+
+    :raises ValueError: if an element has no cost and *default* is *None*,
+        or if a cost is negative.
+
+    .. versionadded:: 2026.1
+    """
+    if any(cost < 0 for cost in costs.values()) or (
+            default is not None and default < 0):
+        raise ValueError("element costs must be non-negative")
+    if any(arity < 0 for arity in costs):
+        raise ValueError("element arities must be non-negative")
+
+    table = [-1] * (max(costs, default=-1) + 1)
+    for arity, cost in costs.items():
+        table[arity] = cost
+    if default is not None:
+        table = [default if cost < 0 else cost for cost in table]
+
+    conn, eptr, _eind, _n_vertices = _prepare_mesh(connectivity)
+
+    from pymetis._internal import element_weights_from_arity
+    return element_weights_from_arity(conn, eptr, table,
+                                      -1 if default is None else default)
+
+
+def reorder_for_locality(
+            adjacency: CSRAdjacency | PythonicGraph,
+            part: IntSequence | None = None,
+            *,
+            vweights: IntSequence | Sequence[IntSequence] | None = None,
+            eweights: IntSequence | None = None,
+            permute_graph: bool = False,
+        ) -> LocalityOrdering:
+    """Renumber the vertices of *adjacency* to improve memory locality, using
+    ``METIS_CacheFriendlyReordering``. The vertices of each part in *part*
+    (e.g. a :attr:`GraphPartition.vertex_part`) are numbered contiguously,
+    in order of increasing part number, and in breadth-first order within
+    each part. If *part* is not given, all vertices are taken to be in the
+    same part.
+
+    If *permute_graph* is *True*, the renumbered graph is built natively
+    along with the permutation, as well as the correspondingly permuted
+    *vweights* (which may have shape ``(nvtxs, ncon)``) and *eweights*, if
+    given. The order of neighbors of each vertex is preserved.
+
+    .. versionadded:: 2026.1
+    """
+    csr = to_csr_adjacency(adjacency)
+
+    from pymetis._internal import cache_friendly_reordering
+    result = cache_friendly_reordering(csr.adj_starts, csr.adjacent, part,
+                                       vweights, eweights, permute_graph)
+    if not permute_graph:
+        return LocalityOrdering(*result)
+
+    old2new, new2old, adj_starts, adjacent, new_vweights, new_eweights = result
+    return LocalityOrdering(old2new, new2old,
+                            CSRAdjacency(adj_starts=adj_starts, adjacent=adjacent),
+                            new_vweights, new_eweights)
+
+
+def partition_stats(
+            adjacency: CSRAdjacency | PythonicGraph,
+            part: IntSequence,
+            vweights: IntSequence | Sequence[IntSequence] | None = None,
+            eweights: IntSequence | None = None,
+            vsize: IntSequence | None = None,
+            *,
+            nparts: int | None = None,
+            warn_on_copies: bool = False,
+        ) -> PartitionStats:
+    """Compute quality metrics of the partition *part* of *adjacency*, such as
+    a :attr:`GraphPartition.vertex_part`. *vweights*, *eweights* and *vsize*
+    are as for :func:`part_graph`, and default to one. *nparts* defaults to
+    one more than the largest entry of *part*.
+
+    The metrics are computed natively in a single pass over the graph, which
+    (like *part* and the weights) is used without copying if it is of
+    :func:`zero_copy_dtype`. If *warn_on_copies* is *True*, a warning is
+    issued whenever a copy is made nonetheless. *adjacency* must be
+    symmetric.
+
+    :returns: a :class:`PartitionStats`.
+
+    .. versionadded:: 2026.1
+    """
+    csr = to_csr_adjacency(adjacency)
+
+    from pymetis._internal import partition_stats
+    return PartitionStats(*partition_stats(
+        csr.adj_starts, csr.adjacent, part, vweights, vsize, eweights,
+        -1 if nparts is None else nparts, warn_on_copies=warn_on_copies))
+
+
+def make_contiguous(
+            adjacency: CSRAdjacency | PythonicGraph,
+            part: IntSequence,
+            vweights: IntSequence | Sequence[IntSequence] | None = None,
+            eweights: IntSequence | None = None,
+            *,
+            nparts: int | None = None,
+            out: IntSequence | None = None,
+            warn_on_copies: bool = False,
+        ) -> ContiguousPartition:
+    """Repair the existing partition *part* of *adjacency* so that each part
+    is connected, like :attr:`OptionKey.CONTIG` does during partitioning, but
+    without repartitioning. *vweights*, *eweights*, *nparts* and
+    *warn_on_copies* are as for :func:`partition_stats`.
+
+    The heaviest connected component of each part stays in place. Each other
+    component is moved to the adjacent part it shares the most edge weight
+    with, preferring the part left lightest by the move among those sharing
+    at least half as much. Components that are also connected components of
+    *adjacency* cannot be merged with anything and stay where they are. This
+    takes time linear in the size of the graph.
+
+    If *out* is given, the result is written to it (which may be *part*
+    itself) and it is returned as :attr:`ContiguousPartition.vertex_part`.
+    *adjacency* must be symmetric.
+
+    :returns: a :class:`ContiguousPartition`.
+
+    .. versionadded:: 2026.1
+    """
+    csr = to_csr_adjacency(adjacency)
+
+    from pymetis._internal import make_contiguous
+    return ContiguousPartition(*make_contiguous(
+        csr.adj_starts, csr.adjacent, part, vweights, eweights,
+        -1 if nparts is None else nparts, warn_on_copies=warn_on_copies,
+        out=out))
+
+
+def refine_partition(
+            adjacency: CSRAdjacency | PythonicGraph,
+            initial_part: IntSequence,
+            nparts: int | None = None,
+            *,
+            vweights: IntSequence | Sequence[IntSequence] | None = None,
+            eweights: IntSequence | None = None,
+            tpwgts: Sequence[float] | Sequence[Sequence[float]] | None = None,
+            ubvec: Sequence[float] | None = None,
+            options: Options | None = None,
+            warn_on_copies: bool = False,
+            out: IntSequence | None = None,
+        ) -> GraphPartition:
+    """Improve the existing partition *initial_part* of *adjacency* into
+    *nparts* parts (by default, one more than its largest entry) without
+    partitioning from scratch, e.g. after the graph has changed slightly.
+
+    This runs greedy k-way boundary refinement as in METIS's final
+    refinement phase on the graph itself, skipping coarsening and initial
+    partitioning: boundary vertices are moved to the adjacent part that
+    reduces the edge cut the most while respecting the balance bounds, and
+    vertices of overweight parts are moved to lighter neighbors. Since only
+    boundary vertices move, few vertices change parts, and each pass takes
+    time linear in the size of the graph.
+
+    *vweights*, *eweights*, *tpwgts*, *ubvec*, *warn_on_copies* and *out* are
+    as for :func:`part_graph`; *out* may be *initial_part* itself. Of
+    *options*, :attr:`Options.niter` (the maximum number of passes),
+    :attr:`Options.seed` and :attr:`Options.ufactor` are used.
+    *adjacency* must be symmetric. See :func:`refine_vertex_separator` for
+    vertex separators.
+
+    :returns: a :class:`GraphPartition`.
+
+    .. versionadded:: 2026.1
+    """
+    csr = to_csr_adjacency(adjacency)
+
+    if options is None:
+        options = Options()
+
+    from pymetis._internal import refine_kway
+    return GraphPartition(*refine_kway(
+        csr.adj_starts, csr.adjacent, vweights, eweights, initial_part,
+        -1 if nparts is None else nparts, tpwgts, ubvec, options,
+        warn_on_copies=warn_on_copies, out=out))
+
+
+def repartition(
+            adjacency: CSRAdjacency | PythonicGraph,
+            old_part: IntSequence,
+            nparts: int,
+            vweights: IntSequence | Sequence[IntSequence] | None = None,
+            vsize: IntSequence | None = None,
+            *,
+            eweights: IntSequence | None = None,
+            itr: float = 1000.0,
+            ubvec: Sequence[float] | None = None,
+            options: Options | None = None,
+            warn_on_copies: bool = False,
+        ) -> Repartition:
+    """Compute a balanced partition of *adjacency* into *nparts* parts that
+    trades edge cut against the cost of migrating data from the existing
+    partition *old_part*, in the spirit of ParMETIS's adaptive
+    repartitioning (``ParMETIS_V3_AdaptiveRepart``).
+
+    Two candidates are computed: refining *old_part* with
+    :func:`refine_partition`, which moves few vertices, and a fresh
+    :func:`part_graph` whose part labels are permuted to keep as much of
+    *vsize* in place as possible. The one with the lower cost ``itr *
+    edge_cut + migration_volume`` is returned, where the migration volume is
+    the total *vsize* (by default, one per vertex) of the vertices changing
+    parts. *itr* is the ratio of the cost of communicating one unit of edge
+    weight per iteration to that of migrating one unit of *vsize*, i.e.
+    roughly the number of iterations between repartitionings; small values
+    favor keeping data in place.
+
+    *old_part* must have entries less than *nparts*. *vweights*,
+    *eweights*, *ubvec*, *options* and *warn_on_copies* are as for
+    :func:`part_graph`. *adjacency* must be symmetric.
+
+    :returns: a :class:`Repartition`.
+
+    .. versionadded:: 2026.1
+    """
+    csr = to_csr_adjacency(adjacency)
+
+    if options is None:
+        options = Options()
+
+    from pymetis._internal import remap_partition
+
+    refined_cut, refined = refine_partition(
+        csr, old_part, nparts, vweights=vweights, eweights=eweights,
+        ubvec=ubvec, options=options, warn_on_copies=warn_on_copies)
+    refined, refined_volume = remap_partition(
+        old_part, refined, vsize, nparts, remap=False, out=refined)
+
+    scratch_cut, scratch = part_graph(
+        nparts, csr, vweights=vweights, eweights=eweights, ubvec=ubvec,
+        options=options, warn_on_copies=warn_on_copies)
+    scratch, scratch_volume = remap_partition(
+        old_part, scratch, vsize, nparts, remap=True, out=scratch)
+
+    if itr * scratch_cut + scratch_volume < itr * refined_cut + refined_volume:
+        return Repartition(scratch_cut, scratch, scratch_volume, True)
+    else:
+        return Repartition(refined_cut, refined, refined_volume, False)
+
+
+# {{{ batched partitioning
+
+def _per_item(name: str, value: object, count: int) -> list[Any]:
+    """Return *value*, which is either a single value shared by all batch
+    items or a sequence with one entry per item, as a list of length *count*.
+    """
+    from collections.abc import Sequence as SequenceABC
+
+    if isinstance(value, SequenceABC) and not isinstance(value, str):
+        if len(value) != count:
+            raise ValueError(f"length of '{name}' does not match number of items")
+        return list(value)
+
+    return [value] * count
+
+
+def _per_item_arrays(
+            name: str,
+            value: Sequence[object] | None,
+            count: int,
+        ) -> list[Any]:
+    """Like :func:`_per_item`, but for per-item arrays, which cannot be
+    shared by all items. *None* applies to all items.
+    """
+    if value is None:
+        return [None] * count
+
+    if len(value) != count:
+        raise ValueError(f"length of '{name}' does not match number of items")
+    return list(value)
+
+
+def part_graph_many(
+            nparts: int | Sequence[int],
+            adjacencies: Sequence[CSRAdjacency | PythonicGraph],
+            *,
+            vweights: Sequence[IntSequence | None] | None = None,
+            vsize: Sequence[IntSequence | None] | None = None,
+            eweights: Sequence[IntSequence | None] | None = None,
+            tpwgts: Sequence[Sequence[float] | None] | None = None,
+            ubvec: Sequence[Sequence[float] | None] | None = None,
+            recursive: bool | Sequence[bool | None] | None = None,
+            options: Options | Sequence[Options] | None = None,
+            nthreads: int | None = None,
+            warn_on_copies: bool = False,
+        ) -> list[GraphPartition]:
+    """Partition each graph in *adjacencies*, as :func:`part_graph` would.
+
+    Inputs for all graphs are converted and validated up front, after which
+    the METIS calls are distributed across a pool of *nthreads* native
+    threads (by default, one per hardware thread). The global interpreter
+    lock is not held while the pool runs.
+
+    *nparts*, *recursive* and *options* may either be given once for all
+    graphs or as a sequence with one entry per graph. *vweights*, *vsize*,
+    *eweights*, *tpwgts* and *ubvec*, if given, must be sequences with one
+    (possibly *None*) entry per graph. If *recursive* is *None*, recursive bisection
+    is used for graphs with *nparts* at most 8.
+
+    Unlike :func:`part_graph`, *tpwgts* are not rescaled to sum to one.
+
+    :returns: a list of :class:`GraphPartition`, in the order of
+        *adjacencies*.
+
+    .. versionadded:: 2026.1
+    """
+    count = len(adjacencies)
+
+    if options is None:
+        options = Options()
+    options_list = _per_item("options", options, count)
+    for opt in options_list:
+        if opt.numbering not in [-1, 0]:
+            raise ValueError("METIS numbering option must be set to 0 or the default")
+
+    xadjs = []
+    adjncys = []
+    for adjacency in adjacencies:
+        xadj, adjncy = _prepare_graph(adjacency, None, None)
+        xadjs.append(xadj)
+        adjncys.append(adjncy)
+
+    from pymetis._internal import part_graph_many
+    return [
+        GraphPartition(*result)
+        for result in part_graph_many(
+            _per_item("nparts", nparts, count),
+            xadjs, adjncys,
+            _per_item_arrays("vweights", vweights, count),
+            _per_item_arrays("vsize", vsize, count),
+            _per_item_arrays("eweights", eweights, count),
+            _per_item_arrays("tpwgts", tpwgts, count),
+            _per_item_arrays("ubvec", ubvec, count),
+            options_list,
+            _per_item("recursive", recursive, count),
+            nthreads=0 if nthreads is None else nthreads,
+            warn_on_copies=warn_on_copies,
+        )]
+
+
+def part_graph_best_of(
+            nparts: int,
+            adjacency: PythonicGraph | CSRAdjacency,
+            *,
+            trials: int | None = None,
+            seeds: Sequence[int] | None = None,
+            vweights: IntSequence | Sequence[IntSequence] | None = None,
+            vsize: IntSequence | None = None,
+            eweights: IntSequence | None = None,
+            tpwgts: Sequence[float] | Sequence[Sequence[float]] | None = None,
+            ubvec: Sequence[float] | None = None,
+            recursive: bool | None = None,
+            options: Options | None = None,
+            nthreads: int | None = None,
+            warn_on_copies: bool = False,
+        ) -> BestOfPartition:
+    """Partition a graph several times with different random seeds and
+    return the partition with the smallest objective value, i.e. the fewest
+    cut edges or, if *options* select :attr:`ObjType.VOL`, the smallest
+    communication volume.
+
+    Unlike :attr:`Options.ncuts`, which makes METIS run its trials one after
+    the other, the trials are run concurrently on up to *nthreads* native
+    threads (by default, one per hardware thread), all sharing the same
+    read-only copy of the graph.
+
+    The trials use the random seeds *seeds*, if given. Otherwise, *trials*
+    consecutive seeds starting at :attr:`Options.seed` (or zero, if unset)
+    are used. The remaining arguments are as for :func:`part_graph`, except
+    that *tpwgts* are not rescaled to sum to one. Ties are resolved in favor
+    of the earlier trial.
+
+    .. versionadded:: 2026.1
+    """
+    if options is None:
+        options = Options()
+
+    if options.numbering not in [-1, 0]:
+        raise ValueError("METIS numbering option must be set to 0 or the default")
+
+    if seeds is None:
+        if trials is None:
+            raise TypeError("must pass one of 'trials' or 'seeds'")
+
+        base_seed = max(options.seed, 0)
+        seeds = list(range(base_seed, base_seed + trials))
+    else:
+        seeds = list(seeds)
+        if trials is not None and trials != len(seeds):
+            raise ValueError("'trials' does not match the number of 'seeds'")
+
+    if recursive is None:
+        recursive = nparts <= 8
+
+    xadj, adjncy = _prepare_graph(adjacency, None, None)
+
+    from pymetis._internal import part_graph_best_of
+    best_trial, trial_objvals, (edge_cuts, vertex_part) = part_graph_best_of(
+        nparts, xadj, adjncy, vweights, vsize, eweights, tpwgts, ubvec,
+        options, recursive, seeds,
+        nthreads=0 if nthreads is None else nthreads,
+        warn_on_copies=warn_on_copies)
+
+    return BestOfPartition(
+        edge_cuts=edge_cuts,
+        vertex_part=vertex_part,
+        best_trial=best_trial,
+        trial_objvals=trial_objvals,
+        seeds=seeds)
+
+
+def part_mesh_many(
+            n_parts: int | Sequence[int],
+            meshes: Sequence[MeshConnectivity],
+            *,
+            n_vertices: int | Sequence[int | None] | None = None,
+            tpwgts: Sequence[Sequence[float] | None] | None = None,
+            element_weights: Sequence[IntSequence | None] | None = None,
+            element_sizes: Sequence[IntSequence | None] | None = None,
+            gtype: GType | Sequence[GType] | None = None,
+            ncommon: int | Sequence[int] = 1,
+            options: Options | Sequence[Options] | None = None,
+            nthreads: int | None = None,
+            warn_on_copies: bool = False,
+        ) -> list[MeshPartition]:
+    """Partition each mesh connectivity in *meshes*, as :func:`part_mesh`
+    would.
+
+    As with :func:`part_graph_many`, all inputs are converted and validated
+    up front, and the METIS calls are then run on a pool of *nthreads* native
+    threads. *n_parts*, *gtype*, *ncommon* and *options* may be given once or
+    per mesh, *tpwgts*, *element_weights* and *element_sizes* must be given
+    per mesh, if at all. *n_vertices* may be
+    given once or per mesh, and defaults to one more than the largest vertex
+    index of each mesh. Each entry of *meshes* may be given in any form
+    accepted by :func:`part_mesh`.
+
+    :returns: a list of :class:`MeshPartition`, in the order of *meshes*.
+
+    .. versionadded:: 2026.1
+    """
+    count = len(meshes)
+
+    if options is None:
+        options = Options()
+    options_list = _per_item("options", options, count)
+    for opt in options_list:
+        if opt.numbering not in [-1, 0]:
+            raise ValueError("METIS numbering option must be set to 0 or the default")
+
+    if gtype is None:
+        gtype = GType.NODAL
+
+    prepared = [
+        _prepare_mesh(mesh, nv)
+        for mesh, nv in zip(
+            meshes, _per_item("n_vertices", n_vertices, count), strict=True)]
+
+    from pymetis._internal import part_mesh_many
+    return [
+        MeshPartition(*result)
+        for result in part_mesh_many(
+            _per_item("n_parts", n_parts, count),
+            [conn for conn, _, _, _ in prepared],
+            [eptr for _, eptr, _, _ in prepared],
+            [eind for _, _, eind, _ in prepared],
+            [nv for _, _, _, nv in prepared],
+            _per_item_arrays("tpwgts", tpwgts, count),
+            _per_item_arrays("element_weights", element_weights, count),
+            _per_item_arrays("element_sizes", element_sizes, count),
+            _per_item("gtype", gtype, count),
+            _per_item("ncommon", ncommon, count),
+            options_list,
+            nthreads=0 if nthreads is None else nthreads,
+            warn_on_copies=warn_on_copies,
+        )]
+
+# }}}
+
+
+# {{{ graph and mesh files
+
+# magic, format version, idx_t width in bytes, little endian?, section
+# alignment, nvtxs, nedges, ncon (zero if no vertex weights), flags
+_GRAPH_MAGIC = b"PYMETISG"
+_GRAPH_FORMAT_VERSION = 1
+_GRAPH_HEADER = "<8sIBBHQQII"
+_GRAPH_ALIGNMENT = 64
+_GRAPH_HAS_EWEIGHTS = 1
+_GRAPH_HAS_VSIZE = 2
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _GRAPH_ALIGNMENT) * _GRAPH_ALIGNMENT
+
+
+def save_graph(
+            path: str | os.PathLike[str],
+            adjacency: CSRAdjacency | PythonicGraph,
+            vweights: IntSequence | Sequence[IntSequence] | None = None,
+            eweights: IntSequence | None = None,
+            vsize: IntSequence | None = None,
+        ) -> None:
+    """Write *adjacency* and its weights (as for :func:`part_graph`) to the
+    file *path* in a simple binary format, to be read back by
+    :func:`load_graph`.
+
+    The file consists of a 40-byte header recording the sizes, the width
+    and byte order of ``idx_t`` and which weights are present, followed by
+    the arrays ``adj_starts``, ``adjacent``, *vweights*, *eweights* and
+    *vsize* (if present), each stored as ``idx_t`` starting at an offset
+    that is a multiple of 64 bytes. Arrays are written directly from their
+    buffers if they are of :func:`zero_copy_dtype`, and converted otherwise.
+
+    Requires :mod:`numpy`.
+
+    .. versionadded:: 2026.1
+    """
+    import struct
+    import sys
+
+    import numpy as np
+
+    csr = to_csr_adjacency(adjacency)
+    dtype = zero_copy_dtype()
+
+    xadj = np.ascontiguousarray(csr.adj_starts, dtype=dtype)
+    if len(xadj) == 0:
+        raise ValueError("adj_starts cannot be empty")
+    nvtxs = len(xadj) - 1
+    nedges = int(xadj[-1])
+    adjncy = np.ascontiguousarray(csr.adjacent, dtype=dtype)[:nedges]
+    if len(adjncy) != nedges:
+        raise ValueError("adjacent is shorter than indicated by adj_starts")
+
+    sections: list[np.ndarray] = [xadj, adjncy]
+
+    ncon = 0
+    if vweights is not None:
+        vwgt: np.ndarray = np.ascontiguousarray(vweights, dtype=dtype)
+        ncon = vwgt.shape[1] if vwgt.ndim == 2 else 1
+        if vwgt.ndim > 2 or vwgt.size != nvtxs * ncon:
+            raise ValueError(
+                "vweights must have shape (nvtxs,) or (nvtxs, ncon)")
+        sections.append(vwgt)
+
+    flags = 0
+    for flag, name, ary, length in [
+            (_GRAPH_HAS_EWEIGHTS, "eweights", eweights, nedges),
+            (_GRAPH_HAS_VSIZE, "vsize", vsize, nvtxs)]:
+        if ary is not None:
+            ary = np.ascontiguousarray(ary, dtype=dtype)
+            if ary.shape != (length,):
+                raise ValueError(f"{name} must have length {length}")
+            flags |= flag
+            sections.append(ary)
+
+    header = struct.pack(
+        _GRAPH_HEADER, _GRAPH_MAGIC, _GRAPH_FORMAT_VERSION, dtype.itemsize,
+        sys.byteorder == "little", _GRAPH_ALIGNMENT, nvtxs, nedges, ncon, flags)
+
+    with open(path, "wb") as outf:
+        outf.write(header)
+        offset = len(header)
+        for ary in sections:
+            padding = _aligned(offset) - offset
+            outf.write(b"\0" * padding)
+            outf.write(ary.data.cast("B"))
+            offset += padding + ary.nbytes
+
+
+def load_graph(
+            path: str | os.PathLike[str],
+            mmap: bool = True,
+        ) -> WeightedGraph:
+    """Read a graph written by :func:`save_graph`.
+
+    If *mmap* is *True*, the arrays are memory-mapped (copy-on-write, so that
+    the file is never modified) rather than read. If the file was written
+    with the ``idx_t`` of this build of METIS, they can then be passed to
+    :func:`part_graph` and the other functions without copying, and only
+    those parts of the file are read from disk that METIS accesses.
+    Otherwise, they are converted to :func:`zero_copy_dtype`.
+
+    Requires :mod:`numpy`.
+
+    :returns: a :class:`WeightedGraph`.
+
+    .. versionadded:: 2026.1
+    """
+    import struct
+
+    import numpy as np
+
+    header_size = struct.calcsize(_GRAPH_HEADER)
+    with open(path, "rb") as inf:
+        header = inf.read(header_size)
+
+    if len(header) != header_size or not header.startswith(_GRAPH_MAGIC):
+        raise ValueError(f"'{path}' is not a PyMETIS graph file")
+
+    (_magic, version, width, little_endian, alignment,
+     nvtxs, nedges, ncon, flags) = struct.unpack(_GRAPH_HEADER, header)
+    if version != _GRAPH_FORMAT_VERSION:
+        raise ValueError(
+            f"'{path}' has unsupported graph file format version {version}")
+    if width not in (4, 8) or alignment == 0:
+        raise ValueError(f"'{path}' is not a PyMETIS graph file")
+
+    file_dtype = np.dtype(f"{'<' if little_endian else '>'}i{width}")
+
+    offset = header_size
+
+    def read_section(count: int) -> np.ndarray:
+        nonlocal offset
+        offset = -(-offset // alignment) * alignment
+        if count == 0:
+            ary = np.empty(0, dtype=file_dtype)
+        elif mmap:
+            ary = np.memmap(path, dtype=file_dtype, mode="c",
+                            offset=offset, shape=(count,))
+        else:
+            ary = np.fromfile(path, dtype=file_dtype, count=count, offset=offset)
+            if len(ary) != count:
+                raise ValueError(f"'{path}' is truncated")
+        offset += count * width
+
+        if ary.dtype != zero_copy_dtype():
+            ary = ary.astype(zero_copy_dtype())
+        return ary
+
+    xadj = read_section(nvtxs + 1)
+    adjncy = read_section(nedges)
+    vweights = eweights = vsize = None
+    if ncon:
+        vweights = read_section(nvtxs * ncon)
+        if ncon > 1:
+            vweights = vweights.reshape(nvtxs, ncon)
+    if flags & _GRAPH_HAS_EWEIGHTS:
+        eweights = read_section(nedges)
+    if flags & _GRAPH_HAS_VSIZE:
+        vsize = read_section(nvtxs)
+
+    return WeightedGraph(CSRAdjacency(xadj, adjncy), vweights, eweights, vsize)
+
+
+def read_graph(path: str | os.PathLike[str]) -> WeightedGraph:
+    """Read a graph in the text format of the METIS programs such as
+    ``gpmetis`` (see the METIS manual), including vertex sizes, vertex
+    weights for any number of constraints and edge weights, as given by its
+    ``fmt`` and ``ncon`` header fields. Vertex numbers in the file start at
+    one.
+
+    The file is parsed natively, without the GIL, directly into arrays of
+    :func:`zero_copy_dtype`.
+
+    :raises ValueError: with the file name and line number if the file is
+        malformed.
+    :returns: a :class:`WeightedGraph`.
+
+    .. versionadded:: 2026.1
+    """
+    import os
+
+    from pymetis._internal import read_graph
+    xadj, adjncy, vweights, eweights, vsize = read_graph(os.fspath(path))
+    return WeightedGraph(CSRAdjacency(xadj, adjncy), vweights, eweights, vsize)
+
+
+def read_mesh(path: str | os.PathLike[str]) -> WeightedMesh:
+    """Read a mesh in the text format of ``mpmetis``: a header line with the
+    number of elements (and optionally the number of element weights per
+    element) followed by one line per element listing its weights and
+    vertices. Vertex numbers in the file start at one. The number of
+    vertices is one more than the largest vertex index.
+
+    The file is parsed natively, without the GIL.
+
+    :raises ValueError: with the file name and line number if the file is
+        malformed.
+    :returns: a :class:`WeightedMesh`.
+
+    .. versionadded:: 2026.1
+    """
+    import os
+
+    from pymetis._internal import read_mesh
+    eptr, eind, element_weights, n_vertices = read_mesh(os.fspath(path))
+    return WeightedMesh(Mesh(CSRMesh(eptr, eind), n_vertices), element_weights)
+
+
+def write_partition(path: str | os.PathLike[str], part: IntSequence) -> None:
+    """Write *part*, e.g. a :attr:`GraphPartition.vertex_part` or
+    :attr:`MeshPartition.element_part`, to *path* with one entry per line,
+    as ``gpmetis`` and ``mpmetis`` do. The file is written natively.
+
+    .. versionadded:: 2026.1
+    """
+    import os
+
+    from pymetis._internal import write_index_file
+    write_index_file(os.fspath(path), part)
+
+
+def write_permutation(path: str | os.PathLike[str], perm: IntSequence) -> None:
+    """Write the permutation *perm* to *path* with one entry per line. Note
+    that ``ndmetis`` writes the *iperm* returned by
+    :func:`nested_dissection`. The file is written natively.
+
+    .. versionadded:: 2026.1
+    """
+    import os
+
+    from pymetis._internal import write_index_file
+    write_index_file(os.fspath(path), perm)
+
+# }}}
 
 
 def zero_copy_dtype() -> np.dtype[np.integer]:
@@ -669,24 +2727,58 @@ def zero_copy_dtype() -> np.dtype[np.integer]:
 
 
 __all__ = [
+    "BestOfPartition",
     "CType",
+    "ContiguousPartition",
     "DebugLevel",
     "GType",
     "GraphPartition",
     "IPType",
+    "LocalityOrdering",
+    "Mesh",
     "MeshPartition",
+    "MetisTimings",
     "OPType",
     "ObjType",
     "OptionKey",
     "Options",
+    "OrderingStats",
     "PType",
+    "PartitionStats",
     "RType",
+    "Repartition",
+    "SeparatorTreeOrdering",
+    "SymbolicAnalysis",
+    "VertexSeparator",
+    "WeightedGraph",
+    "WeightedMesh",
+    "compute_vertex_separator",
+    "element_weights_from_arity",
+    "estimate_memory",
+    "load_graph",
+    "make_contiguous",
     "nested_dissection",
+    "ordering_stats",
     "part_graph",
+    "part_graph_best_of",
+    "part_graph_many",
     "part_mesh",
+    "part_mesh_many",
+    "partition_stats",
+    "read_graph",
+    "read_mesh",
+    "refine_partition",
+    "refine_vertex_separator",
+    "reorder_for_locality",
+    "repartition",
+    "save_graph",
+    "symbolic_analysis",
+    "to_csr_adjacency",
     "verify_nd",
     "version",
     "version_tuple",
+    "write_partition",
+    "write_permutation",
     "zero_copy_dtype",
 ]
 
@@ -0,0 +1,474 @@
+"""
+Command-line driver
+-------------------
+
+``python -m pymetis`` (also installed as the ``pymetis`` command) partitions
+graphs and meshes stored in files, much like the ``gpmetis``, ``mpmetis``
+and ``ndmetis`` programs that come with METIS::
+
+    pymetis part-graph GRAPHFILE NPARTS
+    pymetis part-mesh MESHFILE NPARTS
+    pymetis nd GRAPHFILE
+
+Graphs may be in the text format read by :func:`pymetis.read_graph` or in
+the binary format written by :func:`pymetis.save_graph` (which is
+memory-mapped unless ``--no-mmap`` is given), meshes in the format read by
+:func:`pymetis.read_mesh`. Results are written as by
+:func:`pymetis.write_partition` and :func:`pymetis.write_permutation` to
+the files the METIS programs use (such as ``GRAPHFILE.part.NPARTS``),
+unless ``--nooutput`` is given.
+
+Every :class:`pymetis.OptionKey` is accepted as a flag, e.g. ``--ufactor
+50`` or ``--ptype rb``, with enumerated values given by name.
+
+The time spent reading the input, converting it for METIS, in METIS and
+writing the output is reported separately, along with quality metrics of
+the result (see :func:`pymetis.partition_stats` and
+:func:`pymetis.ordering_stats`). With ``--repeat N``, METIS is run *N* times
+on the same input, and the fastest and median times are reported. With
+``--json``, the report is printed as a JSON object.
+
+.. autofunction:: main
+
+.. versionadded:: 2026.1
+"""
+
+from __future__ import annotations
+
+
+__copyright__ = "Copyright (C) 2026 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager, suppress
+from statistics import median
+from typing import TYPE_CHECKING, Any
+
+import pymetis
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Sequence
+
+
+# {{{ options
+
+# options taking the name of a member of an enumeration
+_ENUM_OPTIONS = {
+    "ptype": pymetis.PType,
+    "objtype": pymetis.ObjType,
+    "ctype": pymetis.CType,
+    "iptype": pymetis.IPType,
+    "rtype": pymetis.RType,
+}
+
+# options that are switched on by a flag without a value, as in gpmetis
+_FLAG_OPTIONS = {"no2hop", "minconn", "contig", "compress", "ccorder"}
+
+# options that are not stored in Options, but handled by the driver
+_DRIVER_OPTIONS = {"help", "tpwgts", "ubvec", "gtype", "ncommon", "nooutput"}
+
+
+def _enum_names(enum: type) -> list[str]:
+    return sorted(name.lower() for name in dir(enum) if name.isupper())
+
+
+def _enum_value(enum: type) -> Callable[[str], int]:
+    def convert(text: str) -> int:
+        try:
+            return int(text)
+        except ValueError:
+            pass
+        try:
+            return int(getattr(enum, text.upper()))
+        except AttributeError:
+            raise argparse.ArgumentTypeError(
+                f"invalid choice: '{text}' "
+                f"(choose from {', '.join(_enum_names(enum))})") from None
+
+    return convert
+
+
+def _debug_level(text: str) -> int:
+    convert = _enum_value(pymetis.DebugLevel)
+    result = 0
+    for name in text.split(","):
+        result |= convert(name)
+    return result
+
+
+def _float_list(text: str) -> list[float]:
+    try:
+        return [float(w) for w in text.split(",")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"expected comma-separated numbers, got '{text}'") from None
+
+
+def _option_names() -> list[str]:
+    return sorted(
+        (name.lower() for name in dir(pymetis.OptionKey) if name.isupper()),
+        key=lambda name: int(getattr(pymetis.OptionKey, name.upper())))
+
+
+def _add_option_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group(
+        "METIS options", "See the METIS manual. Omitted options take the "
+        "METIS default.")
+
+    for name in _option_names():
+        if name in _DRIVER_OPTIONS:
+            continue
+
+        flag = f"--{name}"
+        if name in _ENUM_OPTIONS:
+            enum = _ENUM_OPTIONS[name]
+            group.add_argument(flag, type=_enum_value(enum), metavar="NAME",
+                               help=f"one of {', '.join(_enum_names(enum))}")
+        elif name == "dbglvl":
+            group.add_argument(flag, type=_debug_level, metavar="NAMES",
+                               help="comma-separated names of DebugLevel "
+                               "members, or an integer")
+        elif name in _FLAG_OPTIONS:
+            group.add_argument(flag, action="store_const", const=1)
+        else:
+            group.add_argument(flag, type=int, metavar="INT")
+
+    group.add_argument("--tpwgts", type=_float_list, metavar="W,W,...",
+                       help="target weight of each part (for each constraint)")
+    group.add_argument("--nooutput", action="store_true",
+                       help="do not write the result")
+
+
+def _options_from_args(args: argparse.Namespace) -> pymetis.Options:
+    return pymetis.Options(**{
+        name: getattr(args, name) for name in _option_names()
+        if name not in _DRIVER_OPTIONS and getattr(args, name) is not None})
+
+# }}}
+
+
+# {{{ timing
+
+class _Timings:
+    def __init__(self) -> None:
+        self.phases: dict[str, list[float]] = {}
+
+    @contextmanager
+    def __call__(self, phase: str) -> Generator[None, None, None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.setdefault(phase, []).append(time.perf_counter() - start)
+
+    def report(self) -> dict[str, dict[str, float | int]]:
+        return {
+            phase: {"total": sum(times), "min": min(times),
+                    "median": median(times), "count": len(times)}
+            for phase, times in self.phases.items()}
+
+# }}}
+
+
+# {{{ input
+
+def _is_binary_graph(path: str) -> bool:
+    with open(path, "rb") as inf:
+        return inf.read(8) == b"PYMETISG"
+
+
+def _read_graph(args: argparse.Namespace) -> pymetis.WeightedGraph:
+    if _is_binary_graph(args.graph_file):
+        return pymetis.load_graph(args.graph_file, mmap=not args.no_mmap)
+    return pymetis.read_graph(args.graph_file)
+
+
+def _convert(ary: Any) -> Any:
+    """Return *ary* as a C-contiguous array of
+    :func:`~pymetis.zero_copy_dtype`, so that the time spent converting is
+    not counted as time spent in METIS.
+    """
+    if ary is None:
+        return None
+    try:
+        import numpy as np
+    except ImportError:
+        return ary
+    return np.ascontiguousarray(ary, dtype=pymetis.zero_copy_dtype())
+
+
+def _convert_graph(graph: pymetis.WeightedGraph) -> pymetis.WeightedGraph:
+    csr = pymetis.to_csr_adjacency(graph.adjacency)
+    return pymetis.WeightedGraph(
+        pymetis.CSRAdjacency(_convert(csr.adj_starts), _convert(csr.adjacent)),
+        _convert(graph.vweights), _convert(graph.eweights), _convert(graph.vsize))
+
+# }}}
+
+
+# {{{ subcommands
+
+def _repeat(args: argparse.Namespace, timings: _Timings,
+            func: Callable[[], Any]) -> Any:
+    result = None
+    for _ in range(args.repeat):
+        with timings("metis"):
+            result = func()
+    return result
+
+
+def _part_graph(args: argparse.Namespace, timings: _Timings) -> dict[str, Any]:
+    with timings("input"):
+        graph = _read_graph(args)
+    with timings("conversion"):
+        graph = _convert_graph(graph)
+        options = _options_from_args(args)
+
+    # multiple constraints give two-dimensional vertex weights
+    shape = getattr(graph.vweights, "shape", ())
+    ncon = shape[1] if len(shape) == 2 else 1
+    flat_tpwgts: list[float] | None = args.tpwgts
+    tpwgts: list[float] | list[list[float]] | None = flat_tpwgts
+    if flat_tpwgts is not None and ncon > 1:
+        tpwgts = [flat_tpwgts[i:i + ncon]
+                  for i in range(0, len(flat_tpwgts), ncon)]
+
+    result = _repeat(args, timings, lambda: pymetis.part_graph(
+        args.nparts, graph.adjacency,
+        vweights=graph.vweights, vsize=graph.vsize, eweights=graph.eweights,
+        tpwgts=tpwgts, ubvec=args.ubvec,
+        recursive=options.ptype == pymetis.PType.RB,
+        options=options))
+
+    with timings("metrics"):
+        stats = pymetis.partition_stats(
+            graph.adjacency, result.vertex_part,
+            graph.vweights, graph.eweights, graph.vsize, nparts=args.nparts)
+
+    if not args.nooutput:
+        output = args.output or f"{args.graph_file}.part.{args.nparts}"
+        with timings("output"):
+            pymetis.write_partition(output, result.vertex_part)
+
+    return {
+        "vertices": len(graph.adjacency.adj_starts) - 1,
+        "edges": len(graph.adjacency.adjacent) // 2,
+        "parts": args.nparts,
+        "objective": result.edge_cuts,
+        **_partition_metrics(stats),
+        }
+
+
+def _part_mesh(args: argparse.Namespace, timings: _Timings) -> dict[str, Any]:
+    with timings("input"):
+        weighted_mesh = pymetis.read_mesh(args.mesh_file)
+    with timings("conversion"):
+        mesh = weighted_mesh.mesh
+        element_weights = _convert(weighted_mesh.element_weights)
+        options = _options_from_args(args)
+
+    gtype = pymetis.GType.NODAL if args.gtype == "nodal" else pymetis.GType.DUAL
+    if gtype == pymetis.GType.NODAL:
+        # METIS balances vertex rather than element weights in this case
+        element_weights = None
+
+    result = _repeat(args, timings, lambda: pymetis.part_mesh(
+        args.nparts, mesh, options, args.tpwgts, gtype, args.ncommon,
+        element_weights=element_weights))
+
+    with timings("metrics"):
+        stats = pymetis.partition_stats(
+            mesh.dual_graph(args.ncommon), result.element_part, element_weights,
+            nparts=args.nparts)
+
+    if not args.nooutput:
+        prefix = args.output or args.mesh_file
+        with timings("output"):
+            pymetis.write_partition(
+                f"{prefix}.epart.{args.nparts}", result.element_part)
+            pymetis.write_partition(
+                f"{prefix}.npart.{args.nparts}", result.vertex_part)
+
+    return {
+        "elements": mesh.n_elements,
+        "vertices": mesh.n_vertices,
+        "parts": args.nparts,
+        "objective": result.edge_cuts,
+        **_partition_metrics(stats),
+        }
+
+
+def _nested_dissection(
+            args: argparse.Namespace, timings: _Timings) -> dict[str, Any]:
+    with timings("input"):
+        graph = _read_graph(args)
+    with timings("conversion"):
+        graph = _convert_graph(graph)
+        options = _options_from_args(args)
+
+    perm, iperm = _repeat(args, timings, lambda: pymetis.nested_dissection(
+        graph.adjacency, vweights=graph.vweights, options=options))
+
+    with timings("metrics"):
+        stats = pymetis.ordering_stats(graph.adjacency, perm, iperm)
+
+    if not args.nooutput:
+        output = args.output or f"{args.graph_file}.iperm"
+        with timings("output"):
+            pymetis.write_permutation(output, iperm)
+
+    return {
+        "vertices": len(graph.adjacency.adj_starts) - 1,
+        "edges": len(graph.adjacency.adjacent) // 2,
+        **stats._asdict(),
+        }
+
+
+def _partition_metrics(stats: pymetis.PartitionStats) -> dict[str, Any]:
+    return {
+        "edge_cut": stats.edge_cut,
+        "total_comm_volume": stats.total_comm_volume,
+        "max_comm_volume": stats.max_comm_volume,
+        "imbalance": [float(x) for x in stats.imbalance],
+        "empty_parts": sum(1 for c in stats.components if c == 0),
+        "disconnected_parts": sum(1 for c in stats.components if c > 1),
+        }
+
+# }}}
+
+
+# {{{ argument parsing
+
+def _make_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pymetis",
+        description="Partition graphs and meshes and order sparse matrices "
+        "with METIS.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(sub: argparse.ArgumentParser) -> None:
+        sub.add_argument("-o", "--output", metavar="PATH",
+                         help="where to write the result (instead of the "
+                         "file name used by the METIS programs)")
+        sub.add_argument("--repeat", type=int, default=1, metavar="N",
+                         help="run METIS N times, e.g. for benchmarking")
+        sub.add_argument("--json", action="store_true",
+                         help="print the report as JSON")
+        _add_option_arguments(sub)
+
+    part_graph = subparsers.add_parser(
+        "part-graph", help="partition a graph, like gpmetis")
+    part_graph.add_argument("graph_file")
+    part_graph.add_argument("nparts", type=int)
+    part_graph.add_argument("--ubvec", type=_float_list, metavar="U,U,...",
+                            help="allowed imbalance of each constraint")
+    part_graph.add_argument("--no-mmap", action="store_true",
+                            help="read binary graph files instead of "
+                            "memory-mapping them")
+    part_graph.set_defaults(func=_part_graph)
+    add_common(part_graph)
+
+    part_mesh = subparsers.add_parser(
+        "part-mesh", help="partition a mesh, like mpmetis")
+    part_mesh.add_argument("mesh_file")
+    part_mesh.add_argument("nparts", type=int)
+    part_mesh.add_argument("--gtype", choices=["dual", "nodal"], default="dual",
+                           help="partition the dual or nodal graph "
+                           "(default: dual)")
+    part_mesh.add_argument("--ncommon", type=int, default=1, metavar="INT",
+                           help="number of vertices shared by adjacent "
+                           "elements of the dual graph")
+    part_mesh.set_defaults(func=_part_mesh)
+    add_common(part_mesh)
+
+    nd = subparsers.add_parser(
+        "nd", help="compute a fill-reducing ordering, like ndmetis")
+    nd.add_argument("graph_file")
+    nd.add_argument("--no-mmap", action="store_true",
+                    help="read binary graph files instead of memory-mapping them")
+    nd.set_defaults(func=_nested_dissection)
+    add_common(nd)
+
+    return parser
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    print(f"{report['command']}: {report['file']}")
+    for name, value in report["quality"].items():
+        if isinstance(value, list):
+            value = " ".join(f"{x:.3f}" for x in value)
+        print(f"  {name:<20} {value}")
+
+    print("timings (s):")
+    for phase, t in report["timings"].items():
+        if t["count"] > 1:
+            print(f"  {phase:<20} {t['median']:.6f} "
+                  f"(min {t['min']:.6f}, {t['count']} runs)")
+        else:
+            print(f"  {phase:<20} {t['total']:.6f}")
+
+# }}}
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command-line driver with the arguments *argv*, which default
+    to :data:`sys.argv`, and return the exit status.
+    """
+    parser = _make_parser()
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be positive")
+
+    # keep the one-time cost of importing numpy out of the timings
+    with suppress(ImportError):
+        import numpy  # ruff:ignore[unused-import]
+
+    timings = _Timings()
+    try:
+        quality = args.func(args, timings)
+    except (OSError, ValueError, RuntimeError) as e:
+        print(f"pymetis: error: {e}", file=sys.stderr)
+        return 1
+
+    report = {
+        "command": args.command,
+        "file": getattr(args, "graph_file", None) or args.mesh_file,
+        "quality": quality,
+        "timings": timings.report(),
+        }
+    if args.json:
+        import json
+        print(json.dumps(report, indent=2))
+    else:
+        _print_report(report)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
+
+# vim: foldmethod=marker
@@ -1,4 +1,9 @@
+from collections.abc import Sequence
 from enum import IntEnum, auto
+from typing import Any, TypeAlias
+
+# numpy.ndarray if numpy is available, else array.array
+_IntArray: TypeAlias = Any
 
 class GType(IntEnum):
     NODAL = auto()
@@ -8,5 +13,183 @@ class Options:
     def __init__(self) -> None: ...
     def _get(self, idx: int, /) -> int: ...
     def _set(self, idx: int, value: int, /) -> None: ...
+    @staticmethod
+    def _len() -> int: ...
+    def set_defaults(self) -> None: ...
 
 def _idx_type_width() -> int: ...
+
+def part_graph_many(
+    nparts: Sequence[int],
+    xadjs: Sequence[Any],
+    adjncys: Sequence[Any],
+    vwgts: Sequence[Any],
+    vsizes: Sequence[Any],
+    adjwgts: Sequence[Any],
+    tpwgts: Sequence[Any],
+    ubvecs: Sequence[Any],
+    options: Sequence[Options],
+    recursive: Sequence[bool | None],
+    nthreads: int,
+    warn_on_copies: bool = False,
+) -> list[tuple[int, _IntArray]]: ...
+def part_mesh_many(
+    nparts: Sequence[int],
+    connectivities: Sequence[Any],
+    eptrs: Sequence[Any],
+    einds: Sequence[Any],
+    n_vertices: Sequence[int | None],
+    tpwgts: Sequence[Any],
+    element_weights: Sequence[Any],
+    element_sizes: Sequence[Any],
+    gtypes: Sequence[int],
+    ncommons: Sequence[int],
+    options: Sequence[Options],
+    nthreads: int,
+    warn_on_copies: bool = False,
+) -> list[tuple[int, _IntArray, _IntArray]]: ...
+def part_graph_best_of(
+    nparts: int,
+    xadj: Any,
+    adjncy: Any,
+    vwgt: Any,
+    vsize: Any,
+    adjwgt: Any,
+    tpwgts: Any,
+    ubvec: Any,
+    options: Options,
+    recursive: bool,
+    seeds: Sequence[int],
+    nthreads: int,
+    warn_on_copies: bool = False,
+) -> tuple[int, list[int], tuple[int, _IntArray]]: ...
+def csr_from_adjacency(adjacency: Any) -> tuple[_IntArray, _IntArray]: ...
+def element_weights_from_arity(
+    connectivity: Any,
+    eptr: Any,
+    costs: Any,
+    default_cost: int,
+) -> _IntArray: ...
+def mesh_csr(
+    connectivity: Any,
+    eptr: Any,
+    eind: Any,
+    n_vertices: int | None,
+    warn_on_copies: bool = False,
+) -> tuple[_IntArray, _IntArray, int]: ...
+def mesh_to_graph(
+    eptr: Any,
+    eind: Any,
+    nn: int,
+    dual: bool,
+    ncommon: int,
+    warn_on_copies: bool = False,
+) -> tuple[_IntArray, _IntArray]: ...
+def compute_vertex_separator(
+    xadj: Any,
+    adjncy: Any,
+    vwgt: Any,
+    options: Options,
+    out: Any = None,
+) -> tuple[int, _IntArray]: ...
+def node_ndp(
+    xadj: Any,
+    adjncy: Any,
+    vwgt: Any,
+    npes: int,
+    options: Options,
+    perm_out: Any = None,
+    iperm_out: Any = None,
+    return_stats: bool = False,
+    collect_timings: bool = False,
+    max_memory: int = 0,
+) -> tuple[Any, ...]: ...
+def ordering_stats(
+    xadj: Any,
+    adjncy: Any,
+    perm: Any,
+    iperm: Any,
+) -> tuple[int, int, int, int]: ...
+def symbolic_analysis(
+    xadj: Any,
+    adjncy: Any,
+    perm: Any,
+    iperm: Any,
+) -> tuple[_IntArray, _IntArray, _IntArray, _IntArray]: ...
+def cache_friendly_reordering(
+    xadj: Any,
+    adjncy: Any,
+    part: Any,
+    vwgt: Any,
+    adjwgt: Any,
+    permute_graph: bool,
+) -> tuple[Any, ...]: ...
+def partition_stats(
+    xadj: Any,
+    adjncy: Any,
+    part: Any,
+    vwgt: Any,
+    vsize: Any,
+    adjwgt: Any,
+    nparts: int,
+    warn_on_copies: bool = False,
+) -> tuple[
+    int, int, int, _IntArray, _IntArray, _IntArray, _IntArray, _IntArray, _IntArray
+]: ...
+def make_contiguous(
+    xadj: Any,
+    adjncy: Any,
+    part: Any,
+    vwgt: Any,
+    adjwgt: Any,
+    nparts: int,
+    warn_on_copies: bool = False,
+    out: Any = None,
+) -> tuple[_IntArray, int]: ...
+def node_refine(
+    xadj: Any,
+    adjncy: Any,
+    vwgt: Any,
+    part: Any,
+    ubfactor: float,
+    out: Any = None,
+) -> tuple[int, _IntArray]: ...
+def refine_kway(
+    xadj: Any,
+    adjncy: Any,
+    vwgt: Any,
+    adjwgt: Any,
+    part: Any,
+    nparts: int,
+    tpwgts: Any,
+    ubvec: Any,
+    options: Options,
+    warn_on_copies: bool = False,
+    out: Any = None,
+) -> tuple[int, _IntArray]: ...
+def remap_partition(
+    old_part: Any,
+    new_part: Any,
+    vsize: Any,
+    nparts: int,
+    remap: bool,
+    out: Any = None,
+) -> tuple[_IntArray, int]: ...
+def hash_array(array: Any, real: bool = False) -> int: ...
+def metis_version() -> tuple[int, int, int]: ...
+def read_graph(
+    filename: str,
+) -> tuple[
+    _IntArray, _IntArray, _IntArray | None, _IntArray | None, _IntArray | None
+]: ...
+def read_mesh(filename: str) -> tuple[_IntArray, _IntArray, _IntArray | None, int]: ...
+def write_index_file(filename: str, values: Any) -> None: ...
+def grid_graph(nx: int, ny: int, nz: int) -> tuple[_IntArray, _IntArray]: ...
+def random_geometric_graph(
+    nvtxs: int,
+    radius: float,
+    dim: int,
+    seed: int,
+) -> tuple[_IntArray, _IntArray]: ...
+def power_law_graph(nvtxs: int, m: int, seed: int) -> tuple[_IntArray, _IntArray]: ...
+def tet_mesh(nx: int, ny: int, nz: int) -> tuple[_IntArray, _IntArray, int]: ...
@@ -0,0 +1,389 @@
+"""
+Caching of partitions and orderings
+-----------------------------------
+
+Passing a :class:`PartitionCache` as the *cache* argument of
+:func:`pymetis.part_graph`, :func:`pymetis.part_mesh` or
+:func:`pymetis.nested_dissection` returns the stored result of an earlier
+call with identical inputs instead of running METIS again.
+
+Results are looked up by a key computed from the contents of all input
+arrays (hashed natively, using a fast 64-bit non-cryptographic hash), the
+other arguments, the contents of the :class:`~pymetis.Options` and the
+versions of PyMETIS and METIS. Since results for identical inputs are only
+reproducible for a fixed :attr:`~pymetis.Options.seed`, a cache should only
+be used when that is acceptable.
+
+.. autoclass:: PartitionCache
+.. autoclass:: CacheStats
+
+.. versionadded:: 2026.1
+"""
+
+from __future__ import annotations
+
+
+__copyright__ = "Copyright (C) 2026 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+import os
+import struct
+import threading
+from collections import OrderedDict
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pymetis import Options
+
+
+Record: TypeAlias = "tuple[int | bytes | None, ...]"
+
+_MAGIC = b"PYMETISC\x01"
+_SUFFIX = ".pmc"
+
+
+class CacheStats(NamedTuple):
+    """A named tuple of the counters of a :class:`PartitionCache`.
+
+    .. autoattribute:: hits
+    .. autoattribute:: disk_hits
+    .. autoattribute:: misses
+    .. autoattribute:: entries
+    .. autoattribute:: disk_bytes
+    """
+    hits: int
+    "Number of lookups answered from memory"
+
+    disk_hits: int
+    "Number of lookups answered from the on-disk store"
+
+    misses: int
+    "Number of lookups that required running METIS"
+
+    entries: int
+    "Number of results held in memory"
+
+    disk_bytes: int
+    "Total size of the on-disk store, zero if there is none"
+
+
+# {{{ binary records
+
+def _encode(record: Record) -> bytes:
+    parts = [_MAGIC, struct.pack("<I", len(record))]
+    for item in record:
+        if item is None:
+            parts.append(b"n")
+        elif isinstance(item, int):
+            parts.append(b"i" + struct.pack("<q", item))
+        else:
+            parts.extend((b"b" + struct.pack("<Q", len(item)), item))
+
+    return b"".join(parts)
+
+
+def _decode(data: bytes) -> Record:
+    if not data.startswith(_MAGIC):
+        raise ValueError("not a PyMETIS cache record")
+
+    pos = len(_MAGIC)
+    count, = struct.unpack_from("<I", data, pos)
+    pos += 4
+
+    items: list[int | bytes | None] = []
+    for _ in range(count):
+        tag = data[pos:pos + 1]
+        pos += 1
+        if tag == b"n":
+            items.append(None)
+        elif tag == b"i":
+            items.append(struct.unpack_from("<q", data, pos)[0])
+            pos += 8
+        elif tag == b"b":
+            length, = struct.unpack_from("<Q", data, pos)
+            pos += 8
+            if pos + length > len(data):
+                raise ValueError("truncated PyMETIS cache record")
+            items.append(data[pos:pos + length])
+            pos += length
+        else:
+            raise ValueError("corrupt PyMETIS cache record")
+
+    return tuple(items)
+
+# }}}
+
+
+class PartitionCache:
+    """A cache of results of :func:`pymetis.part_graph`,
+    :func:`pymetis.part_mesh` and :func:`pymetis.nested_dissection`, with a
+    least-recently-used in-memory tier of at most *max_entries* results and,
+    if *directory* is given, an on-disk tier shared between processes. The
+    on-disk tier is kept below *max_disk_bytes* by removing the least
+    recently used files. All methods are thread-safe.
+
+    .. autoattribute:: hits
+    .. autoattribute:: disk_hits
+    .. autoattribute:: misses
+
+    .. automethod:: stats
+    .. automethod:: clear
+    """
+
+    hits: int
+    "Number of lookups answered from memory"
+
+    disk_hits: int
+    "Number of lookups answered from the on-disk store"
+
+    misses: int
+    "Number of lookups that required running METIS"
+
+    def __init__(self,
+                 max_entries: int = 64,
+                 directory: str | os.PathLike[str] | None = None,
+                 max_disk_bytes: int = 2**30,
+             ) -> None:
+        if max_entries < 0:
+            raise ValueError("max_entries must be non-negative")
+
+        self.max_entries = max_entries
+        self.directory = None if directory is None else os.fspath(directory)
+        self.max_disk_bytes = max_disk_bytes
+
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+        self._entries: OrderedDict[str, Record] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def stats(self) -> CacheStats:
+        """Return the current counters as a :class:`CacheStats`."""
+        with self._lock:
+            return CacheStats(self.hits, self.disk_hits, self.misses,
+                              len(self._entries), self._disk_bytes())
+
+    def clear(self, disk: bool = False) -> None:
+        """Remove all results from memory and, if *disk* is *True*, from the
+        on-disk store. The counters are not reset.
+        """
+        with self._lock:
+            self._entries.clear()
+            if disk:
+                for path, _size, _mtime in self._disk_files():
+                    with suppress(FileNotFoundError):
+                        os.unlink(path)
+
+    # {{{ keys
+
+    def key(self,
+            kind: str,
+            arrays: Sequence[object] = (),
+            real_arrays: Sequence[object] = (),
+            options: Options | None = None,
+            scalars: Sequence[object] = (),
+        ) -> str:
+        """Return the key of a call to the function *kind*, with integer
+        input *arrays* and floating point *real_arrays* (either of which may
+        contain *None*), and further arguments *scalars* (which must have a
+        faithful :func:`repr`).
+        """
+        import hashlib
+
+        from pymetis._internal import hash_array, metis_version
+        from pymetis.version import VERSION_TEXT
+
+        digests = [hash_array(ary) for ary in arrays]
+        digests += [hash_array(ary, real=True) for ary in real_arrays]
+        options_values = (
+            None if options is None
+            else tuple(options._get(i) for i in range(type(options)._len())))
+
+        description = repr((
+            kind, VERSION_TEXT, metis_version(),
+            digests, options_values, tuple(scalars)))
+        return hashlib.blake2b(description.encode(), digest_size=16).hexdigest()
+
+    # }}}
+
+    # {{{ lookup
+
+    def get(self, key: str) -> Record | None:
+        """Return the record stored for *key*, or *None*."""
+        with self._lock:
+            record = self._entries.get(key)
+            if record is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return record
+
+            record = self._read(key)
+            if record is not None:
+                self.disk_hits += 1
+                self._remember(key, record)
+                return record
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, record: Record) -> None:
+        """Store *record*, a tuple of integers, :class:`bytes` and *None*,
+        for *key*.
+        """
+        with self._lock:
+            self._remember(key, record)
+            self._write(key, record)
+
+    def _remember(self, key: str, record: Record) -> None:
+        self._entries[key] = record
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    # }}}
+
+    # {{{ on-disk store
+
+    def _path(self, key: str) -> str:
+        assert self.directory is not None
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def _disk_files(self) -> list[tuple[str, int, float]]:
+        if self.directory is None:
+            return []
+
+        result = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(_SUFFIX):
+                    continue
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                result.append((entry.path, st.st_size, st.st_mtime))
+
+        return result
+
+    def _disk_bytes(self) -> int:
+        return sum(size for _path, size, _mtime in self._disk_files())
+
+    def _read(self, key: str) -> Record | None:
+        if self.directory is None:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as inf:
+                record = _decode(inf.read())
+            # mark as recently used
+            os.utime(path)
+        except (FileNotFoundError, ValueError, struct.error):
+            return None
+
+        return record
+
+    def _write(self, key: str, record: Record) -> None:
+        if self.directory is None:
+            return
+
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as outf:
+            outf.write(_encode(record))
+        os.replace(tmp_path, path)
+
+        files = self._disk_files()
+        total = sum(size for _path, size, _mtime in files)
+        for victim, size, _mtime in sorted(files, key=lambda f: f[2]):
+            if total <= self.max_disk_bytes:
+                break
+            with suppress(FileNotFoundError):
+                os.unlink(victim)
+            total -= size
+
+    # }}}
+
+
+# {{{ helpers for the cached functions
+
+def array_to_bytes(ary: object) -> bytes:
+    return memoryview(ary).cast("B").tobytes()  # pyright: ignore[reportArgumentType]
+
+
+def array_from_bytes(data: bytes,
+                     out: object | None = None,
+                     name: str = "out",
+                 ) -> Any:
+    """Return an array of :func:`~pymetis.zero_copy_dtype` with contents
+    *data*, or write them into *out* and return it. *out* is checked as the
+    wrapper checks output arrays named *name*.
+    """
+    from pymetis._internal import _idx_type_width  # pyright: ignore[reportPrivateUsage]
+
+    if out is not None:
+        try:
+            view = memoryview(out)  # pyright: ignore[reportArgumentType]
+        except TypeError:
+            raise TypeError(
+                f"{name} must be a writable, C-contiguous buffer") from None
+        if view.readonly or not view.c_contiguous:
+            raise TypeError(f"{name} must be a writable, C-contiguous buffer")
+        if (view.itemsize * 8 != _idx_type_width()
+                or not any(tc in view.format for tc in "ilq")):
+            raise TypeError(
+                f"{name} has an unexpected dtype, use zero_copy_dtype()")
+        if view.nbytes != len(data):
+            raise ValueError(
+                f"{name} must have {len(data) // view.itemsize} entries")
+        view.cast("B")[:] = data
+        return out
+
+    try:
+        import numpy as np
+    except ImportError:
+        from array import array
+        result = array("q" if _idx_type_width() == 64 else "i")
+        result.frombytes(data)
+        return result
+
+    from pymetis import zero_copy_dtype
+    return np.frombuffer(data, dtype=zero_copy_dtype()).copy()
+
+# }}}
+
+
+__all__ = [
+    "CacheStats",
+    "PartitionCache",
+]
+
+
+# vim: foldmethod=marker
@@ -0,0 +1,130 @@
+"""
+Synthetic graphs and meshes
+---------------------------
+
+Generators for graphs and meshes of configurable size, e.g. for testing and
+benchmarking. They are built natively, with arrays of
+:func:`~pymetis.zero_copy_dtype`, so that large instances are cheap to
+create. Random generators are deterministic for a given *seed*.
+
+.. autofunction:: grid_graph
+.. autofunction:: random_geometric_graph
+.. autofunction:: power_law_graph
+.. autofunction:: tet_mesh
+
+.. versionadded:: 2026.1
+"""
+
+from __future__ import annotations
+
+
+__copyright__ = "Copyright (C) 2026 Andreas Kloeckner"
+
+__license__ = """
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+THE SOFTWARE.
+"""
+
+from math import gamma, pi
+from typing import TYPE_CHECKING
+
+from pymetis import CSRAdjacency, CSRMesh, Mesh
+
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def _grid_shape(shape: Sequence[int]) -> tuple[int, int, int]:
+    if not 1 <= len(shape) <= 3:
+        raise ValueError("shape must have one to three entries")
+    nx, ny, nz = (*shape, 1, 1)[:3]
+    return nx, ny, nz
+
+
+def grid_graph(shape: Sequence[int]) -> CSRAdjacency:
+    """Return the graph of the 5-point (or, for a three-dimensional *shape*,
+    7-point) finite difference stencil on a structured grid with *shape*
+    points, numbered in Fortran order (i.e. with the first index varying
+    fastest).
+    """
+    from pymetis._internal import grid_graph
+    return CSRAdjacency(*grid_graph(*_grid_shape(shape)))
+
+
+def random_geometric_graph(
+            n_vertices: int,
+            radius: float | None = None,
+            dim: int = 2,
+            *,
+            seed: int = 0,
+        ) -> CSRAdjacency:
+    """Return the graph of *n_vertices* points drawn uniformly at random from
+    the unit square (or cube, for *dim* = 3), with an edge between any two
+    points less than *radius* apart. By default, *radius* is chosen to give
+    an average degree of about 10 (slightly less, due to the boundary).
+    """
+    if radius is None:
+        # volume of the unit ball
+        ball = pi**(dim / 2) / gamma(dim / 2 + 1)
+        radius = float((10 / (n_vertices * ball))**(1 / dim))
+
+    from pymetis._internal import random_geometric_graph
+    return CSRAdjacency(*random_geometric_graph(n_vertices, radius, dim, seed))
+
+
+def power_law_graph(
+            n_vertices: int,
+            m: int = 3,
+            *,
+            seed: int = 0,
+        ) -> CSRAdjacency:
+    """Return a Barabási-Albert preferential attachment graph, whose vertex
+    degrees follow a power law, as in many social and web graphs. Each
+    vertex after the first ``m + 1`` (which form a clique) is connected to
+    *m* earlier vertices, chosen with probability proportional to their
+    degree.
+    """
+    from pymetis._internal import power_law_graph
+    return CSRAdjacency(*power_law_graph(n_vertices, m, seed))
+
+
+def tet_mesh(shape: Sequence[int]) -> Mesh:
+    """Return a conforming mesh of the unit cube by tetrahedra, obtained by
+    subdividing it into a grid of *shape* boxes and each box into six
+    tetrahedra. Vertices are numbered as in :func:`grid_graph` for a grid of
+    one more point along each axis. Adjacent elements share three vertices,
+    so the dual graph should be formed with ``ncommon = 3``.
+    """
+    if len(shape) != 3:
+        raise ValueError("shape must have three entries")
+
+    from pymetis._internal import tet_mesh
+    elem_starts, elem_vertices, n_vertices = tet_mesh(*shape)
+    return Mesh(CSRMesh(elem_starts, elem_vertices), n_vertices)
+
+
+__all__ = [
+    "grid_graph",
+    "power_law_graph",
+    "random_geometric_graph",
+    "tet_mesh",
+]
+
+
+# vim: foldmethod=marker
@@ -0,0 +1,41 @@
+/*
+ * pymetis_memory.h
+ *
+ * Added for PyMETIS: lets a caller bound the memory that a METIS function
+ * allocates, and learn how much it used.
+ *
+ * If pymetis_memory points to a record while a METIS function runs on the
+ * same thread, gk_malloc() and gk_realloc() fail (in the way they fail when
+ * malloc() does, so that the function returns METIS_ERROR_MEMORY) once the
+ * heap memory tracked by gkmcore would exceed the limit, and the largest
+ * amount of such memory is stored in the record when gkmcore is destroyed.
+ */
+
+#ifndef _PYMETIS_MEMORY_H_
+#define _PYMETIS_MEMORY_H_
+
+#include <stddef.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef struct {
+  /* the number of bytes that may be allocated at any one time, or 0 for
+     no limit */
+  size_t limit;
+
+  /* the largest number of bytes that were allocated at any one time */
+  size_t peak;
+
+  /* whether an allocation was refused because of the limit */
+  int exceeded;
+} pymetis_memory_t;
+
+extern __thread pymetis_memory_t *pymetis_memory;
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -28,8 +28,28 @@ typedef void (*gksighandler_t)(int);
 /* These are the holders of the old singal handlers for the trapped signals */
 static __thread gksighandler_t old_SIGMEM_handler;  /* Custom signal */
 static __thread gksighandler_t old_SIGERR_handler;  /* Custom signal */
-static __thread gksighandler_t old_SIGMEM_handlers[MAX_JBUFS];  /* Custom signal */
-static __thread gksighandler_t old_SIGERR_handlers[MAX_JBUFS];  /* Custom signal */
+
+/* Signal dispositions are process-wide, while the jmp_bufs are per-thread.
+   gk_sigtrap()/gk_siguntrap() therefore keep a process-wide count of active
+   traps: the first trap installs gk_sigthrow() and saves the previous
+   handlers, the last untrap restores them. Since raise() delivers the signal
+   to the calling thread, gk_sigthrow() then jumps into that thread's
+   innermost jmp_buf. */
+static int gk_sigtrap_count = 0;
+static gksighandler_t old_SIGMEM_trap_handler;
+static gksighandler_t old_SIGERR_trap_handler;
+
+#ifdef _WIN32
+#include <windows.h>
+static SRWLOCK gk_sigtrap_lock = SRWLOCK_INIT;
+#define gk_sigtrap_acquire() AcquireSRWLockExclusive(&gk_sigtrap_lock)
+#define gk_sigtrap_release() ReleaseSRWLockExclusive(&gk_sigtrap_lock)
+#else
+#include <pthread.h>
+static pthread_mutex_t gk_sigtrap_lock = PTHREAD_MUTEX_INITIALIZER;
+#define gk_sigtrap_acquire() pthread_mutex_lock(&gk_sigtrap_lock)
+#define gk_sigtrap_release() pthread_mutex_unlock(&gk_sigtrap_lock)
+#endif
 
 /* The following is used to control if the gk_errexit() will actually abort or not.
    There is always a single copy of this variable */
@@ -102,8 +122,12 @@ int gk_sigtrap()
 
   gk_cur_jbufs++;
 
-  old_SIGMEM_handlers[gk_cur_jbufs]  = signal(SIGMEM,  gk_sigthrow);
-  old_SIGERR_handlers[gk_cur_jbufs]  = signal(SIGERR,  gk_sigthrow);
+  gk_sigtrap_acquire();
+  if (gk_sigtrap_count++ == 0) {
+    old_SIGMEM_trap_handler = signal(SIGMEM,  gk_sigthrow);
+    old_SIGERR_trap_handler = signal(SIGERR,  gk_sigthrow);
+  }
+  gk_sigtrap_release();
 
   return 1;
 }
@@ -118,8 +142,12 @@ int gk_siguntrap()
   if (gk_cur_jbufs == -1)
     return 0;
 
-  signal(SIGMEM,  old_SIGMEM_handlers[gk_cur_jbufs]);
-  signal(SIGERR,  old_SIGERR_handlers[gk_cur_jbufs]);
+  gk_sigtrap_acquire();
+  if (--gk_sigtrap_count == 0) {
+    signal(SIGMEM,  old_SIGMEM_trap_handler);
+    signal(SIGERR,  old_SIGERR_trap_handler);
+  }
+  gk_sigtrap_release();
 
   gk_cur_jbufs--;
 
@@ -134,6 +162,14 @@ int gk_siguntrap()
 /*************************************************************************/
 void gk_sigthrow(int signum)
 {
+  /* another thread may have installed the handler while this one has no
+     trap set up; fall back to the default disposition */
+  if (gk_cur_jbufs < 0) {
+    signal(signum, SIG_DFL);
+    raise(signum);
+    return;
+  }
+
   longjmp(gk_jbufs[gk_cur_jbufs], signum);
 }
   
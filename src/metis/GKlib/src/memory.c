@@ -14,10 +14,35 @@ can be used to define other memory allocation routines.
 
 
 #include <GKlib.h>
+#include "pymetis_memory.h"
 
 /* This is for the global mcore that tracks all heap allocations */
 static __thread gk_mcore_t *gkmcore = NULL;
 
+/* Added for PyMETIS: the memory limit and peak usage of this thread */
+__thread pymetis_memory_t *pymetis_memory = NULL;
+
+
+/*************************************************************************/
+/*! Added for PyMETIS: makes an allocation of nbytes fail, by jumping to
+    the return point of the running METIS function as if malloc() had
+    failed, if it would exceed the limit in pymetis_memory. The limit only
+    applies while gkmcore tracks allocations and a signal trap is set, as it
+    is in each METIS API function.
+*/
+/*************************************************************************/
+static void pymetis_check_limit(size_t nbytes)
+{
+  if (pymetis_memory == NULL || pymetis_memory->limit == 0 ||
+      gkmcore == NULL || gk_cur_jbufs < 0)
+    return;
+
+  if (gkmcore->cur_hallocs + nbytes > pymetis_memory->limit) {
+    pymetis_memory->exceeded = 1;
+    longjmp(gk_jbufs[gk_cur_jbufs], SIGMEM);
+  }
+}
+
 
 /*************************************************************************/
 /*! Define the set of memory allocation routines for each data type */
@@ -130,6 +155,8 @@ void gk_malloc_cleanup(int showstats)
   if (gkmcore != NULL) {
     gk_gkmcorePop(gkmcore);
     if (gkmcore->cmop == 0) {
+      if (pymetis_memory != NULL)
+        pymetis_memory->peak = gk_max(pymetis_memory->peak, gkmcore->max_hallocs);
       gk_gkmcoreDestroy(&gkmcore, showstats);
       gkmcore = NULL;
     }
@@ -154,6 +181,8 @@ void *gk_malloc(size_t nbytes, char *msg)
   if (nbytes == 0)
     nbytes++;  /* Force mallocs to actually allocate some memory */
 
+  pymetis_check_limit(nbytes);
+
   ptr = (void *)malloc(nbytes);
 
   if (ptr == NULL) {
@@ -181,6 +210,8 @@ void *gk_realloc(void *oldptr, size_t nbytes, char *msg)
   if (nbytes == 0)
     nbytes++;  /* Force mallocs to actually allocate some memory */
 
+  pymetis_check_limit(nbytes);
+
   /* remove this memory de-allocation */
   if (gkmcore != NULL && oldptr != NULL) gk_gkmcoreDel(gkmcore, oldptr);
 
@@ -63,10 +63,12 @@ GK_MKRANDOM(gk_zu,  size_t, size_t)
 #define LM 0x7FFFFFFFULL /* Least significant 31 bits */
 
 
-/* The array for the state vector */
-static uint64_t mt[NN]; 
+/* The array for the state vector. It is kept per-thread so that concurrent
+   callers (each of which reseeds via gk_randinit()) get reproducible
+   sequences that do not interfere with one another. */
+static __thread uint64_t mt[NN]; 
 /* mti==NN+1 means mt[NN] is not initialized */
-static int mti=NN+1; 
+static __thread int mti=NN+1; 
 #endif /* USE_GKRAND */
 
 /* initializes mt[NN] with a seed */
@@ -8,7 +8,11 @@
 */
 
 
+/* PyMETIS: for CLOCK_THREAD_CPUTIME_ID */
+#define _GNU_SOURCE
+#include <time.h>
 #include <GKlib.h>
+#undef _GNU_SOURCE
 
 
 
@@ -41,6 +45,13 @@ double gk_CPUSeconds(void)
 #else
   #if defined(WIN32) || defined(__MINGW32__)
     return((double) clock()/CLOCKS_PER_SEC);
+  #elif defined(CLOCK_THREAD_CPUTIME_ID)
+    /* PyMETIS: count only the calling thread, so that METIS calls running
+       concurrently in other threads do not add to its timers */
+    struct timespec ts;
+
+    clock_gettime(CLOCK_THREAD_CPUTIME_ID, &ts);
+    return ts.tv_sec + 1.0e-9*ts.tv_nsec;
   #else
     struct rusage r;
 
@@ -74,6 +74,7 @@ graph_t *CoarsenGraph(ctrl_t *ctrl, graph_t *graph)
 
   IFSET(ctrl->dbglvl, METIS_DBG_COARSEN, PrintCGraphStats(ctrl, graph));
   IFSET(ctrl->dbglvl, METIS_DBG_TIME, gk_stopcputimer(ctrl->CoarsenTmr));
+  IFSET(ctrl->dbglvl, METIS_DBG_TIME, RecordCoarsening(graph));
 
   return graph;
 }
@@ -140,6 +141,7 @@ graph_t *CoarsenGraphNlevels(ctrl_t *ctrl, graph_t *graph, idx_t nlevels)
 
   IFSET(ctrl->dbglvl, METIS_DBG_COARSEN, PrintCGraphStats(ctrl, graph));
   IFSET(ctrl->dbglvl, METIS_DBG_TIME, gk_stopcputimer(ctrl->CoarsenTmr));
+  IFSET(ctrl->dbglvl, METIS_DBG_TIME, RecordCoarsening(graph));
 
   return graph;
 }
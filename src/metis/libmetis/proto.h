@@ -323,6 +323,7 @@ real_t ComputeElementBalance(idx_t, idx_t, idx_t *);
 /* timing.c */
 void InitTimers(ctrl_t *);
 void PrintTimers(ctrl_t *);
+void RecordCoarsening(graph_t *);
 
 /* util.c */
 idx_t iargmax_strd(size_t, idx_t *, idx_t);
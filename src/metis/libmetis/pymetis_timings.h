@@ -0,0 +1,45 @@
+/*
+ * pymetis_timings.h
+ *
+ * Added for PyMETIS: lets a caller collect the timers of ctrl_t and
+ * statistics of the coarsening, rather than have PrintTimers() print them.
+ *
+ * If pymetis_timings points to a record while a METIS function runs on the
+ * same thread with METIS_DBG_TIME set in its options, PrintTimers() stores
+ * the timers in the record (and prints nothing), and each coarsening of a
+ * graph is counted in it.
+ */
+
+#ifndef _PYMETIS_TIMINGS_H_
+#define _PYMETIS_TIMINGS_H_
+
+#include <metis.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+typedef struct {
+  /* the timers of ctrl_t, in seconds */
+  double total, coarsen, match, contract, initpart, uncoarsen, refine,
+         project, split;
+
+  /* the number of times a graph was coarsened, e.g. once per bisection in
+     recursive bisection */
+  idx_t ncoarsenings;
+
+  /* the number of levels of the first (i.e. top-level) coarsening, and the
+     number of vertices and (undirected) edges of its coarsest graph */
+  idx_t nlevels, coarsest_nvtxs, coarsest_nedges;
+
+  /* whether PrintTimers() was reached */
+  int recorded;
+} pymetis_timings_t;
+
+extern __thread pymetis_timings_t *pymetis_timings;
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
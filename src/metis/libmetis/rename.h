@@ -239,6 +239,7 @@
 /* timing.c */
 #define InitTimers			libmetis__InitTimers
 #define PrintTimers			libmetis__PrintTimers
+#define RecordCoarsening		libmetis__RecordCoarsening
 
 /* util.c */
 #define iargmax_strd                    libmetis__iargmax_strd 
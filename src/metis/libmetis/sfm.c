@@ -366,7 +366,8 @@ void FM_2WayNodeRefine1Sided(ctrl_t *ctrl, graph_t *graph, idx_t niter)
       /**********************************************************
       * Update the degrees of the affected nodes
       ***********************************************************/
-      IFSET(ctrl->dbglvl, METIS_DBG_TIME, gk_startcputimer(ctrl->Aux1Tmr));
+      /* PyMETIS: Aux1Tmr (which is not reported) is not updated for each
+         move, as reading the timer would dominate the cost of the move */
       for (j=xadj[higain]; j<xadj[higain+1]; j++) {
         k = adjncy[j];
 
@@ -400,7 +401,6 @@ void FM_2WayNodeRefine1Sided(ctrl_t *ctrl, graph_t *graph, idx_t niter)
         }
       }
       mptr[nswaps+1] = nmind;
-      IFSET(ctrl->dbglvl, METIS_DBG_TIME, gk_stopcputimer(ctrl->Aux1Tmr));
 
 
       IFSET(ctrl->dbglvl, METIS_DBG_MOVEINFO,
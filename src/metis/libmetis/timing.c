@@ -13,6 +13,10 @@
  */
 
 #include "metislib.h"
+#include "pymetis_timings.h"
+
+
+__thread pymetis_timings_t *pymetis_timings = NULL;
 
 
 /*************************************************************************
@@ -41,6 +45,20 @@ void InitTimers(ctrl_t *ctrl)
 **************************************************************************/
 void PrintTimers(ctrl_t *ctrl)
 {
+  if (pymetis_timings != NULL) {
+    pymetis_timings->total     = gk_getcputimer(ctrl->TotalTmr);
+    pymetis_timings->coarsen   = gk_getcputimer(ctrl->CoarsenTmr);
+    pymetis_timings->match     = gk_getcputimer(ctrl->MatchTmr);
+    pymetis_timings->contract  = gk_getcputimer(ctrl->ContractTmr);
+    pymetis_timings->initpart  = gk_getcputimer(ctrl->InitPartTmr);
+    pymetis_timings->uncoarsen = gk_getcputimer(ctrl->UncoarsenTmr);
+    pymetis_timings->refine    = gk_getcputimer(ctrl->RefTmr);
+    pymetis_timings->project   = gk_getcputimer(ctrl->ProjectTmr);
+    pymetis_timings->split     = gk_getcputimer(ctrl->SplitTmr);
+    pymetis_timings->recorded  = 1;
+    return;
+  }
+
   printf("\nTiming Information -------------------------------------------------");
   printf("\n Multilevel: \t\t %7.3"PRREAL"", gk_getcputimer(ctrl->TotalTmr));
   printf("\n     Coarsening: \t\t %7.3"PRREAL"", gk_getcputimer(ctrl->CoarsenTmr));
@@ -61,3 +79,24 @@ void PrintTimers(ctrl_t *ctrl)
 
 
 
+/*************************************************************************
+* Added for PyMETIS: this function records a coarsening, which ended in
+* cgraph, in pymetis_timings
+**************************************************************************/
+void RecordCoarsening(graph_t *cgraph)
+{
+  idx_t nlevels;
+  graph_t *graph;
+
+  if (pymetis_timings == NULL)
+    return;
+
+  if (pymetis_timings->ncoarsenings++ == 0) {
+    for (nlevels=0, graph=cgraph; graph->finer != NULL; graph=graph->finer)
+      nlevels++;
+
+    pymetis_timings->nlevels         = nlevels;
+    pymetis_timings->coarsest_nvtxs  = cgraph->nvtxs;
+    pymetis_timings->coarsest_nedges = cgraph->nedges/2;
+  }
+}
@@ -1,9 +1,27 @@
 #include <pybind11/pybind11.h>
+#include <pybind11/numpy.h>
 #include <pybind11/warnings.h>
 #include <metis.h>
+#ifdef PYMETIS_SHIPPED_METIS
+#include <pymetis_timings.h>
+#include <pymetis_memory.h>
+#endif
+#include <algorithm>
+#include <atomic>
+#include <charconv>
+#include <cmath>
+#include <cstdio>
+#include <cstring>
+#include <limits>
 #include <memory>
+#include <random>
+#include <string>
+#include <thread>
+#include <tuple>
 #include <vector>
 #include <stdexcept>
+#include <system_error>
+#include <type_traits>
 
 
 namespace py = pybind11;
@@ -35,13 +53,13 @@ namespace
       case METIS_OK:
         return;
       case METIS_ERROR_INPUT:
-        throw new invalid_argument(message);
+        throw invalid_argument(message);
       case METIS_ERROR_MEMORY:
-        throw new bad_alloc();
+        throw bad_alloc();
       case METIS_ERROR:
-        throw new logic_error(message);
+        throw logic_error(message);
       default:
-        throw new runtime_error(message);
+        throw runtime_error(message);
     }
   }
 
@@ -58,7 +76,7 @@ namespace
       idx_t get(int i) const
       {
         if (i < 0 || i >= METIS_NOPTIONS)
-          throw new invalid_argument("options index is out of range");
+          throw invalid_argument("options index is out of range");
 
         return m_options[i];
       }
@@ -66,7 +84,7 @@ namespace
       void set(int i, idx_t value)
       {
         if (i < 0 || i >= METIS_NOPTIONS)
-          throw new invalid_argument("options index is out of range");
+          throw invalid_argument("options index is out of range");
 
         m_options[i] = value;
       }
@@ -82,7 +100,7 @@ namespace
   template<class T>
   char typecode_for_type()
   {
-    throw new logic_error("no type code known for type");
+    throw logic_error("no type code known for type");
   }
 
   template<>
@@ -94,10 +112,19 @@ namespace
       return 'i';
   }
 
+  template<>
+  char typecode_for_type<real_t>()
+  {
+    if (REALTYPEWIDTH == 64)
+      return 'd';
+    else
+      return 'f';
+  }
+
   template<class T>
   const char *typecodes_for_type()
   {
-    throw new logic_error("no type code known for type");
+    throw logic_error("no type code known for type");
   }
 
   template<>
@@ -109,7 +136,10 @@ namespace
   template<>
   const char *typecodes_for_type<real_t>()
   {
-    return "f";
+    if (REALTYPEWIDTH == 64)
+      return "d";
+    else
+      return "f";
   }
 
   bool contains_one_of(const char *chars, const char *haystack)
@@ -120,34 +150,6 @@ namespace
   }
 
 
-  template<class T>
-  class array_for_py
-  {
-    py::bytearray m_bytearray;
-
-    public:
-      array_for_py(size_t size)
-      : m_bytearray(nullptr, size * sizeof(T))
-      {}
-
-      T *get()
-      {
-        return reinterpret_cast<T *>(PyByteArray_AS_STRING(m_bytearray.ptr()));
-      }
-
-      py::object as_array()
-      {
-        py::module_ array_mod(py::module_::import("array"));
-        py::object ary = array_mod.attr("array")(typecode_for_type<T>(), m_bytearray);
-
-        if (ary.attr("itemsize").cast<int>() != sizeof(T))
-          throw new logic_error("failed to identify size of output data type");
-
-        return ary;
-      }
-  };
-
-
   class not_a_buffer_error : public std::runtime_error
   {
     using std::runtime_error::runtime_error;
@@ -195,12 +197,81 @@ namespace
   };
 
 
+  /**
+   * Return the struct-module type code of a buffer containing scalars in
+   * native byte order, or 0 if it does not.
+   */
+  char native_format_char(const Py_buffer &buf)
+  {
+    const char *fmt = buf.format ? buf.format : "B";
+    if (*fmt == '@' || *fmt == '=')
+      ++fmt;
+    else if (*fmt == '<' || *fmt == '>' || *fmt == '!')
+    {
+      const uint16_t probe = 1;
+      bool little_endian = *reinterpret_cast<const char *>(&probe) == 1;
+      if ((*fmt == '<') != little_endian)
+        return 0;
+      ++fmt;
+    }
+    if (!*fmt || fmt[1])
+      return 0;
+    return *fmt;
+  }
+
+
+  /**
+   * Call ``f(static_cast<const S *>(buf.buf))`` with *S* being the C type of
+   * the buffer's (integer or floating point) entries. Return *false* if the
+   * buffer's format is not understood.
+   */
+  template <class F>
+  bool dispatch_on_buffer_type(const Py_buffer &buf, F f)
+  {
+    char tc = native_format_char(buf);
+    if (!tc)
+      return false;
+
+    const void *data = buf.buf;
+    bool is_signed = strchr("bhilqn", tc) != nullptr;
+    bool is_unsigned = strchr("BHILQN", tc) != nullptr;
+    if (is_signed || is_unsigned)
+    {
+#define DISPATCH(SIGNED, UNSIGNED) \
+      if (is_signed) \
+        f(static_cast<const SIGNED *>(data)); \
+      else \
+        f(static_cast<const UNSIGNED *>(data));
+
+      switch (buf.itemsize)
+      {
+        case 1: DISPATCH(int8_t, uint8_t); return true;
+        case 2: DISPATCH(int16_t, uint16_t); return true;
+        case 4: DISPATCH(int32_t, uint32_t); return true;
+        case 8: DISPATCH(int64_t, uint64_t); return true;
+        default: return false;
+      }
+#undef DISPATCH
+    }
+    else if (tc == 'f' && buf.itemsize == sizeof(float))
+      f(static_cast<const float *>(data));
+    else if (tc == 'd' && buf.itemsize == sizeof(double))
+      f(static_cast<const double *>(data));
+    else
+      return false;
+
+    return true;
+  }
+
+
   template<class T>
   class array_from_py
   {
     std::unique_ptr<std::vector<T>> m_vec;
     std::unique_ptr<py_buffer_wrapper> m_buf;
     std::size_t m_size;
+    // number of columns if the input was two-dimensional, else zero
+    std::size_t m_ncols = 0;
 
     public:
       array_from_py(const char *name, py::object obj, bool warn_on_copies, bool required = true)
@@ -217,7 +288,8 @@ namespace
 
         try
         {
-          m_buf.reset(new py_buffer_wrapper(name, obj.ptr(), PyBUF_FORMAT, warn_on_copies));
+          m_buf.reset(new py_buffer_wrapper(name, obj.ptr(),
+                PyBUF_FORMAT | PyBUF_C_CONTIGUOUS, warn_on_copies));
         }
         catch (not_a_buffer_error &ex)
         {
@@ -225,6 +297,7 @@ namespace
         }
 
         // check buffer for suitability
+        bool suitable = true;
         if (m_buf.get() && m_buf->m_buf.itemsize != sizeof(T))
         {
           if (warn_on_copies)
@@ -235,11 +308,12 @@ namespace
             py::warnings::warn(msg.c_str(), PyExc_BytesWarning, 3);
           }
 
-          m_buf.reset(nullptr);
+          suitable = false;
         }
 
         const char *needed_tcs = typecodes_for_type<T>();
-        if (m_buf.get() && !contains_one_of(needed_tcs, m_buf->m_buf.format))
+        if (m_buf.get() && suitable
+            && !contains_one_of(needed_tcs, m_buf->m_buf.format))
         {
           if (warn_on_copies)
           {
@@ -251,201 +325,3620 @@ namespace
             py::warnings::warn(msg.c_str(), PyExc_BytesWarning, 3);
           }
 
-          m_buf.reset(nullptr);
-        }
+          suitable = false;
+        }
+
+        if (m_buf.get() && m_buf->m_buf.ndim > 2)
+          throw py::value_error(
+              std::string(name) + " must be one- or two-dimensional");
+
+        if (m_buf.get() && !suitable)
+        {
+          // a numeric buffer of the wrong type: convert without going
+          // through Python objects, if possible
+          const Py_buffer &buf = m_buf->m_buf;
+          size_t n = buf.len / buf.itemsize;
+          std::unique_ptr<std::vector<T>> vec(new std::vector<T>(n));
+          if (dispatch_on_buffer_type(buf, [&](auto *src)
+                {
+                  typedef std::remove_cv_t<std::remove_pointer_t<
+                    decltype(src)>> source_type;
+                  // as py::cast would, refuse to truncate to integers
+                  if constexpr (std::is_integral_v<T>
+                      && std::is_floating_point_v<source_type>)
+                    throw py::type_error(std::string(name)
+                        + " must have integer entries, not floating point");
+                  else
+                    std::copy(src, src + n, vec->data());
+                }))
+          {
+            m_vec = std::move(vec);
+            if (buf.ndim == 2)
+              m_ncols = buf.shape[1];
+          }
+          m_buf.reset(nullptr);
+
+          if (m_vec.get())
+          {
+            m_size = m_vec->size();
+            return;
+          }
+        }
+
+        if (m_buf.get())
+        {
+          if (m_buf->m_buf.ndim == 2)
+            m_ncols = m_buf->m_buf.shape[1];
+
+          m_size = m_buf->m_buf.len / sizeof(T);
+        }
+        else
+        {
+          // also accept a sequence of rows, flattening it in row-major order
+          m_vec.reset(new std::vector<T>);
+          bool nested = false;
+          bool first = true;
+          for (auto row: obj)
+          {
+            bool row_nested = PySequence_Check(row.ptr());
+            if (first)
+              nested = row_nested;
+            else if (row_nested != nested)
+              throw py::value_error(
+                  std::string(name) + " mixes scalars and sequences");
+
+            if (nested)
+            {
+              size_t ncols = 0;
+              for (auto it: row)
+              {
+                m_vec->push_back(py::cast<T>(it));
+                ++ncols;
+              }
+              if (first)
+                m_ncols = ncols;
+              else if (ncols != m_ncols)
+                throw py::value_error(
+                    std::string(name) + " has rows of differing lengths");
+            }
+            else
+              m_vec->push_back(py::cast<T>(row));
+
+            first = false;
+          }
+
+          m_size = m_vec->size();
+        }
+      }
+
+      /**
+       * Take ownership of an already-converted vector.
+       */
+      array_from_py(std::vector<T> &&vec)
+      : m_vec(new std::vector<T>(std::move(vec)))
+      {
+        m_size = m_vec->size();
+      }
+
+      T *get() const
+      {
+        if (m_buf.get())
+          return reinterpret_cast<T *>(m_buf->m_buf.buf);
+        else if (m_vec.get())
+          return m_vec->empty() ? nullptr: m_vec->data();
+        else
+          return nullptr;
+      }
+
+      size_t size() const
+      {
+        return m_size;
+      }
+
+      size_t ncols() const
+      {
+        return m_ncols;
+      }
+
+  };
+
+
+  bool have_numpy()
+  {
+    static bool result = []()
+    {
+      try
+      {
+        py::module_::import("numpy");
+        return true;
+      }
+      catch (py::error_already_set &)
+      {
+        return false;
+      }
+    }();
+    return result;
+  }
+
+
+  /**
+   * Output array handed back to Python. This is either a freshly allocated
+   * :mod:`numpy` array (or, if numpy is not available, an
+   * :class:`array.array`), or a writable, C-contiguous buffer supplied by
+   * the caller, into which METIS then writes directly.
+   */
+  template<class T>
+  class array_for_py
+  {
+    py::object m_obj;
+    std::unique_ptr<py_buffer_wrapper> m_out_buf;
+    T *m_data;
+
+    void allocate(size_t size)
+    {
+      if (have_numpy())
+      {
+        py::array_t<T> ary(size);
+        m_data = ary.mutable_data();
+        m_obj = std::move(ary);
+      }
+      else
+      {
+        py::bytearray ba(nullptr, size * sizeof(T));
+        m_data = reinterpret_cast<T *>(PyByteArray_AS_STRING(ba.ptr()));
+        m_obj = std::move(ba);
+      }
+    }
+
+    public:
+      array_for_py(size_t size)
+      {
+        allocate(size);
+      }
+
+      /**
+       * Use *out_py* as storage, unless it is *None*.
+       */
+      array_for_py(const char *name, const py::object &out_py, size_t size)
+      {
+        if (out_py.is_none())
+        {
+          allocate(size);
+          return;
+        }
+
+        try
+        {
+          m_out_buf.reset(new py_buffer_wrapper(name, out_py.ptr(),
+                PyBUF_WRITABLE | PyBUF_FORMAT | PyBUF_C_CONTIGUOUS, false));
+        }
+        catch (not_a_buffer_error &)
+        {
+          throw py::type_error(std::string(name)
+              + " must be a writable, C-contiguous buffer");
+        }
+
+        const Py_buffer &buf = m_out_buf->m_buf;
+        if (buf.itemsize != sizeof(T)
+            || !contains_one_of(typecodes_for_type<T>(), buf.format))
+          throw py::type_error(std::string(name)
+              + " has an unexpected dtype, use zero_copy_dtype()");
+        if (size_t(buf.len) != size * sizeof(T))
+          throw py::value_error(std::string(name)
+              + " must have " + std::to_string(size) + " entries");
+
+        m_data = reinterpret_cast<T *>(buf.buf);
+        m_obj = out_py;
+      }
+
+      T *get()
+      {
+        return m_data;
+      }
+
+      py::object as_array()
+      {
+        if (!PyByteArray_Check(m_obj.ptr()))
+          return m_obj;
+
+        py::module_ array_mod(py::module_::import("array"));
+        py::object ary = array_mod.attr("array")(typecode_for_type<T>(), m_obj);
+
+        if (ary.attr("itemsize").cast<int>() != sizeof(T))
+          throw logic_error("failed to identify size of output data type");
+
+        return ary;
+      }
+  };
+
+
+  [[noreturn]] void throw_index_out_of_range(
+      const char *what, long long idx)
+  {
+    throw py::value_error(std::string(what) + " refers to index "
+        + std::to_string(idx) + ", which is out of range");
+  }
+
+
+  /**
+   * Check that the *n* indices at *idx* lie in ``[0, bound)``, and return the
+   * largest one (or -1).
+   */
+  idx_t check_indices(const idx_t *idx, size_t n, idx_t bound, const char *what)
+  {
+    idx_t min_idx = 0, max_idx = -1;
+    for (size_t i = 0; i < n; ++i)
+    {
+      min_idx = std::min(min_idx, idx[i]);
+      max_idx = std::max(max_idx, idx[i]);
+    }
+    if (min_idx < 0)
+      throw_index_out_of_range(what, min_idx);
+    if (max_idx >= bound)
+      throw_index_out_of_range(what, max_idx);
+    return max_idx;
+  }
+
+
+  // {{{ memory limit and accounting
+
+  /**
+   * While alive, limits the memory that the METIS calls made on this thread
+   * may allocate to *limit* bytes (or not at all, if it is 0), and records
+   * the most that they had allocated at any one time. A call that exceeds
+   * the limit fails with ``METIS_ERROR_MEMORY``, see check(). This requires
+   * the METIS shipped with PyMETIS.
+   */
+  class memory_monitor
+  {
+#ifdef PYMETIS_SHIPPED_METIS
+    pymetis_memory_t m_memory;
+    pymetis_memory_t *m_prev;
+#endif
+
+    public:
+      explicit memory_monitor(size_t limit)
+      {
+#ifdef PYMETIS_SHIPPED_METIS
+        std::memset(&m_memory, 0, sizeof(m_memory));
+        m_memory.limit = limit;
+        m_prev = pymetis_memory;
+        pymetis_memory = &m_memory;
+#else
+        PyErr_SetString(PyExc_NotImplementedError,
+            "memory accounting requires the METIS shipped with PyMETIS");
+        throw py::error_already_set();
+#endif
+      }
+
+      ~memory_monitor()
+      {
+#ifdef PYMETIS_SHIPPED_METIS
+        pymetis_memory = m_prev;
+#endif
+      }
+
+      memory_monitor(const memory_monitor &) = delete;
+      memory_monitor &operator=(const memory_monitor &) = delete;
+
+      size_t peak() const
+      {
+#ifdef PYMETIS_SHIPPED_METIS
+        return m_memory.peak;
+#else
+        return 0;
+#endif
+      }
+
+      /**
+       * Raise :exc:`MemoryError` if a METIS call failed because it would
+       * have exceeded the limit.
+       */
+      void check() const
+      {
+#ifdef PYMETIS_SHIPPED_METIS
+        if (m_memory.exceeded)
+        {
+          std::string msg = "METIS would have allocated more than "
+            "max_memory=" + std::to_string(m_memory.limit) + " bytes";
+          PyErr_SetString(PyExc_MemoryError, msg.c_str());
+          throw py::error_already_set();
+        }
+#endif
+      }
+  };
+
+  // }}}
+
+
+  // {{{ collection of METIS timers
+
+  /**
+   * While alive, collects the timers of the METIS calls made on this thread,
+   * and statistics of their coarsening, instead of letting METIS print
+   * them. This requires the METIS shipped with PyMETIS, and
+   * ``METIS_DBG_TIME`` set in the options of the calls, see enable().
+   */
+  class timing_collector
+  {
+#ifdef PYMETIS_SHIPPED_METIS
+    pymetis_timings_t m_timings;
+    pymetis_timings_t *m_prev;
+#endif
+
+    public:
+      timing_collector()
+      {
+#ifdef PYMETIS_SHIPPED_METIS
+        std::memset(&m_timings, 0, sizeof(m_timings));
+        m_prev = pymetis_timings;
+        pymetis_timings = &m_timings;
+#else
+        PyErr_SetString(PyExc_NotImplementedError,
+            "collecting timings requires the METIS shipped with PyMETIS");
+        throw py::error_already_set();
+#endif
+      }
+
+      ~timing_collector()
+      {
+#ifdef PYMETIS_SHIPPED_METIS
+        pymetis_timings = m_prev;
+#endif
+      }
+
+      timing_collector(const timing_collector &) = delete;
+      timing_collector &operator=(const timing_collector &) = delete;
+
+      static void enable(metis_options &options)
+      {
+        idx_t dbglvl = options.get(METIS_OPTION_DBGLVL);
+        options.set(METIS_OPTION_DBGLVL,
+            (dbglvl < 0 ? 0 : dbglvl) | METIS_DBG_TIME);
+      }
+
+      py::tuple as_tuple(const memory_monitor &memory) const
+      {
+#ifdef PYMETIS_SHIPPED_METIS
+        const pymetis_timings_t &t = m_timings;
+        return py::make_tuple(
+            t.total, t.coarsen, t.match, t.contract, t.initpart,
+            t.uncoarsen, t.refine, t.project, t.split,
+            t.ncoarsenings, t.nlevels, t.coarsest_nvtxs, t.coarsest_nedges,
+            memory.peak());
+#else
+        throw logic_error("timings are not available");
+#endif
+      }
+  };
+
+  // }}}
+
+
+  // {{{ symbolic factorization
+
+  /**
+   * Compute the elimination tree of the matrix with the nonzero structure
+   * of the graph (*xadj*, *adjncy*), symmetrically permuted so that row and
+   * column *i* of the result are row and column ``perm[i]`` of the original.
+   * ``parent[k]`` is -1 for roots. Uses Liu's algorithm with path
+   * compression.
+   */
+  void elimination_tree(idx_t nvtxs, const idx_t *xadj, const idx_t *adjncy,
+      const idx_t *perm, const idx_t *iperm, idx_t *parent)
+  {
+    std::vector<idx_t> ancestor(nvtxs, -1);
+    for (idx_t k = 0; k < nvtxs; ++k)
+    {
+      parent[k] = -1;
+      idx_t v = perm[k];
+      for (idx_t j = xadj[v]; j < xadj[v+1]; ++j)
+      {
+        for (idx_t i = iperm[adjncy[j]]; i < k; )
+        {
+          idx_t next = ancestor[i];
+          ancestor[i] = k;
+          if (next == -1)
+          {
+            parent[i] = k;
+            break;
+          }
+          i = next;
+        }
+      }
+    }
+  }
+
+
+  /**
+   * Count the nonzeros (including the diagonal) in each column of the
+   * Cholesky factor of the permuted matrix (see :func:`elimination_tree`),
+   * by traversing the row subtrees of the elimination tree *parent*.
+   */
+  void column_counts(idx_t nvtxs, const idx_t *xadj, const idx_t *adjncy,
+      const idx_t *perm, const idx_t *iperm, const idx_t *parent,
+      idx_t *colcount)
+  {
+    std::vector<idx_t> mark(nvtxs, -1);
+    for (idx_t k = 0; k < nvtxs; ++k)
+    {
+      colcount[k] = 1;
+      mark[k] = k;
+      idx_t v = perm[k];
+      for (idx_t j = xadj[v]; j < xadj[v+1]; ++j)
+        for (idx_t i = iperm[adjncy[j]]; i < k && mark[i] != k; i = parent[i])
+        {
+          mark[i] = k;
+          ++colcount[i];
+        }
+    }
+  }
+
+
+  /**
+   * Fill-in and cost of a sparse Cholesky factorization, computed from the
+   * elimination tree and column counts rather than by a full symbolic
+   * factorization as in ``ComputeFillIn`` (``programs/smbfactor.c``).
+   */
+  struct ordering_stats
+  {
+    int64_t nnz_l = 0;
+    int64_t flops = 0;
+    idx_t max_front_size = 0;
+    idx_t tree_height = 0;
+
+    ordering_stats(idx_t nvtxs, const idx_t *xadj, const idx_t *adjncy,
+        const idx_t *perm, const idx_t *iperm)
+    {
+      std::vector<idx_t> parent(nvtxs), colcount(nvtxs), depth(nvtxs);
+      elimination_tree(nvtxs, xadj, adjncy, perm, iperm, parent.data());
+      column_counts(nvtxs, xadj, adjncy, perm, iperm, parent.data(),
+          colcount.data());
+
+      for (idx_t k = 0; k < nvtxs; ++k)
+      {
+        int64_t c = colcount[k];
+        nnz_l += c;
+        flops += c*c;
+        max_front_size = std::max(max_front_size, colcount[k]);
+      }
+
+      // parents are numbered higher than their children
+      for (idx_t k = nvtxs; k-- > 0; )
+      {
+        depth[k] = parent[k] == -1 ? 1 : depth[parent[k]] + 1;
+        tree_height = std::max(tree_height, depth[k]);
+      }
+    }
+
+    py::object as_tuple() const
+    {
+      return py::make_tuple(nnz_l, flops, max_front_size, tree_height);
+    }
+  };
+
+
+  /**
+   * Check that *perm* and *iperm* are mutually inverse permutations of
+   * ``range(nvtxs)``.
+   */
+  void check_permutation(idx_t nvtxs, const idx_t *perm, const idx_t *iperm)
+  {
+    for (idx_t i = 0; i < nvtxs; ++i)
+      if (perm[i] < 0 || perm[i] >= nvtxs || iperm[perm[i]] != i)
+        throw py::value_error("perm and iperm must be mutually inverse "
+            "permutations of range(nvtxs)");
+  }
+
+
+  /**
+   * Return the pinned (*xadj*, *adjncy*) graph, after checking that it is
+   * consistent and that its vertex indices are in range.
+   */
+  idx_t check_graph(const array_from_py<idx_t> &xadj,
+      const array_from_py<idx_t> &adjncy)
+  {
+    if (xadj.size() == 0)
+      throw py::value_error("xadj cannot be empty");
+    idx_t nvtxs = xadj.size() - 1;
+    const idx_t *pxadj = xadj.get();
+    if (pxadj[0] != 0)
+      throw py::value_error("xadj must start at zero");
+    for (idx_t i = 0; i < nvtxs; ++i)
+      if (pxadj[i+1] < pxadj[i])
+        throw py::value_error("xadj must be non-decreasing");
+    if (adjncy.size() < size_t(pxadj[nvtxs]))
+      throw py::value_error("adjncy is shorter than indicated by xadj");
+    for (idx_t j = 0; j < pxadj[nvtxs]; ++j)
+      if (adjncy.get()[j] < 0 || adjncy.get()[j] >= nvtxs)
+        throw py::value_error("adjncy refers to vertex "
+            + std::to_string(adjncy.get()[j]) + ", which is out of range");
+    return nvtxs;
+  }
+
+
+  /**
+   * A graph together with a symmetric reordering, pinned for use without
+   * the GIL. If *iperm_py* is None, the inverse permutation is computed.
+   */
+  struct ordered_graph_input : public noncopyable
+  {
+    array_from_py<idx_t> xadj, adjncy, perm;
+    std::unique_ptr<array_from_py<idx_t>> iperm;
+    idx_t nvtxs;
+
+    ordered_graph_input(
+        const py::object &xadj_py, const py::object &adjncy_py,
+        const py::object &perm_py, const py::object &iperm_py)
+    : xadj("xadj", xadj_py, false),
+      adjncy("adjncy", adjncy_py, false),
+      perm("perm", perm_py, false)
+    {
+      nvtxs = check_graph(xadj, adjncy);
+      if (perm.size() != size_t(nvtxs))
+        throw py::value_error("perm must have length nvtxs");
+
+      if (iperm_py.is_none())
+      {
+        std::vector<idx_t> iperm_vec(nvtxs);
+        for (idx_t i = 0; i < nvtxs; ++i)
+        {
+          idx_t p = perm.get()[i];
+          if (p < 0 || p >= nvtxs)
+            throw py::value_error("perm must be a permutation of range(nvtxs)");
+          iperm_vec[p] = i;
+        }
+        iperm.reset(new array_from_py<idx_t>(std::move(iperm_vec)));
+      }
+      else
+        iperm.reset(new array_from_py<idx_t>("iperm", iperm_py, false));
+      if (iperm->size() != size_t(nvtxs))
+        throw py::value_error("iperm must have length nvtxs");
+      check_permutation(nvtxs, perm.get(), iperm->get());
+    }
+  };
+
+
+  py::object
+  wrap_ordering_stats(const py::object &xadj_py, const py::object &adjncy_py,
+      const py::object &perm_py, const py::object &iperm_py)
+  {
+    ordered_graph_input g(xadj_py, adjncy_py, perm_py, iperm_py);
+
+    std::unique_ptr<ordering_stats> stats;
+    {
+      py::gil_scoped_release release;
+      stats.reset(new ordering_stats(
+            g.nvtxs, g.xadj.get(), g.adjncy.get(), g.perm.get(), g.iperm->get()));
+    }
+    return stats->as_tuple();
+  }
+
+
+  /**
+   * Compute a postordering *post* of the forest given by *parent*, in which
+   * children are visited in increasing order.
+   */
+  void tree_postorder(idx_t n, const idx_t *parent, idx_t *post)
+  {
+    // linked lists of children, built in reverse so that they come out
+    // in increasing order
+    std::vector<idx_t> head(n, -1), next(n), stack(n);
+    for (idx_t j = n; j-- > 0; )
+      if (parent[j] != -1)
+      {
+        next[j] = head[parent[j]];
+        head[parent[j]] = j;
+      }
+
+    idx_t k = 0;
+    for (idx_t root = 0; root < n; ++root)
+    {
+      if (parent[root] != -1)
+        continue;
+
+      idx_t top = 0;
+      stack[0] = root;
+      while (top >= 0)
+      {
+        idx_t p = stack[top];
+        idx_t child = head[p];
+        if (child == -1)
+        {
+          --top;
+          post[k++] = p;
+        }
+        else
+        {
+          head[p] = next[child];
+          stack[++top] = child;
+        }
+      }
+    }
+  }
+
+
+  /**
+   * Return the elimination tree, its postorder, the column counts of the
+   * Cholesky factor and the starts of the fundamental supernodes, for the
+   * reordered graph.
+   */
+  py::object
+  wrap_symbolic_analysis(const py::object &xadj_py, const py::object &adjncy_py,
+      const py::object &perm_py, const py::object &iperm_py)
+  {
+    ordered_graph_input g(xadj_py, adjncy_py, perm_py, iperm_py);
+    idx_t n = g.nvtxs;
+
+    array_for_py<idx_t> parent(n), post(n), colcount(n);
+    std::vector<idx_t> sn_starts;
+    {
+      py::gil_scoped_release release;
+      elimination_tree(n, g.xadj.get(), g.adjncy.get(),
+          g.perm.get(), g.iperm->get(), parent.get());
+      column_counts(n, g.xadj.get(), g.adjncy.get(),
+          g.perm.get(), g.iperm->get(), parent.get(), colcount.get());
+      tree_postorder(n, parent.get(), post.get());
+
+      // Column j+1 continues the fundamental supernode of column j if j is
+      // its only child and the structure of column j is that of j+1 plus j.
+      std::vector<idx_t> nchildren(n, 0);
+      for (idx_t j = 0; j < n; ++j)
+        if (parent.get()[j] != -1)
+          ++nchildren[parent.get()[j]];
+
+      for (idx_t j = 0; j < n; ++j)
+        if (j == 0
+            || parent.get()[j-1] != j
+            || nchildren[j] != 1
+            || colcount.get()[j-1] != colcount.get()[j] + 1)
+          sn_starts.push_back(j);
+      sn_starts.push_back(n);
+    }
+
+    array_for_py<idx_t> supernodes(sn_starts.size());
+    std::copy(sn_starts.begin(), sn_starts.end(), supernodes.get());
+
+    return py::make_tuple(parent.as_array(), post.as_array(),
+        colcount.as_array(), supernodes.as_array());
+  }
+
+  // }}}
+
+
+  /**
+   * This function verifies that the partitioning was computed correctly.
+   */
+  int
+  wrap_verify_nd(const py::object &perm_py, const py::object &iperm_py)
+  {
+    int rcode=0;
+    idx_t i;
+    idx_t nvtxs = py::len(perm_py);
+
+    array_from_py<idx_t> perm_ary("perm", perm_py, false);
+    array_from_py<idx_t> iperm_ary("iperm", iperm_py, false);
+    idx_t *perm = perm_ary.get();
+    idx_t *iperm = iperm_ary.get();
+
+    for (i=0; i<nvtxs; i++)
+      if (i != perm[iperm[i]])
+        rcode = 1;
+
+    for (i=0; i<nvtxs; i++)
+      if (i != iperm[perm[i]])
+        rcode = 2;
+
+    return rcode;
+  }
+
+
+  py::object
+  wrap_node_nd(const py::object &xadj_py, const py::object &adjncy_py,
+      const py::object &vwgt_py,
+      metis_options &options,
+      const py::object &perm_out_py,
+      const py::object &iperm_out_py,
+      bool return_stats,
+      bool collect_timings,
+      size_t max_memory)
+  {
+    array_from_py<idx_t> xadj("xadj", xadj_py, false);
+    if (xadj.size() == 0)
+      throw py::value_error("xadj cannot be empty");
+
+    idx_t nvtxs = xadj.size() - 1;
+
+    array_from_py<idx_t> adjncy("adjncy", adjncy_py, false);
+
+    array_from_py<idx_t> vwgt("vwgt", vwgt_py, false, false);
+
+    if (vwgt.size() != 0 && vwgt.size() != nvtxs)
+      throw py::value_error("vwgt must be empty or have length nvtxs");
+
+    array_for_py<idx_t> perm("perm_out", perm_out_py, nvtxs);
+    array_for_py<idx_t> iperm("iperm_out", iperm_out_py, nvtxs);
+
+    // Take a private copy so that other threads may keep using (and
+    // modifying) the Options object while METIS runs without the GIL.
+    metis_options opts(options);
+
+    if (return_stats)
+      check_graph(xadj, adjncy);
+
+    std::unique_ptr<timing_collector> timings;
+    if (collect_timings)
+    {
+      timing_collector::enable(opts);
+      timings.reset(new timing_collector);
+    }
+
+    std::unique_ptr<memory_monitor> memory;
+    if (collect_timings || max_memory)
+      memory.reset(new memory_monitor(max_memory));
+
+    int info;
+    std::unique_ptr<ordering_stats> stats;
+    {
+      py::gil_scoped_release release;
+      info = METIS_NodeND(
+        &nvtxs, xadj.get(), adjncy.get(), vwgt.get(), opts.m_options,
+        perm.get(), iperm.get());
+      if (info == METIS_OK && return_stats)
+        stats.reset(new ordering_stats(
+              nvtxs, xadj.get(), adjncy.get(), perm.get(), iperm.get()));
+    }
+
+    if (memory)
+      memory->check();
+    assert_ok(info, "METIS_NodeND failed");
+
+    py::tuple result = py::make_tuple(perm.as_array(), iperm.as_array());
+    if (return_stats)
+      result = result + py::make_tuple(stats->as_tuple());
+    if (timings)
+      result = result + py::make_tuple(timings->as_tuple(*memory));
+    return std::move(result);
+  }
+
+
+  /**
+   * Nested dissection with METIS_NodeNDP, which additionally records the
+   * sizes of the subdomains and separators of the top ``log2(npes)``
+   * levels of the separator tree.
+   */
+  py::object
+  wrap_node_ndp(const py::object &xadj_py, const py::object &adjncy_py,
+      const py::object &vwgt_py,
+      idx_t npes,
+      metis_options &options,
+      const py::object &perm_out_py,
+      const py::object &iperm_out_py,
+      bool return_stats,
+      bool collect_timings,
+      size_t max_memory)
+  {
+    if (npes < 2 || (npes & (npes - 1)) != 0)
+      throw py::value_error("npes must be a power of two, at least 2");
+
+    array_from_py<idx_t> xadj("xadj", xadj_py, false);
+    if (xadj.size() == 0)
+      throw py::value_error("xadj cannot be empty");
+
+    idx_t nvtxs = xadj.size() - 1;
+
+    array_from_py<idx_t> adjncy("adjncy", adjncy_py, false);
+    if (adjncy.size() < size_t(xadj.get()[nvtxs]))
+      throw py::value_error("adjncy is shorter than indicated by xadj");
+
+    array_from_py<idx_t> vwgt("vwgt", vwgt_py, false, false);
+
+    if (vwgt.size() != 0 && vwgt.size() != nvtxs)
+      throw py::value_error("vwgt must be empty or have length nvtxs");
+
+    array_for_py<idx_t> perm("perm_out", perm_out_py, nvtxs);
+    array_for_py<idx_t> iperm("iperm_out", iperm_out_py, nvtxs);
+    array_for_py<idx_t> sizes(2*npes - 1);
+    std::fill(sizes.get(), sizes.get() + 2*npes - 1, 0);
+
+    metis_options opts(options);
+
+    if (return_stats)
+      check_graph(xadj, adjncy);
+
+    std::unique_ptr<timing_collector> timings;
+    if (collect_timings)
+    {
+      timing_collector::enable(opts);
+      timings.reset(new timing_collector);
+    }
+
+    std::unique_ptr<memory_monitor> memory;
+    if (collect_timings || max_memory)
+      memory.reset(new memory_monitor(max_memory));
+
+    int info = METIS_OK;
+    std::unique_ptr<ordering_stats> stats;
+    {
+      py::gil_scoped_release release;
+      if (nvtxs)
+        info = METIS_NodeNDP(
+          nvtxs, xadj.get(), adjncy.get(), vwgt.get(), npes, opts.m_options,
+          perm.get(), iperm.get(), sizes.get());
+      if (info == METIS_OK && return_stats)
+        stats.reset(new ordering_stats(
+              nvtxs, xadj.get(), adjncy.get(), perm.get(), iperm.get()));
+    }
+
+    if (memory)
+      memory->check();
+    assert_ok(info, "METIS_NodeNDP failed");
+
+    py::tuple result = py::make_tuple(
+        perm.as_array(), iperm.as_array(), sizes.as_array());
+    if (return_stats)
+      result = result + py::make_tuple(stats->as_tuple());
+    if (timings)
+      result = result + py::make_tuple(timings->as_tuple(*memory));
+    return std::move(result);
+  }
+
+
+  py::object
+  wrap_compute_vertex_separator(
+      const py::object &xadj_py, const py::object &adjncy_py,
+      const py::object &vwgt_py,
+      metis_options &options,
+      const py::object &out_py)
+  {
+    array_from_py<idx_t> xadj("xadj", xadj_py, false);
+    if (xadj.size() == 0)
+      throw py::value_error("xadj cannot be empty");
+
+    idx_t nvtxs = xadj.size() - 1;
+
+    array_from_py<idx_t> adjncy("adjncy", adjncy_py, false);
+    if (adjncy.size() < size_t(xadj.get()[nvtxs]))
+      throw py::value_error("adjncy is shorter than indicated by xadj");
+
+    array_from_py<idx_t> vwgt("vwgt", vwgt_py, false, false);
+
+    if (vwgt.size() != 0 && vwgt.size() != nvtxs)
+      throw py::value_error("vwgt must be empty or have length nvtxs");
+
+    array_for_py<idx_t> part("out", out_py, nvtxs);
+
+    metis_options opts(options);
+
+    idx_t sepsize = 0;
+    int info = METIS_OK;
+    if (nvtxs)
+    {
+      py::gil_scoped_release release;
+      info = METIS_ComputeVertexSeparator(
+        &nvtxs, xadj.get(), adjncy.get(), vwgt.get(), opts.m_options,
+        &sepsize, part.get());
+    }
+
+    assert_ok(info, "METIS_ComputeVertexSeparator failed");
+
+    return py::make_tuple(sepsize, part.as_array());
+  }
+
+
+  /**
+   * Improve the vertex separator *where* (0 and 1 for the two sides, 2 for
+   * the separator) with METIS_NodeRefine, which moves separator vertices
+   * while keeping the weight of either side below *ubfactor* times the
+   * larger one.
+   */
+  py::object
+  wrap_node_refine(
+      const py::object &xadj_py, const py::object &adjncy_py,
+      const py::object &vwgt_py,
+      const py::object &where_py,
+      real_t ubfactor,
+      const py::object &out_py)
+  {
+    array_from_py<idx_t> xadj("xadj", xadj_py, false);
+    array_from_py<idx_t> adjncy("adjncy", adjncy_py, false);
+    idx_t nvtxs = check_graph(xadj, adjncy);
+
+    array_from_py<idx_t> vwgt("vwgt", vwgt_py, false, false);
+    if (vwgt.size() != 0 && vwgt.size() != size_t(nvtxs))
+      throw py::value_error("vwgt must be empty or have length nvtxs");
+
+    array_from_py<idx_t> where("part", where_py, false);
+    if (where.size() != size_t(nvtxs))
+      throw py::value_error("part must have length nvtxs");
+    check_indices(where.get(), nvtxs, 3, "part");
+    for (idx_t v = 0; v < nvtxs; ++v)
+      if (where.get()[v] != 2)
+        for (idx_t j = xadj.get()[v]; j < xadj.get()[v+1]; ++j)
+        {
+          idx_t q = where.get()[adjncy.get()[j]];
+          if (q != 2 && q != where.get()[v])
+            throw py::value_error("part is not a vertex separator: "
+                "vertices " + std::to_string(v) + " and "
+                + std::to_string(adjncy.get()[j])
+                + " are adjacent but on different sides");
+        }
+
+    if (ubfactor < 1)
+      throw py::value_error("ubfactor must be at least 1");
+
+    array_for_py<idx_t> part("out", out_py, nvtxs);
+    int info = METIS_OK;
+    int64_t sepsize = 0;
+    {
+      py::gil_scoped_release release;
+      // *out* may be *part* itself
+      if (part.get() != where.get())
+        std::copy_n(where.get(), nvtxs, part.get());
+
+      if (nvtxs)
+      {
+        // all vertices may move to either side
+        std::vector<idx_t> hmarker(nvtxs, -1);
+        info = METIS_NodeRefine(nvtxs, xadj.get(), vwgt.get(), adjncy.get(),
+            part.get(), hmarker.data(), ubfactor);
+      }
+
+      for (idx_t v = 0; v < nvtxs; ++v)
+        if (part.get()[v] == 2)
+          sepsize += vwgt.get() ? vwgt.get()[v] : 1;
+    }
+
+    assert_ok(info, "METIS_NodeRefine failed");
+
+    return py::make_tuple(sepsize, part.as_array());
+  }
+
+
+  /**
+   * Renumber vertices with METIS_CacheFriendlyReordering, so that each part
+   * is contiguous and BFS-ordered. If *permute_graph*, also return the
+   * renumbered graph and weights, or None in their place.
+   */
+  py::object
+  wrap_cache_friendly_reordering(
+      const py::object &xadj_py, const py::object &adjncy_py,
+      const py::object &part_py,
+      const py::object &vwgt_py, const py::object &adjwgt_py,
+      bool permute_graph)
+  {
+    array_from_py<idx_t> xadj("xadj", xadj_py, false);
+    array_from_py<idx_t> adjncy("adjncy", adjncy_py, false);
+    idx_t nvtxs = check_graph(xadj, adjncy);
+    idx_t nedges = xadj.get()[nvtxs];
+
+    std::unique_ptr<array_from_py<idx_t>> part;
+    if (part_py.is_none())
+      part.reset(new array_from_py<idx_t>(std::vector<idx_t>(nvtxs, 0)));
+    else
+      part.reset(new array_from_py<idx_t>("part", part_py, false));
+    if (part->size() != size_t(nvtxs))
+      throw py::value_error("part must have length nvtxs");
+    check_indices(part->get(), nvtxs, std::numeric_limits<idx_t>::max(), "part");
+
+    array_from_py<idx_t> vwgt("vwgt", vwgt_py, false, false);
+    idx_t ncon = vwgt.ncols() ? vwgt.ncols() : 1;
+    if (vwgt.size() != 0 && vwgt.size() != size_t(nvtxs) * ncon)
+      throw py::value_error("vwgt must be empty or have shape (nvtxs,) or (nvtxs, ncon)");
+    array_from_py<idx_t> adjwgt("adjwgt", adjwgt_py, false, false);
+    if (adjwgt.size() != 0 && adjwgt.size() != size_t(nedges))
+      throw py::value_error("adjwgt must be empty or have the same length as adjncy");
+
+    array_for_py<idx_t> old2new(nvtxs), new2old(nvtxs);
+    std::unique_ptr<array_for_py<idx_t>> new_xadj, new_adjncy, new_vwgt, new_adjwgt;
+    if (permute_graph)
+    {
+      new_xadj.reset(new array_for_py<idx_t>(nvtxs + 1));
+      new_adjncy.reset(new array_for_py<idx_t>(nedges));
+      if (vwgt.size())
+        new_vwgt.reset(new array_for_py<idx_t>(vwgt.size()));
+      if (adjwgt.size())
+        new_adjwgt.reset(new array_for_py<idx_t>(nedges));
+    }
+
+    int info = METIS_OK;
+    {
+      py::gil_scoped_release release;
+
+      const idx_t *pxadj = xadj.get(), *padjncy = adjncy.get();
+      idx_t *po2n = old2new.get(), *pn2o = new2old.get();
+
+      if (nvtxs)
+        info = METIS_CacheFriendlyReordering(
+            nvtxs, xadj.get(), adjncy.get(), part->get(), po2n);
+
+      if (info == METIS_OK)
+      {
+        for (idx_t i = 0; i < nvtxs; ++i)
+          pn2o[po2n[i]] = i;
+
+        if (permute_graph)
+        {
+          idx_t *pnxadj = new_xadj->get(), *pnadjncy = new_adjncy->get();
+          pnxadj[0] = 0;
+          for (idx_t inew = 0; inew < nvtxs; ++inew)
+          {
+            idx_t i = pn2o[inew];
+            idx_t start = pnxadj[inew];
+            pnxadj[inew+1] = start + pxadj[i+1] - pxadj[i];
+
+            for (idx_t j = pxadj[i]; j < pxadj[i+1]; ++j)
+              pnadjncy[start + j - pxadj[i]] = po2n[padjncy[j]];
+            if (new_adjwgt)
+              std::copy(adjwgt.get() + pxadj[i], adjwgt.get() + pxadj[i+1],
+                  new_adjwgt->get() + start);
+            if (new_vwgt)
+              std::copy(vwgt.get() + i*ncon, vwgt.get() + (i+1)*ncon,
+                  new_vwgt->get() + inew*ncon);
+          }
+        }
+      }
+    }
+
+    assert_ok(info, "METIS_CacheFriendlyReordering failed");
+
+    if (!permute_graph)
+      return py::make_tuple(old2new.as_array(), new2old.as_array());
+
+    py::object new_vwgt_py = py::none();
+    if (new_vwgt)
+    {
+      new_vwgt_py = new_vwgt->as_array();
+      if (vwgt.ncols() && have_numpy())
+        new_vwgt_py = new_vwgt_py.attr("reshape")(nvtxs, ncon);
+    }
+
+    return py::make_tuple(old2new.as_array(), new2old.as_array(),
+        new_xadj->as_array(), new_adjncy->as_array(), new_vwgt_py,
+        new_adjwgt ? new_adjwgt->as_array() : py::object(py::none()));
+  }
+
+  // {{{ flattening of nested sequences
+
+  /**
+   * Convert the integer at *obj* as Python's ``int()`` would.
+   */
+  long long py_to_long_long(PyObject *obj)
+  {
+    long long result;
+    if (PyLong_Check(obj))
+      result = PyLong_AsLongLong(obj);
+    else
+    {
+      py::int_ as_int = py::reinterpret_borrow<py::object>(obj);
+      result = PyLong_AsLongLong(as_int.ptr());
+    }
+    if (result == -1 && PyErr_Occurred())
+      throw py::error_already_set();
+    return result;
+  }
+
+
+  /**
+   * Copy *n* indices from *src* to *dest*, checking that they lie in
+   * ``[0, bound)``. Return the largest index copied (or -1).
+   */
+  template <class S>
+  idx_t copy_indices(const S *src, size_t n, idx_t *dest, idx_t bound,
+      const char *what)
+  {
+    idx_t max_idx = -1;
+    for (size_t i = 0; i < n; ++i)
+    {
+      S v = src[i];
+      bool in_range;
+      if constexpr (std::is_signed<S>::value)
+        in_range = v >= 0 && (long long) v < (long long) bound;
+      else
+        in_range = (unsigned long long) v < (unsigned long long) bound;
+      if (!in_range)
+        throw_index_out_of_range(what, (long long) v);
+
+      dest[i] = idx_t(v);
+      max_idx = std::max(max_idx, dest[i]);
+    }
+    return max_idx;
+  }
+
+
+  /**
+   * A sequence or mapping *rows* such that ``rows[i]`` for ``i`` in
+   * ``range(len(rows))`` is a sequence (or integer buffer) of indices, as
+   * used for Pythonic graphs and mesh connectivities. Flattening happens in
+   * two passes: one to determine the row lengths (and thereby the size of the
+   * output), one to fill the output while checking indices.
+   */
+  class py_rows
+  {
+    PyObject *m_rows;
+    bool m_is_list;
+    idx_t m_size;
+
+    public:
+      py_rows(const py::object &rows)
+      : m_rows(rows.ptr()), m_is_list(PyList_Check(rows.ptr()))
+      {
+        Py_ssize_t size = PyObject_Length(m_rows);
+        if (size < 0)
+          throw py::error_already_set();
+        m_size = size;
+      }
+
+      idx_t size() const
+      {
+        return m_size;
+      }
+
+      py::object operator[](idx_t i) const
+      {
+        if (m_is_list)
+          return py::reinterpret_borrow<py::object>(PyList_GET_ITEM(m_rows, i));
+
+        py::object row = py::reinterpret_steal<py::object>(
+            PyObject_GetItem(m_rows, py::int_(i).ptr()));
+        if (!row)
+          throw py::error_already_set();
+        return row;
+      }
+
+      /**
+       * Fill *starts* (of length ``size() + 1``) with the offsets of the
+       * rows in the flattened array.
+       */
+      void get_starts(idx_t *starts) const
+      {
+        starts[0] = 0;
+        for (idx_t i = 0; i < m_size; ++i)
+        {
+          Py_ssize_t len = PyObject_Length((*this)[i].ptr());
+          if (len < 0)
+            throw py::error_already_set();
+          starts[i+1] = starts[i] + len;
+        }
+      }
+
+      /**
+       * Copy the rows into *dest*, at the offsets given by *starts*, checking
+       * that all entries lie in ``[0, bound)``. Return the largest entry
+       * (or -1).
+       */
+      idx_t flatten(const idx_t *starts, idx_t *dest, idx_t bound,
+          const char *what) const
+      {
+        idx_t max_idx = -1;
+        for (idx_t i = 0; i < m_size; ++i)
+        {
+          py::object row = (*this)[i];
+          idx_t *row_dest = dest + starts[i];
+          size_t len = starts[i+1] - starts[i];
+          if (len == 0)
+            continue;
+
+          if (PyObject_CheckBuffer(row.ptr()))
+          {
+            std::unique_ptr<py_buffer_wrapper> buf;
+            try
+            {
+              buf.reset(new py_buffer_wrapper(what, row.ptr(),
+                    PyBUF_FORMAT | PyBUF_C_CONTIGUOUS, false));
+            }
+            catch (not_a_buffer_error &)
+            { }
+
+            bool copied = false;
+            if (buf.get())
+            {
+              if (buf->m_buf.ndim != 1
+                  || size_t(buf->m_buf.len / buf->m_buf.itemsize) != len)
+                throw py::value_error(std::string(what)
+                    + " changed size during conversion");
+
+              dispatch_on_buffer_type(buf->m_buf, [&](auto *src)
+                  {
+                    using S = std::remove_cv_t<std::remove_pointer_t<decltype(src)>>;
+                    // floating point values take the slow path below,
+                    // to get the exact semantics of int()
+                    if constexpr (std::is_integral<S>::value)
+                    {
+                      max_idx = std::max(max_idx,
+                          copy_indices(src, len, row_dest, bound, what));
+                      copied = true;
+                    }
+                  });
+            }
+            if (copied)
+              continue;
+          }
+
+          py::object fast = py::reinterpret_steal<py::object>(
+              PySequence_Fast(row.ptr(), "entries must be sequences"));
+          if (!fast)
+            throw py::error_already_set();
+          if (size_t(PySequence_Fast_GET_SIZE(fast.ptr())) != len)
+            throw py::value_error(std::string(what)
+                + " changed size during conversion");
+
+          PyObject **items = PySequence_Fast_ITEMS(fast.ptr());
+          for (size_t j = 0; j < len; ++j)
+          {
+            long long v = py_to_long_long(items[j]);
+            if (v < 0 || v >= (long long) bound)
+              throw_index_out_of_range(what, v);
+            row_dest[j] = v;
+            max_idx = std::max(max_idx, row_dest[j]);
+          }
+        }
+        return max_idx;
+      }
+  };
+
+
+  /**
+   * Convert a Pythonic graph to ``(xadj, adjncy)``.
+   */
+  py::object
+  wrap_csr_from_adjacency(const py::object &adjacency_py)
+  {
+    py_rows rows(adjacency_py);
+    idx_t nvtxs = rows.size();
+
+    array_for_py<idx_t> xadj(nvtxs + 1);
+    rows.get_starts(xadj.get());
+
+    array_for_py<idx_t> adjncy(xadj.get()[nvtxs]);
+    rows.flatten(xadj.get(), adjncy.get(), nvtxs, "adjacency");
+
+    return py::make_tuple(xadj.as_array(), adjncy.as_array());
+  }
+
+  // }}}
+
+
+  // {{{ native worker pool
+
+  /**
+   * Call ``f(i)`` for each ``i`` in ``[0, njobs)``, using up to *nthreads*
+   * native threads (including the calling one). *nthreads* == 0 means one
+   * per hardware thread. Must be called without the GIL, and *f* must not
+   * throw.
+   */
+  template <class F>
+  void run_in_parallel(size_t njobs, size_t nthreads, F f)
+  {
+    if (nthreads == 0)
+      nthreads = std::max(1u, std::thread::hardware_concurrency());
+    nthreads = std::min(nthreads, njobs);
+
+    std::atomic<size_t> next(0);
+    auto worker = [&]()
+    {
+      for (size_t i = next++; i < njobs; i = next++)
+        f(i);
+    };
+
+    std::vector<std::thread> workers;
+    for (size_t t = 1; t < nthreads; ++t)
+    {
+      try
+      {
+        workers.emplace_back(worker);
+      }
+      catch (std::system_error &)
+      {
+        // could not start another thread: make do with what we have
+        break;
+      }
+    }
+
+    worker();
+
+    for (auto &w: workers)
+      w.join();
+  }
+
+  // }}}
+
+
+  // {{{ graph partitioning
+
+  /**
+   * CSR graph with its weights, pinned for use by METIS.
+   */
+  struct graph_input : public noncopyable
+  {
+    array_from_py<idx_t> xadj;
+    idx_t nvtxs;
+    array_from_py<idx_t> adjncy, vwgt, vsize, adjwgt;
+    idx_t ncon;
+
+    graph_input(
+        const py::object &xadj_py,
+        const py::object &adjncy_py,
+        const py::object &vwgt_py,
+        const py::object &vsize_py,
+        const py::object &adjwgt_py,
+        bool warn_on_copies)
+    : xadj("xadj", xadj_py, warn_on_copies),
+      nvtxs(xadj.size() == 0 ? 0 : xadj.size() - 1),
+      adjncy("adjncy", adjncy_py, warn_on_copies),
+      vwgt("vwgt", vwgt_py, warn_on_copies, false),
+      vsize("vsize", vsize_py, warn_on_copies, false),
+      adjwgt("adjwgt", adjwgt_py, warn_on_copies, false),
+      ncon(1)
+    {
+      if (xadj.size() == 0)
+        throw py::value_error("xadj cannot be empty");
+
+      idx_t nedges = xadj.get()[nvtxs];
+      if (nedges < 0 || adjncy.size() < size_t(nedges))
+        throw py::value_error("adjncy is shorter than indicated by xadj");
+      if (vwgt.size() != 0)
+      {
+        // multi-constraint weights are stored as (nvtxs, ncon), row-major
+        ncon = vwgt.ncols() ? vwgt.ncols() : (nvtxs ? vwgt.size() / nvtxs : 0);
+        if (ncon < 1 || vwgt.size() != size_t(nvtxs) * ncon)
+          throw py::value_error(
+              "vwgt must be empty or have shape (nvtxs,) or (nvtxs, ncon)");
+      }
+      if (vsize.size() != 0 && vsize.size() != size_t(nvtxs))
+        throw py::value_error("vsize must be empty or have length nvtxs");
+      if (adjwgt.size() != 0 && adjwgt.size() != size_t(nedges))
+        throw py::value_error("adjwgt must be empty or have the same length as adjncy");
+    }
+  };
+
+
+  /**
+   * One call to METIS_PartGraph{Recursive,Kway}. Construction (which
+   * requires the GIL) converts and validates the inputs, :meth:`run` may be
+   * called without the GIL.
+   */
+  struct part_graph_job : public noncopyable
+  {
+    std::shared_ptr<graph_input> graph;
+    idx_t nparts;
+    array_from_py<real_t> tpwgts, ubvec;
+    metis_options options;
+    bool recursive;
+
+    array_for_py<idx_t> part;
+    idx_t edgecut = 0;
+    int info = METIS_OK;
+
+    part_graph_job(
+        std::shared_ptr<graph_input> graph_,
+        idx_t nparts_,
+        const py::object &tpwgts_py,
+        const py::object &ubvec_py,
+        const metis_options &options_,
+        bool recursive_,
+        bool warn_on_copies,
+        const py::object &out_py = py::none())
+    : graph(graph_), nparts(nparts_),
+      tpwgts("tpwgts", tpwgts_py, warn_on_copies, false),
+      ubvec("ubvec", ubvec_py, warn_on_copies, false),
+      // private copy, so that the Options object may be used (and modified)
+      // by other threads while METIS runs without the GIL
+      options(options_),
+      recursive(recursive_),
+      part("out", out_py, graph->nvtxs)
+    {
+      if (nparts < 1)
+        throw py::value_error("nparts must be positive");
+
+      idx_t ncon = graph->ncon;
+      if (tpwgts.size() != 0
+          && (tpwgts.size() != size_t(nparts*ncon)
+            || (tpwgts.ncols() != 0 && tpwgts.ncols() != size_t(ncon))))
+        throw py::value_error(
+            "tpwgts must be empty or have shape (nparts,) or (nparts, ncon)");
+      for (size_t i = 0; i < tpwgts.size(); ++i)
+        if (tpwgts.get()[i] < 0)
+          throw py::value_error("The values of tpwgts should be non-negative");
+
+      if (ubvec.size() != 0 && ubvec.size() != size_t(ncon))
+        throw py::value_error("ubvec must be empty or have length ncon");
+      for (size_t i = 0; i < ubvec.size(); ++i)
+        if (ubvec.get()[i] < 1)
+          throw py::value_error("The values of ubvec should be at least 1");
+    }
+
+    void run()
+    {
+      if (nparts == 1)
+      {
+        // metis has a bug in this case--it disregards the index base
+        std::fill(part.get(), part.get() + graph->nvtxs, 0);
+        edgecut = 0;
+        return;
+      }
+
+      idx_t nvtxs = graph->nvtxs;
+      idx_t ncon = graph->ncon;
+      real_t *pubvec = ubvec.get();
+
+      if (recursive)
+        info = METIS_PartGraphRecursive(
+          &nvtxs, &ncon, graph->xadj.get(), graph->adjncy.get(),
+          graph->vwgt.get(), graph->vsize.get(), graph->adjwgt.get(),
+          &nparts, tpwgts.get(), pubvec, options.m_options,
+          &edgecut, part.get());
+      else
+        info = METIS_PartGraphKway(
+          &nvtxs, &ncon, graph->xadj.get(), graph->adjncy.get(),
+          graph->vwgt.get(), graph->vsize.get(), graph->adjwgt.get(),
+          &nparts, tpwgts.get(), pubvec, options.m_options,
+          &edgecut, part.get());
+    }
+
+    const char *failure_message() const
+    {
+      return recursive
+        ? "METIS_PartGraphRecursive failed"
+        : "METIS_PartGraphKway failed";
+    }
+
+    py::object result()
+    {
+      assert_ok(info, failure_message());
+      return py::make_tuple(edgecut, part.as_array());
+    }
+  };
+
+
+  py::object
+  wrap_part_graph(
+      idx_t nparts,
+      const py::object &xadj_py,
+      const py::object &adjncy_py,
+      const py::object &vwgt_py,
+      const py::object &vsize_py,
+      const py::object &adjwgt_py,
+      const py::object &tpwgts_py,
+      const py::object &ubvec_py,
+      metis_options &options,
+      bool recursive,
+      bool warn_on_copies,
+      const py::object &out_py,
+      bool collect_timings,
+      size_t max_memory
+    )
+  {
+    part_graph_job job(
+        std::make_shared<graph_input>(
+          xadj_py, adjncy_py, vwgt_py, vsize_py, adjwgt_py, warn_on_copies),
+        nparts, tpwgts_py, ubvec_py, options, recursive, warn_on_copies,
+        out_py);
+
+    std::unique_ptr<timing_collector> timings;
+    if (collect_timings)
+    {
+      timing_collector::enable(job.options);
+      timings.reset(new timing_collector);
+    }
+
+    std::unique_ptr<memory_monitor> memory;
+    if (collect_timings || max_memory)
+      memory.reset(new memory_monitor(max_memory));
+
+    {
+      py::gil_scoped_release release;
+      job.run();
+    }
+
+    if (memory)
+      memory->check();
+    if (timings)
+      return py::make_tuple(job.result(), timings->as_tuple(*memory));
+    return job.result();
+  }
+
+
+  py::list
+  wrap_part_graph_many(
+      const py::sequence &nparts_py,
+      const py::sequence &xadjs_py,
+      const py::sequence &adjncys_py,
+      const py::sequence &vwgts_py,
+      const py::sequence &vsizes_py,
+      const py::sequence &adjwgts_py,
+      const py::sequence &tpwgts_py,
+      const py::sequence &ubvecs_py,
+      const py::sequence &options_py,
+      const py::sequence &recursive_py,
+      size_t nthreads,
+      bool warn_on_copies
+    )
+  {
+    size_t njobs = py::len(xadjs_py);
+    for (const py::sequence *seq: {
+        &nparts_py, &adjncys_py, &vwgts_py, &vsizes_py, &adjwgts_py,
+        &tpwgts_py, &ubvecs_py, &options_py, &recursive_py})
+      if (py::len(*seq) != njobs)
+        throw py::value_error("all per-graph arguments must have the same length");
+
+    std::vector<std::unique_ptr<part_graph_job>> jobs;
+    jobs.reserve(njobs);
+    for (size_t i = 0; i < njobs; ++i)
+    {
+      idx_t nparts = py::cast<idx_t>(nparts_py[i]);
+      py::object recursive = recursive_py[i];
+
+      jobs.emplace_back(new part_graph_job(
+          std::make_shared<graph_input>(
+            xadjs_py[i], adjncys_py[i],
+            vwgts_py[i], vsizes_py[i], adjwgts_py[i], warn_on_copies),
+          nparts, tpwgts_py[i], ubvecs_py[i],
+          py::cast<const metis_options &>(options_py[i]),
+          recursive.is_none() ? nparts <= 8 : py::cast<bool>(recursive),
+          warn_on_copies));
+    }
+
+    {
+      py::gil_scoped_release release;
+      run_in_parallel(njobs, nthreads, [&](size_t i) { jobs[i]->run(); });
+    }
+
+    py::list result;
+    for (size_t i = 0; i < njobs; ++i)
+    {
+      assert_ok(jobs[i]->info,
+          (std::string(jobs[i]->failure_message())
+           + " for graph " + std::to_string(i)).c_str());
+      result.append(jobs[i]->result());
+    }
+    return result;
+  }
+
+  /**
+   * Run one METIS partitioning per entry of *seeds* concurrently, sharing
+   * the (read-only) graph input, and return
+   * ``(best_index, objvals, (objval, part))`` for the trial with the
+   * smallest objective value.
+   */
+  py::object
+  wrap_part_graph_best_of(
+      idx_t nparts,
+      const py::object &xadj_py,
+      const py::object &adjncy_py,
+      const py::object &vwgt_py,
+      const py::object &vsize_py,
+      const py::object &adjwgt_py,
+      const py::object &tpwgts_py,
+      const py::object &ubvec_py,
+      metis_options &options,
+      bool recursive,
+      const py::sequence &seeds_py,
+      size_t nthreads,
+      bool warn_on_copies
+    )
+  {
+    size_t ntrials = py::len(seeds_py);
+    if (ntrials == 0)
+      throw py::value_error("need at least one trial");
+
+    auto graph = std::make_shared<graph_input>(
+          xadj_py, adjncy_py, vwgt_py, vsize_py, adjwgt_py, warn_on_copies);
+
+    std::vector<std::unique_ptr<part_graph_job>> jobs;
+    jobs.reserve(ntrials);
+    for (size_t i = 0; i < ntrials; ++i)
+    {
+      jobs.emplace_back(new part_graph_job(
+            graph, nparts, tpwgts_py, ubvec_py, options, recursive,
+            warn_on_copies));
+      jobs.back()->options.set(METIS_OPTION_SEED, py::cast<idx_t>(seeds_py[i]));
+    }
+
+    {
+      py::gil_scoped_release release;
+      run_in_parallel(ntrials, nthreads, [&](size_t i) { jobs[i]->run(); });
+    }
+
+    py::list objvals;
+    size_t best = 0;
+    for (size_t i = 0; i < ntrials; ++i)
+    {
+      assert_ok(jobs[i]->info,
+          (std::string(jobs[i]->failure_message())
+           + " for trial " + std::to_string(i)).c_str());
+      objvals.append(jobs[i]->edgecut);
+      if (jobs[i]->edgecut < jobs[best]->edgecut)
+        best = i;
+    }
+
+    return py::make_tuple(best, objvals, jobs[best]->result());
+  }
+
+  // }}}
+
+
+  // {{{ partition quality
+
+  /**
+   * Union-find with path halving, for tracking the connected components of
+   * the parts.
+   */
+  class disjoint_sets
+  {
+    std::vector<idx_t> m_parent;
+
+    public:
+      disjoint_sets(idx_t n)
+      : m_parent(n)
+      {
+        for (idx_t i = 0; i < n; ++i)
+          m_parent[i] = i;
+      }
+
+      idx_t find(idx_t i)
+      {
+        while (m_parent[i] != i)
+          i = m_parent[i] = m_parent[m_parent[i]];
+        return i;
+      }
+
+      void unite(idx_t i, idx_t j)
+      {
+        i = find(i);
+        j = find(j);
+        if (i != j)
+          m_parent[std::max(i, j)] = std::min(i, j);
+      }
+  };
+
+
+  /**
+   * Compute quality metrics of the partition *part_py* of a graph in a
+   * single pass over its adjacency. If *nparts* is negative, it is taken to
+   * be one more than the largest part number.
+   */
+  py::object
+  wrap_partition_stats(
+      const py::object &xadj_py,
+      const py::object &adjncy_py,
+      const py::object &part_py,
+      const py::object &vwgt_py,
+      const py::object &vsize_py,
+      const py::object &adjwgt_py,
+      idx_t nparts,
+      bool warn_on_copies)
+  {
+    graph_input graph(xadj_py, adjncy_py, vwgt_py, vsize_py, adjwgt_py,
+        warn_on_copies);
+    idx_t nvtxs = graph.nvtxs;
+    idx_t ncon = graph.ncon;
+
+    array_from_py<idx_t> part("part", part_py, warn_on_copies);
+    if (part.size() != size_t(nvtxs))
+      throw py::value_error("part must have length nvtxs");
+    idx_t max_part = check_indices(
+        part.get(), nvtxs, std::numeric_limits<idx_t>::max(), "part");
+    if (nparts < 0)
+      nparts = max_part + 1;
+    else if (max_part >= nparts)
+      throw_index_out_of_range("part", max_part);
+
+    array_for_py<idx_t> comm_volume(nparts), pwgts(size_t(nparts) * ncon),
+      boundary(nparts), neighbor_parts(nparts), components(nparts);
+    array_for_py<real_t> imbalance(ncon);
+    int64_t edgecut = 0, total_volume = 0, max_volume = 0;
+    bool bad_index = false;
+
+    {
+      py::gil_scoped_release release;
+
+      const idx_t *xadj = graph.xadj.get(), *adjncy = graph.adjncy.get();
+      const idx_t *vwgt = graph.vwgt.get(), *vsize = graph.vsize.get();
+      const idx_t *adjwgt = graph.adjwgt.get(), *where = part.get();
+      idx_t *pvol = comm_volume.get(), *ppwgts = pwgts.get();
+      idx_t *pbnd = boundary.get(), *pnbrs = neighbor_parts.get();
+      idx_t *pcomps = components.get();
+
+      std::fill(pvol, pvol + nparts, 0);
+      std::fill(ppwgts, ppwgts + nparts*ncon, 0);
+      std::fill(pbnd, pbnd + nparts, 0);
+      std::fill(pnbrs, pnbrs + nparts, 0);
+      std::fill(pcomps, pcomps + nparts, 0);
+
+      disjoint_sets sets(nvtxs);
+      // (part, adjacent part) pairs, deduplicated at the end
+      std::vector<std::pair<idx_t, idx_t>> part_pairs;
+      // marker[q] == v if part q has been seen among the neighbors of v
+      std::vector<idx_t> marker(nparts, -1);
+
+      for (idx_t v = 0; v < nvtxs && !bad_index; ++v)
+      {
+        idx_t p = where[v];
+        for (idx_t c = 0; c < ncon; ++c)
+          ppwgts[p*ncon + c] += vwgt ? vwgt[v*ncon + c] : 1;
+
+        idx_t nforeign = 0;
+        for (idx_t j = xadj[v]; j < xadj[v+1]; ++j)
+        {
+          idx_t u = adjncy[j];
+          if (u < 0 || u >= nvtxs)
+          {
+            bad_index = true;
+            break;
+          }
+
+          idx_t q = where[u];
+          if (q == p)
+            sets.unite(u, v);
+          else
+          {
+            edgecut += adjwgt ? adjwgt[j] : 1;
+            if (marker[q] != v)
+            {
+              marker[q] = v;
+              ++nforeign;
+              part_pairs.emplace_back(p, q);
+            }
+          }
+        }
+
+        if (nforeign)
+        {
+          ++pbnd[p];
+          pvol[p] += (vsize ? vsize[v] : 1) * nforeign;
+        }
+      }
+
+      if (!bad_index)
+      {
+        std::sort(part_pairs.begin(), part_pairs.end());
+        part_pairs.erase(std::unique(part_pairs.begin(), part_pairs.end()),
+            part_pairs.end());
+        for (const auto &pq: part_pairs)
+          ++pnbrs[pq.first];
+
+        for (idx_t v = 0; v < nvtxs; ++v)
+          if (sets.find(v) == v)
+            ++pcomps[where[v]];
+
+        // every cut edge is seen from both of its ends
+        edgecut /= 2;
+        for (idx_t p = 0; p < nparts; ++p)
+        {
+          total_volume += pvol[p];
+          max_volume = std::max(max_volume, int64_t(pvol[p]));
+        }
+
+        for (idx_t c = 0; c < ncon; ++c)
+        {
+          int64_t total = 0, max_pwgt = 0;
+          for (idx_t p = 0; p < nparts; ++p)
+          {
+            total += ppwgts[p*ncon + c];
+            max_pwgt = std::max(max_pwgt, int64_t(ppwgts[p*ncon + c]));
+          }
+          imbalance.get()[c] = total ? real_t(max_pwgt) * nparts / total : 1;
+        }
+      }
+    }
+
+    if (bad_index)
+      throw py::value_error("adjncy refers to a vertex which is out of range");
+
+    py::object pwgts_py = pwgts.as_array();
+    if (graph.vwgt.ncols() && have_numpy())
+      pwgts_py = pwgts_py.attr("reshape")(nparts, ncon);
+
+    return py::make_tuple(edgecut, total_volume, max_volume,
+        comm_volume.as_array(), pwgts_py, imbalance.as_array(),
+        boundary.as_array(), neighbor_parts.as_array(), components.as_array());
+  }
+
+  // }}}
+
+
+  // {{{ partition repair
+
+  /**
+   * Make each part of *where* connected, following EliminateComponents in
+   * libmetis/contig.c: the heaviest component of each part stays, the
+   * others are moved to the adjacent part to which they are most strongly
+   * connected, preferring better balance among those with at least half the
+   * best connectivity (for a single constraint). Components without any
+   * settled neighbor (e.g. connected components of the whole graph) stay
+   * where they are. Return the number of components moved.
+   */
+  idx_t eliminate_components(const graph_input &graph, idx_t nparts,
+      idx_t *where)
+  {
+    idx_t nvtxs = graph.nvtxs, ncon = graph.ncon;
+    const idx_t *xadj = graph.xadj.get(), *adjncy = graph.adjncy.get();
+    const idx_t *vwgt = graph.vwgt.get(), *adjwgt = graph.adjwgt.get();
+
+    auto weight = [&](idx_t v, idx_t c) { return vwgt ? vwgt[v*ncon + c] : 1; };
+
+    // {{{ find the components of each part, by BFS
+
+    std::vector<idx_t> cmp(nvtxs, -1), cptr(1, 0), cind(nvtxs);
+    idx_t ncmps = 0, last = 0;
+    for (idx_t root = 0; root < nvtxs; ++root)
+    {
+      if (cmp[root] != -1)
+        continue;
+
+      cmp[root] = ncmps;
+      cind[last++] = root;
+      for (idx_t first = cptr[ncmps]; first < last; ++first)
+      {
+        idx_t v = cind[first];
+        for (idx_t j = xadj[v]; j < xadj[v+1]; ++j)
+        {
+          idx_t u = adjncy[j];
+          if (cmp[u] == -1 && where[u] == where[v])
+          {
+            cmp[u] = ncmps;
+            cind[last++] = u;
+          }
+        }
+      }
+      cptr.push_back(last);
+      ++ncmps;
+    }
+
+    // empty parts have no components, so compare with the non-empty ones
+    std::vector<char> nonempty(nparts, 0);
+    for (idx_t v = 0; v < nvtxs; ++v)
+      nonempty[where[v]] = 1;
+    if (ncmps <= std::count(nonempty.begin(), nonempty.end(), 1))
+      return 0;
+
+    // }}}
+
+    std::vector<int64_t> pwgts(size_t(nparts)*ncon, 0), cwgts(size_t(ncmps)*ncon, 0);
+    std::vector<int64_t> totals(ncon, 0);
+    for (idx_t v = 0; v < nvtxs; ++v)
+      for (idx_t c = 0; c < ncon; ++c)
+      {
+        pwgts[where[v]*ncon + c] += weight(v, c);
+        cwgts[cmp[v]*ncon + c] += weight(v, c);
+        totals[c] += weight(v, c);
+      }
+
+    auto total_cwgt = [&](idx_t cid)
+    {
+      int64_t result = 0;
+      for (idx_t c = 0; c < ncon; ++c)
+        result += cwgts[cid*ncon + c];
+      return result;
+    };
+
+    // keep the heaviest component of each part
+    std::vector<idx_t> best(nparts, -1);
+    for (idx_t cid = 0; cid < ncmps; ++cid)
+    {
+      idx_t p = where[cind[cptr[cid]]];
+      if (best[p] == -1 || total_cwgt(best[p]) < total_cwgt(cid))
+        best[p] = cid;
+    }
+
+    std::vector<idx_t> cwhere(nvtxs, -1), todo;
+    for (idx_t cid = 0; cid < ncmps; ++cid)
+    {
+      idx_t p = where[cind[cptr[cid]]];
+      if (best[p] == cid)
+        for (idx_t j = cptr[cid]; j < cptr[cid+1]; ++j)
+          cwhere[cind[j]] = p;
+      else
+        todo.push_back(cid);
+    }
+
+    // the largest relative weight of *target* after adding component *cid*
+    auto load_after = [&](idx_t target, idx_t cid)
+    {
+      double result = 0;
+      for (idx_t c = 0; c < ncon; ++c)
+        if (totals[c])
+          result = std::max(result,
+              double(pwgts[target*ncon + c] + cwgts[cid*ncon + c]) / totals[c]);
+      return result;
+    };
+
+    std::vector<int64_t> conn(nparts, 0);
+    std::vector<idx_t> touched;
+    idx_t nmoved = 0;
+    while (!todo.empty())
+    {
+      size_t old_ntodo = todo.size();
+      for (size_t i = 0; i < todo.size(); )
+      {
+        idx_t cid = todo[i];
+        idx_t me = where[cind[cptr[cid]]];
+
+        // connectivity to the settled vertices of each part
+        touched.clear();
+        for (idx_t j = cptr[cid]; j < cptr[cid+1]; ++j)
+        {
+          idx_t v = cind[j];
+          for (idx_t jj = xadj[v]; jj < xadj[v+1]; ++jj)
+          {
+            idx_t q = cwhere[adjncy[jj]];
+            if (q == -1)
+              continue;
+            if (conn[q] == 0)
+              touched.push_back(q);
+            conn[q] += adjwgt ? adjwgt[jj] : 1;
+          }
+        }
+
+        if (touched.empty())
+        {
+          ++i;
+          continue;
+        }
+
+        int64_t best_conn = 0;
+        for (idx_t q: touched)
+          best_conn = std::max(best_conn, conn[q]);
+
+        idx_t target = -1;
+        for (idx_t q: touched)
+        {
+          if (ncon == 1 ? 2*conn[q] < best_conn : conn[q] < best_conn)
+            continue;
+          if (target == -1 || load_after(q, cid) < load_after(target, cid)
+              || (load_after(q, cid) == load_after(target, cid)
+                && conn[q] > conn[target]))
+            target = q;
+        }
+        for (idx_t q: touched)
+          conn[q] = 0;
+
+        if (target != me)
+        {
+          for (idx_t c = 0; c < ncon; ++c)
+          {
+            pwgts[me*ncon + c] -= cwgts[cid*ncon + c];
+            pwgts[target*ncon + c] += cwgts[cid*ncon + c];
+          }
+          ++nmoved;
+        }
+        for (idx_t j = cptr[cid]; j < cptr[cid+1]; ++j)
+        {
+          where[cind[j]] = target;
+          cwhere[cind[j]] = target;
+        }
+
+        todo[i] = todo.back();
+        todo.pop_back();
+      }
+
+      if (todo.size() == old_ntodo)
+        break;
+    }
+
+    return nmoved;
+  }
+
+
+  py::object
+  wrap_make_contiguous(
+      const py::object &xadj_py,
+      const py::object &adjncy_py,
+      const py::object &part_py,
+      const py::object &vwgt_py,
+      const py::object &adjwgt_py,
+      idx_t nparts,
+      bool warn_on_copies,
+      const py::object &out_py)
+  {
+    graph_input graph(xadj_py, adjncy_py, vwgt_py, py::none(), adjwgt_py,
+        warn_on_copies);
+    idx_t nvtxs = graph.nvtxs;
+    check_indices(graph.adjncy.get(), graph.xadj.get()[nvtxs], nvtxs, "adjncy");
+
+    array_from_py<idx_t> part("part", part_py, warn_on_copies);
+    if (part.size() != size_t(nvtxs))
+      throw py::value_error("part must have length nvtxs");
+    idx_t max_part = check_indices(
+        part.get(), nvtxs, std::numeric_limits<idx_t>::max(), "part");
+    if (nparts < 0)
+      nparts = max_part + 1;
+    else if (max_part >= nparts)
+      throw_index_out_of_range("part", max_part);
+
+    array_for_py<idx_t> result("out", out_py, nvtxs);
+    idx_t nmoved;
+    {
+      py::gil_scoped_release release;
+      // *out* may be *part* itself
+      if (result.get() != part.get())
+        std::copy_n(part.get(), nvtxs, result.get());
+      nmoved = eliminate_components(graph, nparts, result.get());
+    }
+
+    return py::make_tuple(result.as_array(), nmoved);
+  }
+
+  // }}}
+
+
+  // {{{ partition refinement
+
+  /**
+   * Greedy k-way refinement of an existing partition, following
+   * Greedy_KWayCutOptimize in libmetis/kwayfm.c: boundary vertices are
+   * visited in random order and moved to the adjacent part that reduces the
+   * edge cut the most, subject to the balance bounds. Moves that keep the
+   * cut are made if they improve the balance, and vertices of overweight
+   * parts are moved to lighter neighbors regardless of the cut. Each pass
+   * takes time linear in the size of the graph; refinement stops after
+   * *niter* passes or once a pass moves nothing.
+   */
+  struct refine_kway_job : public noncopyable
+  {
+    graph_input graph;
+    idx_t nparts;
+    array_from_py<idx_t> initial_part;
+    array_from_py<real_t> tpwgts, ubvec;
+    idx_t niter, seed, ufactor;
+
+    array_for_py<idx_t> part;
+    int64_t edgecut = 0;
+
+    refine_kway_job(
+        const py::object &xadj_py,
+        const py::object &adjncy_py,
+        const py::object &vwgt_py,
+        const py::object &adjwgt_py,
+        const py::object &part_py,
+        idx_t nparts_,
+        const py::object &tpwgts_py,
+        const py::object &ubvec_py,
+        const metis_options &options,
+        bool warn_on_copies,
+        const py::object &out_py)
+    : graph(xadj_py, adjncy_py, vwgt_py, py::none(), adjwgt_py, warn_on_copies),
+      nparts(nparts_),
+      initial_part("part", part_py, warn_on_copies),
+      tpwgts("tpwgts", tpwgts_py, warn_on_copies, false),
+      ubvec("ubvec", ubvec_py, warn_on_copies, false),
+      niter(options.get(METIS_OPTION_NITER)),
+      seed(options.get(METIS_OPTION_SEED)),
+      ufactor(options.get(METIS_OPTION_UFACTOR)),
+      part("out", out_py, graph.nvtxs)
+    {
+      idx_t nvtxs = graph.nvtxs, ncon = graph.ncon;
+      check_indices(graph.adjncy.get(), graph.xadj.get()[nvtxs], nvtxs, "adjncy");
+
+      if (initial_part.size() != size_t(nvtxs))
+        throw py::value_error("part must have length nvtxs");
+      idx_t max_part = check_indices(initial_part.get(), nvtxs,
+          std::numeric_limits<idx_t>::max(), "part");
+      if (nparts < 0)
+        nparts = max_part + 1;
+      else if (max_part >= nparts)
+        throw_index_out_of_range("part", max_part);
+      if (nparts < 1)
+        throw py::value_error("nparts must be positive");
+
+      if (tpwgts.size() != 0
+          && (tpwgts.size() != size_t(nparts*ncon)
+            || (tpwgts.ncols() != 0 && tpwgts.ncols() != size_t(ncon))))
+        throw py::value_error(
+            "tpwgts must be empty or have shape (nparts,) or (nparts, ncon)");
+      for (size_t i = 0; i < tpwgts.size(); ++i)
+        if (tpwgts.get()[i] < 0)
+          throw py::value_error("The values of tpwgts should be non-negative");
+
+      if (ubvec.size() != 0 && ubvec.size() != size_t(ncon))
+        throw py::value_error("ubvec must be empty or have length ncon");
+      for (size_t i = 0; i < ubvec.size(); ++i)
+        if (ubvec.get()[i] < 1)
+          throw py::value_error("The values of ubvec should be at least 1");
+
+      // METIS defaults
+      if (niter < 0)
+        niter = 10;
+      if (ufactor < 0)
+        ufactor = 30;
+    }
+
+    void run()
+    {
+      idx_t nvtxs = graph.nvtxs, ncon = graph.ncon;
+      const idx_t *xadj = graph.xadj.get(), *adjncy = graph.adjncy.get();
+      const idx_t *vwgt = graph.vwgt.get(), *adjwgt = graph.adjwgt.get();
+      idx_t *where = part.get();
+
+      // *out* may be *part* itself
+      if (where != initial_part.get())
+        std::copy_n(initial_part.get(), nvtxs, where);
+
+      auto weight = [&](idx_t v, idx_t c) { return vwgt ? vwgt[v*ncon + c] : 1; };
+
+      // {{{ balance bounds
+
+      std::vector<double> totals(ncon, 0), target(size_t(nparts)*ncon);
+      std::vector<double> pwgts(size_t(nparts)*ncon, 0);
+      for (idx_t v = 0; v < nvtxs; ++v)
+        for (idx_t c = 0; c < ncon; ++c)
+        {
+          totals[c] += weight(v, c);
+          pwgts[where[v]*ncon + c] += weight(v, c);
+        }
+      for (idx_t p = 0; p < nparts; ++p)
+        for (idx_t c = 0; c < ncon; ++c)
+          target[p*ncon + c] = totals[c]
+            * (tpwgts.size() ? tpwgts.get()[p*ncon + c] : 1. / nparts);
+
+      std::vector<double> ub(ncon);
+      for (idx_t c = 0; c < ncon; ++c)
+        ub[c] = ubvec.size() ? ubvec.get()[c] : 1 + 0.001*ufactor;
+
+      // largest weight relative to the target, after adding *sign* times
+      // the weight of *v*
+      auto load = [&](idx_t p, idx_t v, int sign)
+      {
+        double result = 0;
+        for (idx_t c = 0; c < ncon; ++c)
+        {
+          double w = pwgts[p*ncon + c] + sign*weight(v, c);
+          if (target[p*ncon + c] > 0)
+            result = std::max(result, w / target[p*ncon + c]);
+          else if (w > 0)
+            return std::numeric_limits<double>::infinity();
+        }
+        return result;
+      };
+      auto overweight = [&](idx_t p)
+      {
+        for (idx_t c = 0; c < ncon; ++c)
+          if (pwgts[p*ncon + c] > ub[c]*target[p*ncon + c])
+            return true;
+        return false;
+      };
+      auto fits = [&](idx_t p, idx_t v)
+      {
+        for (idx_t c = 0; c < ncon; ++c)
+          if (pwgts[p*ncon + c] + weight(v, c) > ub[c]*target[p*ncon + c])
+            return false;
+        return true;
+      };
+      auto stays_full = [&](idx_t p, idx_t v)
+      {
+        for (idx_t c = 0; c < ncon; ++c)
+          if (pwgts[p*ncon + c] - weight(v, c) < target[p*ncon + c] / ub[c])
+            return false;
+        return true;
+      };
+
+      // }}}
+
+      std::mt19937_64 rng(seed < 0 ? 4321 : seed);
+      std::vector<int64_t> conn(nparts, 0);
+      std::vector<idx_t> touched, boundary;
+
+      for (idx_t pass = 0; pass < niter; ++pass)
+      {
+        boundary.clear();
+        for (idx_t v = 0; v < nvtxs; ++v)
+          for (idx_t j = xadj[v]; j < xadj[v+1]; ++j)
+            if (where[adjncy[j]] != where[v])
+            {
+              boundary.push_back(v);
+              break;
+            }
+        std::shuffle(boundary.begin(), boundary.end(), rng);
+
+        idx_t nmoved = 0;
+        for (idx_t v: boundary)
+        {
+          idx_t from = where[v];
+          int64_t internal = 0;
+
+          touched.clear();
+          for (idx_t j = xadj[v]; j < xadj[v+1]; ++j)
+          {
+            idx_t q = where[adjncy[j]];
+            int64_t w = adjwgt ? adjwgt[j] : 1;
+            if (q == from)
+              internal += w;
+            else
+            {
+              if (conn[q] == 0)
+                touched.push_back(q);
+              conn[q] += w;
+            }
+          }
+
+          // moving to *to* relieves *from* if *to* is lighter before the
+          // move than *from* is after it
+          double from_load = load(from, v, -1);
+          bool balance = overweight(from);
+
+          idx_t to = -1;
+          for (idx_t q: touched)
+          {
+            double q_load = load(q, v, 0);
+            bool relieves = q_load < from_load;
+            bool ok;
+            if (balance)
+              ok = relieves;
+            else if (conn[q] > internal)
+              ok = (stays_full(from, v) || relieves) && (fits(q, v) || relieves);
+            else
+              ok = conn[q] == internal && relieves;
+
+            if (ok && (to == -1 || conn[q] > conn[to]
+                  || (conn[q] == conn[to] && q_load < load(to, v, 0))))
+              to = q;
+          }
+
+          if (to != -1)
+          {
+            for (idx_t c = 0; c < ncon; ++c)
+            {
+              pwgts[from*ncon + c] -= weight(v, c);
+              pwgts[to*ncon + c] += weight(v, c);
+            }
+            where[v] = to;
+            ++nmoved;
+          }
+
+          for (idx_t q: touched)
+            conn[q] = 0;
+        }
+
+        if (nmoved == 0)
+          break;
+      }
+
+      edgecut = 0;
+      for (idx_t v = 0; v < nvtxs; ++v)
+        for (idx_t j = xadj[v]; j < xadj[v+1]; ++j)
+          if (where[adjncy[j]] != where[v])
+            edgecut += adjwgt ? adjwgt[j] : 1;
+      edgecut /= 2;
+    }
+  };
+
+
+  py::object
+  wrap_refine_kway(
+      const py::object &xadj_py,
+      const py::object &adjncy_py,
+      const py::object &vwgt_py,
+      const py::object &adjwgt_py,
+      const py::object &part_py,
+      idx_t nparts,
+      const py::object &tpwgts_py,
+      const py::object &ubvec_py,
+      metis_options &options,
+      bool warn_on_copies,
+      const py::object &out_py)
+  {
+    refine_kway_job job(xadj_py, adjncy_py, vwgt_py, adjwgt_py, part_py,
+        nparts, tpwgts_py, ubvec_py, options, warn_on_copies, out_py);
+
+    {
+      py::gil_scoped_release release;
+      job.run();
+    }
+
+    return py::make_tuple(job.edgecut, job.part.as_array());
+  }
+
+
+  /**
+   * Return *new_part*, with its labels permuted (if *remap*) to maximize
+   * the *vsize* staying in its part of *old_part*, and the total *vsize* of
+   * the vertices whose part differs, as in the scratch-remap of ParMETIS's
+   * adaptive repartitioning. Parts are matched greedily by decreasing
+   * overlap.
+   */
+  py::object
+  wrap_remap_partition(
+      const py::object &old_part_py,
+      const py::object &new_part_py,
+      const py::object &vsize_py,
+      idx_t nparts,
+      bool remap,
+      const py::object &out_py)
+  {
+    array_from_py<idx_t> old_part("old_part", old_part_py, false);
+    array_from_py<idx_t> new_part("new_part", new_part_py, false);
+    array_from_py<idx_t> vsize("vsize", vsize_py, false, false);
+    size_t nvtxs = old_part.size();
+    if (new_part.size() != nvtxs)
+      throw py::value_error("old_part and new_part must have the same length");
+    if (vsize.size() != 0 && vsize.size() != nvtxs)
+      throw py::value_error("vsize must be empty or have length nvtxs");
+    if (nparts < 1)
+      throw py::value_error("nparts must be positive");
+    check_indices(old_part.get(), nvtxs, nparts, "old_part");
+    check_indices(new_part.get(), nvtxs, nparts, "new_part");
+
+    array_for_py<idx_t> result("out", out_py, nvtxs);
+    int64_t volume = 0;
+    {
+      py::gil_scoped_release release;
+      const idx_t *pold = old_part.get(), *pnew = new_part.get();
+      const idx_t *pvsize = vsize.get();
+
+      std::vector<idx_t> label(nparts);
+      for (idx_t p = 0; p < nparts; ++p)
+        label[p] = p;
+
+      if (remap)
+      {
+        // (overlap, new part, old part), only for pairs that overlap
+        std::vector<std::tuple<int64_t, idx_t, idx_t>> overlaps;
+        {
+          std::vector<std::pair<idx_t, idx_t>> pairs(nvtxs);
+          for (size_t v = 0; v < nvtxs; ++v)
+            pairs[v] = {pnew[v], pold[v]};
+          std::vector<size_t> order(nvtxs);
+          for (size_t v = 0; v < nvtxs; ++v)
+            order[v] = v;
+          std::sort(order.begin(), order.end(),
+              [&](size_t a, size_t b) { return pairs[a] < pairs[b]; });
+          for (size_t i = 0; i < nvtxs; ++i)
+          {
+            size_t v = order[i];
+            int64_t w = pvsize ? pvsize[v] : 1;
+            if (i && pairs[order[i-1]] == pairs[v])
+              std::get<0>(overlaps.back()) += w;
+            else
+              overlaps.emplace_back(w, pairs[v].first, pairs[v].second);
+          }
+        }
+        std::stable_sort(overlaps.begin(), overlaps.end(),
+            [](const auto &a, const auto &b)
+            { return std::get<0>(a) > std::get<0>(b); });
+
+        std::fill(label.begin(), label.end(), -1);
+        std::vector<bool> taken(nparts, false);
+        for (const auto &[w, p_new, p_old]: overlaps)
+          if (label[p_new] == -1 && !taken[p_old])
+          {
+            label[p_new] = p_old;
+            taken[p_old] = true;
+          }
+
+        // unmatched parts get the remaining labels
+        idx_t next_free = 0;
+        for (idx_t p = 0; p < nparts; ++p)
+          if (label[p] == -1)
+          {
+            while (taken[next_free])
+              ++next_free;
+            label[p] = next_free;
+            taken[next_free] = true;
+          }
+      }
+
+      idx_t *presult = result.get();
+      for (size_t v = 0; v < nvtxs; ++v)
+      {
+        // *out* may be *new_part* itself
+        presult[v] = label[pnew[v]];
+        if (presult[v] != pold[v])
+          volume += pvsize ? pvsize[v] : 1;
+      }
+    }
+
+    return py::make_tuple(result.as_array(), volume);
+  }
+
+  // }}}
+
+
+  // {{{ content hashing
+
+  const uint64_t hash_prime_1 = 0x9E3779B185EBCA87ull;
+  const uint64_t hash_prime_2 = 0xC2B2AE3D27D4EB4Full;
+  const uint64_t hash_prime_3 = 0x165667B19E3779F9ull;
+
+  inline uint64_t rotl64(uint64_t x, int r)
+  {
+    return (x << r) | (x >> (64 - r));
+  }
+
+  inline uint64_t hash_round(uint64_t acc, uint64_t word)
+  {
+    return rotl64(acc + word*hash_prime_2, 31) * hash_prime_1;
+  }
+
+  /**
+   * A fast, non-cryptographic 64-bit hash of *nbytes* bytes at *data*, with
+   * the round structure of xxHash64: four independent lanes of 8-byte words,
+   * merged and avalanched at the end.
+   */
+  uint64_t hash_bytes(const void *data, size_t nbytes, uint64_t seed)
+  {
+    const unsigned char *p = static_cast<const unsigned char *>(data);
+    const unsigned char *end = p + nbytes;
+
+    uint64_t acc[4] = {
+      seed + hash_prime_1 + hash_prime_2, seed + hash_prime_2,
+      seed, seed - hash_prime_1 };
+    for (; p + 32 <= end; p += 32)
+      for (int lane = 0; lane < 4; ++lane)
+      {
+        uint64_t word;
+        std::memcpy(&word, p + 8*lane, 8);
+        acc[lane] = hash_round(acc[lane], word);
+      }
+
+    uint64_t h = rotl64(acc[0], 1) + rotl64(acc[1], 7)
+      + rotl64(acc[2], 12) + rotl64(acc[3], 18);
+    for (int lane = 0; lane < 4; ++lane)
+      h = (h ^ hash_round(0, acc[lane])) * hash_prime_1 + hash_prime_3;
+    h += nbytes;
+
+    for (; p + 8 <= end; p += 8)
+    {
+      uint64_t word;
+      std::memcpy(&word, p, 8);
+      h = rotl64(h ^ hash_round(0, word), 27) * hash_prime_1 + hash_prime_3;
+    }
+    for (; p < end; ++p)
+      h = rotl64(h ^ (*p * hash_prime_3), 11) * hash_prime_1;
+
+    h ^= h >> 33;
+    h *= hash_prime_2;
+    h ^= h >> 29;
+    h *= hash_prime_3;
+    h ^= h >> 32;
+    return h;
+  }
+
+
+  template <class T>
+  uint64_t hash_array(const py::object &array_py)
+  {
+    array_from_py<T> array("array", array_py, false, false);
+    // distinguish e.g. shape (n, 2) from (2n,)
+    uint64_t shape[2] = { array.size(), array.ncols() };
+
+    py::gil_scoped_release release;
+    return hash_bytes(array.get(), array.size()*sizeof(T),
+        hash_bytes(shape, sizeof(shape), 0));
+  }
+
+
+  /**
+   * Return a 64-bit hash of the contents of *array_py* (which may be None)
+   * after conversion to idx_t, or to real_t if *real*.
+   */
+  uint64_t wrap_hash_array(const py::object &array_py, bool real)
+  {
+    return real ? hash_array<real_t>(array_py) : hash_array<idx_t>(array_py);
+  }
+
+  // }}}
+
+
+  // {{{ METIS text files
+
+  class c_file : public noncopyable
+  {
+    private:
+      std::FILE *m_file;
+
+    public:
+      c_file(const std::string &filename, const char *mode)
+      : m_file(std::fopen(filename.c_str(), mode))
+      {
+        if (!m_file)
+        {
+          PyErr_SetFromErrnoWithFilename(PyExc_OSError, filename.c_str());
+          throw py::error_already_set();
+        }
+      }
+
+      ~c_file()
+      {
+        std::fclose(m_file);
+      }
+
+      std::FILE *get() const
+      {
+        return m_file;
+      }
+  };
+
+
+  /**
+   * A buffered reader of the line-oriented text formats of the METIS
+   * programs (see programs/io.c), in which lines starting with '%' are
+   * comments. May be used without the GIL once constructed.
+   */
+  class text_reader : public noncopyable
+  {
+    private:
+      c_file m_file;
+      std::string m_filename;
+      std::vector<char> m_buf;
+      size_t m_pos = 0, m_end = 0;
+      size_t m_line = 0;
+      bool m_in_line = false;
+
+      int peek()
+      {
+        if (m_pos == m_end)
+        {
+          m_pos = 0;
+          m_end = std::fread(m_buf.data(), 1, m_buf.size(), m_file.get());
+          if (m_end == 0)
+          {
+            if (std::ferror(m_file.get()))
+              error("read error");
+            return EOF;
+          }
+        }
+        return static_cast<unsigned char>(m_buf[m_pos]);
+      }
+
+      void skip_line()
+      {
+        int c;
+        while ((c = peek()) != EOF)
+        {
+          ++m_pos;
+          if (c == '\n')
+            break;
+        }
+        ++m_line;
+      }
+
+    public:
+      text_reader(const std::string &filename)
+      : m_file(filename, "rb"), m_filename(filename), m_buf(1 << 20)
+      { }
+
+      [[noreturn]] void error(const std::string &msg) const
+      {
+        throw py::value_error(m_filename + ":" + std::to_string(m_line + 1)
+            + ": " + msg);
+      }
+
+      /**
+       * Advance to the next line that is not a comment. Return *false* at
+       * the end of the file.
+       */
+      bool next_line()
+      {
+        if (m_in_line)
+          skip_line();
+
+        int c;
+        while ((c = peek()) == '%')
+          skip_line();
+
+        m_in_line = c != EOF;
+        return m_in_line;
+      }
+
+      /**
+       * Read the next integer on the current line into *value*. Return
+       * *false* at the end of the line.
+       */
+      bool next_int(idx_t &value)
+      {
+        int c;
+        while ((c = peek()) == ' ' || c == '\t' || c == '\r')
+          ++m_pos;
+        if (c == '\n' || c == EOF)
+          return false;
+
+        bool negative = c == '-';
+        if (negative)
+        {
+          ++m_pos;
+          c = peek();
+        }
+        if (c < '0' || c > '9')
+          error(std::string("unexpected character '") + char(c) + "'");
+
+        const idx_t limit = std::numeric_limits<idx_t>::max() / 10;
+        value = 0;
+        for (; c >= '0' && c <= '9'; c = peek())
+        {
+          if (value > limit)
+            error("integer too large");
+          value = 10*value + (c - '0');
+          ++m_pos;
+        }
+        if (negative)
+          value = -value;
+        return true;
+      }
+  };
+
+
+  /**
+   * Read a graph in the format of METIS's ReadGraph: a header line
+   * "nvtxs nedges [fmt [ncon]]" and one line per vertex with its size,
+   * weights and (1-based) neighbors with edge weights, as given by *fmt*.
+   * The arrays are allocated from the header and filled as the file is
+   * parsed. Return (xadj, adjncy, vwgt, adjwgt, vsize), with None for
+   * weights not in the file.
+   */
+  py::object wrap_read_graph(const std::string &filename)
+  {
+    text_reader reader(filename);
+
+    idx_t header[4] = {0, 0, 0, 0};
+    int nfields = 0;
+    if (reader.next_line())
+      for (idx_t value; nfields < 4 && reader.next_int(value); ++nfields)
+        header[nfields] = value;
+    if (nfields < 2)
+      reader.error("header does not specify the number of vertices and edges");
+
+    idx_t nvtxs = header[0], nedges = 2*header[1], fmt = header[2];
+    if (nvtxs < 0 || nedges < 0)
+      reader.error("number of vertices and edges must be non-negative");
+    if (fmt < 0 || fmt > 111 || fmt % 10 > 1 || fmt / 10 % 10 > 1)
+      reader.error("unsupported fmt " + std::to_string(fmt));
+    bool read_vsize = fmt / 100, read_vwgt = fmt / 10 % 10, read_ewgt = fmt % 10;
+
+    idx_t ncon = header[3];
+    if (ncon < 0 || (ncon > 0 && !read_vwgt))
+      reader.error("ncon is given, but fmt does not specify vertex weights");
+    ncon = std::max<idx_t>(ncon, 1);
+
+    array_for_py<idx_t> xadj(nvtxs + 1), adjncy(nedges);
+    array_for_py<idx_t> vwgt(read_vwgt ? size_t(nvtxs)*ncon : 0);
+    array_for_py<idx_t> adjwgt(read_ewgt ? nedges : 0);
+    array_for_py<idx_t> vsize(read_vsize ? nvtxs : 0);
+
+    {
+      py::gil_scoped_release release;
+
+      idx_t *pxadj = xadj.get(), *padjncy = adjncy.get(), *pvwgt = vwgt.get();
+      idx_t *padjwgt = adjwgt.get(), *pvsize = vsize.get();
+
+      idx_t k = 0;
+      pxadj[0] = 0;
+      for (idx_t i = 0; i < nvtxs; ++i)
+      {
+        if (!reader.next_line())
+          reader.error("premature end of file while reading vertex "
+              + std::to_string(i + 1));
+
+        if (read_vsize)
+          if (!reader.next_int(pvsize[i]) || pvsize[i] < 0)
+            reader.error("missing or negative size for vertex "
+                + std::to_string(i + 1));
+
+        if (read_vwgt)
+          for (idx_t c = 0; c < ncon; ++c)
+            if (!reader.next_int(pvwgt[i*ncon + c]) || pvwgt[i*ncon + c] < 0)
+              reader.error("missing or negative weight for vertex "
+                  + std::to_string(i + 1));
+
+        for (idx_t edge; reader.next_int(edge); ++k)
+        {
+          if (edge < 1 || edge > nvtxs)
+            reader.error("neighbor " + std::to_string(edge) + " of vertex "
+                + std::to_string(i + 1) + " is out of range");
+          if (k == nedges)
+            reader.error("more edges than the " + std::to_string(nedges/2)
+                + " given in the header");
+          padjncy[k] = edge - 1;
+
+          if (read_ewgt)
+            if (!reader.next_int(padjwgt[k]) || padjwgt[k] <= 0)
+              reader.error("missing or non-positive edge weight for vertex "
+                  + std::to_string(i + 1));
+        }
+        pxadj[i + 1] = k;
+      }
+
+      if (k != nedges)
+        reader.error("found " + std::to_string(k/2) + " edges, but the header "
+            "gives " + std::to_string(nedges/2) + " (counting each edge once)");
+    }
+
+    py::object vwgt_py = py::none();
+    if (read_vwgt)
+    {
+      vwgt_py = vwgt.as_array();
+      if (ncon > 1 && have_numpy())
+        vwgt_py = vwgt_py.attr("reshape")(nvtxs, ncon);
+    }
+
+    return py::make_tuple(xadj.as_array(), adjncy.as_array(), vwgt_py,
+        read_ewgt ? adjwgt.as_array() : py::none(),
+        read_vsize ? vsize.as_array() : py::none());
+  }
+
+
+  /**
+   * Read a mesh in the format of METIS's ReadMesh: a header line
+   * "ne [ncon]" and one line per element with its weights and (1-based)
+   * vertices. Return (eptr, eind, ewgt, nn), with ewgt None if the file
+   * has no element weights.
+   */
+  py::object wrap_read_mesh(const std::string &filename)
+  {
+    text_reader reader(filename);
+
+    idx_t header[2] = {0, 0};
+    int nfields = 0;
+    if (reader.next_line())
+      for (idx_t value; nfields < 2 && reader.next_int(value); ++nfields)
+        header[nfields] = value;
+    if (nfields < 1)
+      reader.error("header does not specify the number of elements");
+
+    idx_t ne = header[0], ncon = header[1];
+    if (ne < 0 || ncon < 0)
+      reader.error("number of elements and ncon must be non-negative");
+
+    array_for_py<idx_t> eptr(ne + 1), ewgt(size_t(ne)*ncon);
+    std::vector<idx_t> eind;
+    idx_t nn = 0;
+
+    {
+      py::gil_scoped_release release;
+
+      idx_t *peptr = eptr.get(), *pewgt = ewgt.get();
+      peptr[0] = 0;
+      for (idx_t i = 0; i < ne; ++i)
+      {
+        if (!reader.next_line())
+          reader.error("premature end of file while reading element "
+              + std::to_string(i + 1));
+
+        for (idx_t c = 0; c < ncon; ++c)
+          if (!reader.next_int(pewgt[i*ncon + c]) || pewgt[i*ncon + c] < 0)
+            reader.error("missing or negative weight for element "
+                + std::to_string(i + 1));
+
+        for (idx_t node; reader.next_int(node); )
+        {
+          if (node < 1)
+            reader.error("vertex " + std::to_string(node) + " of element "
+                + std::to_string(i + 1) + " is out of range");
+          eind.push_back(node - 1);
+          nn = std::max(nn, node);
+        }
+        peptr[i + 1] = eind.size();
+      }
+    }
+
+    array_for_py<idx_t> eind_py(eind.size());
+    std::copy(eind.begin(), eind.end(), eind_py.get());
+
+    py::object ewgt_py = py::none();
+    if (ncon)
+    {
+      ewgt_py = ewgt.as_array();
+      if (ncon > 1 && have_numpy())
+        ewgt_py = ewgt_py.attr("reshape")(ne, ncon);
+    }
+
+    return py::make_tuple(eptr.as_array(), eind_py.as_array(), ewgt_py, nn);
+  }
+
+
+  /**
+   * Write *values* to *filename*, one per line, as METIS's WritePartition
+   * and WritePermutation do.
+   */
+  void wrap_write_index_file(const std::string &filename,
+      const py::object &values_py)
+  {
+    array_from_py<idx_t> values("values", values_py, false);
+    c_file file(filename, "wb");
+
+    bool failed = false;
+    {
+      py::gil_scoped_release release;
+
+      const idx_t *pvalues = values.get();
+      // room for one more number at all times
+      std::vector<char> buf(1 << 16);
+      size_t used = 0;
+      for (size_t i = 0; i < values.size() && !failed; ++i)
+      {
+        char *end = std::to_chars(
+            buf.data() + used, buf.data() + buf.size(), pvalues[i]).ptr;
+        *end++ = '\n';
+        used = end - buf.data();
+        if (used > buf.size() - 32)
+        {
+          failed = std::fwrite(buf.data(), 1, used, file.get()) != used;
+          used = 0;
+        }
+      }
+      if (!failed)
+        failed = std::fwrite(buf.data(), 1, used, file.get()) != used
+          || std::fflush(file.get()) != 0;
+    }
+
+    if (failed)
+    {
+      PyErr_SetFromErrnoWithFilename(PyExc_OSError, filename.c_str());
+      throw py::error_already_set();
+    }
+  }
+
+  // }}}
+
+
+  // {{{ graph and mesh generators
+
+  typedef std::vector<std::pair<idx_t, idx_t>> edge_list;
+
+  /**
+   * Return ``(xadj, adjncy)`` of the symmetric graph on *nvtxs* vertices
+   * with the undirected *edges*, each of which is listed once. Neighbors
+   * are sorted.
+   */
+  py::object
+  csr_from_edges(idx_t nvtxs, const edge_list &edges)
+  {
+    array_for_py<idx_t> xadj(nvtxs + 1);
+    array_for_py<idx_t> adjncy(2*edges.size());
+
+    {
+      py::gil_scoped_release release;
+
+      idx_t *pxadj = xadj.get(), *padjncy = adjncy.get();
+      std::fill(pxadj, pxadj + nvtxs + 1, 0);
+      for (const auto &[u, v]: edges)
+      {
+        ++pxadj[u+1];
+        ++pxadj[v+1];
+      }
+      for (idx_t i = 0; i < nvtxs; ++i)
+        pxadj[i+1] += pxadj[i];
+
+      std::vector<idx_t> pos(pxadj, pxadj + nvtxs);
+      for (const auto &[u, v]: edges)
+      {
+        padjncy[pos[u]++] = v;
+        padjncy[pos[v]++] = u;
+      }
+      for (idx_t i = 0; i < nvtxs; ++i)
+        std::sort(padjncy + pxadj[i], padjncy + pxadj[i+1]);
+    }
+
+    return py::make_tuple(xadj.as_array(), adjncy.as_array());
+  }
+
+
+  void check_positive(long long value, const char *what)
+  {
+    if (value <= 0)
+      throw py::value_error(std::string(what) + " must be positive");
+  }
+
+
+  /**
+   * The graph of the 7-point stencil on an *nx* x *ny* x *nz* grid (the
+   * 5-point stencil if *nz* is 1), with vertices numbered lexicographically,
+   * x fastest.
+   */
+  py::object
+  wrap_grid_graph(idx_t nx, idx_t ny, idx_t nz)
+  {
+    check_positive(nx, "nx");
+    check_positive(ny, "ny");
+    check_positive(nz, "nz");
+
+    edge_list edges;
+    {
+      py::gil_scoped_release release;
+
+      edges.reserve(3*nx*ny*nz);
+      for (idx_t k = 0; k < nz; ++k)
+        for (idx_t j = 0; j < ny; ++j)
+          for (idx_t i = 0; i < nx; ++i)
+          {
+            idx_t v = (k*ny + j)*nx + i;
+            if (i + 1 < nx)
+              edges.emplace_back(v, v + 1);
+            if (j + 1 < ny)
+              edges.emplace_back(v, v + nx);
+            if (k + 1 < nz)
+              edges.emplace_back(v, v + nx*ny);
+          }
+    }
+
+    return csr_from_edges(nx*ny*nz, edges);
+  }
+
+
+  /**
+   * The graph of *nvtxs* points drawn uniformly from the unit square (or
+   * cube, if *dim* is 3), with an edge between points closer than *radius*.
+   * Points are sorted into cells of side at least *radius*, so that only
+   * neighboring cells need to be searched.
+   */
+  py::object
+  wrap_random_geometric_graph(idx_t nvtxs, double radius, int dim, uint64_t seed)
+  {
+    check_positive(nvtxs, "n_vertices");
+    if (dim != 2 && dim != 3)
+      throw py::value_error("dim must be 2 or 3");
+    if (!(radius > 0))
+      throw py::value_error("radius must be positive");
+
+    edge_list edges;
+    {
+      py::gil_scoped_release release;
+
+      std::mt19937_64 rng(seed);
+      std::uniform_real_distribution<double> uniform(0, 1);
+      std::vector<double> coords(size_t(nvtxs)*dim);
+      for (double &x: coords)
+        x = uniform(rng);
+
+      // no more cells than points
+      idx_t ncells_1d = std::max<idx_t>(1, std::min<idx_t>(
+          idx_t(std::floor(1/radius)),
+          idx_t(std::floor(std::pow(double(nvtxs), 1./dim)))));
+      idx_t ncells_z = dim == 3 ? ncells_1d : 1;
+      idx_t ncells = ncells_1d*ncells_1d*ncells_z;
+
+      auto cell_coord = [&](double x)
+      {
+        return std::min<idx_t>(ncells_1d - 1, idx_t(x*ncells_1d));
+      };
+      auto cell_of = [&](idx_t v)
+      {
+        const double *x = &coords[size_t(v)*dim];
+        idx_t cell = cell_coord(x[1])*ncells_1d + cell_coord(x[0]);
+        if (dim == 3)
+          cell += cell_coord(x[2])*ncells_1d*ncells_1d;
+        return cell;
+      };
+
+      // counting sort of the points by cell
+      std::vector<idx_t> cell_starts(ncells + 1, 0), cell_points(nvtxs);
+      for (idx_t v = 0; v < nvtxs; ++v)
+        ++cell_starts[cell_of(v) + 1];
+      for (idx_t c = 0; c < ncells; ++c)
+        cell_starts[c+1] += cell_starts[c];
+      {
+        std::vector<idx_t> pos(cell_starts.begin(), cell_starts.end() - 1);
+        for (idx_t v = 0; v < nvtxs; ++v)
+          cell_points[pos[cell_of(v)]++] = v;
+      }
+
+      double radius_sq = radius*radius;
+      for (idx_t u = 0; u < nvtxs; ++u)
+      {
+        const double *xu = &coords[size_t(u)*dim];
+        idx_t ci = cell_coord(xu[0]), cj = cell_coord(xu[1]);
+        idx_t ck = dim == 3 ? cell_coord(xu[2]) : 0;
+
+        for (idx_t k = std::max<idx_t>(ck - 1, 0);
+            k <= std::min(ck + 1, ncells_z - 1); ++k)
+          for (idx_t j = std::max<idx_t>(cj - 1, 0);
+              j <= std::min(cj + 1, ncells_1d - 1); ++j)
+            for (idx_t i = std::max<idx_t>(ci - 1, 0);
+                i <= std::min(ci + 1, ncells_1d - 1); ++i)
+            {
+              idx_t c = (k*ncells_1d + j)*ncells_1d + i;
+              for (idx_t p = cell_starts[c]; p < cell_starts[c+1]; ++p)
+              {
+                idx_t v = cell_points[p];
+                if (v <= u)
+                  continue;
+
+                const double *xv = &coords[size_t(v)*dim];
+                double dist_sq = 0;
+                for (int d = 0; d < dim; ++d)
+                  dist_sq += (xu[d] - xv[d])*(xu[d] - xv[d]);
+                if (dist_sq < radius_sq)
+                  edges.emplace_back(u, v);
+              }
+            }
+      }
+    }
+
+    return csr_from_edges(nvtxs, edges);
+  }
+
+
+  /**
+   * A Barabasi-Albert graph: starting from a clique on *m* + 1 vertices,
+   * each further vertex is connected to *m* distinct existing vertices,
+   * chosen with probability proportional to their degree. The degrees
+   * follow a power law.
+   */
+  py::object
+  wrap_power_law_graph(idx_t nvtxs, idx_t m, uint64_t seed)
+  {
+    check_positive(nvtxs, "n_vertices");
+    check_positive(m, "m");
+
+    edge_list edges;
+    {
+      py::gil_scoped_release release;
+
+      std::mt19937_64 rng(seed);
+      idx_t nclique = std::min(nvtxs, m + 1);
+      for (idx_t u = 0; u < nclique; ++u)
+        for (idx_t v = u + 1; v < nclique; ++v)
+          edges.emplace_back(u, v);
+
+      // each vertex occurs here once per incident edge
+      std::vector<idx_t> endpoints;
+      endpoints.reserve(2*(edges.size() + size_t(nvtxs)*m));
+      for (const auto &[u, v]: edges)
+      {
+        endpoints.push_back(u);
+        endpoints.push_back(v);
+      }
+
+      std::vector<idx_t> targets;
+      for (idx_t v = nclique; v < nvtxs; ++v)
+      {
+        targets.clear();
+        std::uniform_int_distribution<size_t> pick(0, endpoints.size() - 1);
+        while (idx_t(targets.size()) < m)
+        {
+          idx_t u = endpoints[pick(rng)];
+          if (std::find(targets.begin(), targets.end(), u) == targets.end())
+            targets.push_back(u);
+        }
+        for (idx_t u: targets)
+        {
+          edges.emplace_back(u, v);
+          endpoints.push_back(u);
+          endpoints.push_back(v);
+        }
+      }
+    }
+
+    return csr_from_edges(nvtxs, edges);
+  }
+
+
+  /**
+   * A tetrahedral mesh of the unit cube, subdivided into *nx* x *ny* x *nz*
+   * boxes of six tetrahedra each (the Kuhn triangulation, which is
+   * conforming), as ``(eptr, eind, n_vertices)``.
+   */
+  py::object
+  wrap_tet_mesh(idx_t nx, idx_t ny, idx_t nz)
+  {
+    check_positive(nx, "nx");
+    check_positive(ny, "ny");
+    check_positive(nz, "nz");
+
+    idx_t nelements = 6*nx*ny*nz;
+    array_for_py<idx_t> eptr(nelements + 1);
+    array_for_py<idx_t> eind(4*nelements);
+
+    {
+      py::gil_scoped_release release;
+
+      idx_t *peptr = eptr.get(), *peind = eind.get();
+      for (idx_t e = 0; e <= nelements; ++e)
+        peptr[e] = 4*e;
+
+      // each tetrahedron is a path from the corner 0 to the corner 7 of
+      // the box, along the axes in one of the six possible orders
+      const int axis_orders[6][3] = {
+        {0, 1, 2}, {0, 2, 1}, {1, 0, 2}, {1, 2, 0}, {2, 0, 1}, {2, 1, 0}};
+
+      for (idx_t k = 0; k < nz; ++k)
+        for (idx_t j = 0; j < ny; ++j)
+          for (idx_t i = 0; i < nx; ++i)
+          {
+            auto corner = [&](int bits)
+            {
+              return ((k + ((bits >> 2) & 1))*(ny + 1)
+                  + j + ((bits >> 1) & 1))*(nx + 1) + i + (bits & 1);
+            };
+
+            for (const auto &order: axis_orders)
+            {
+              int bits = 0;
+              *peind++ = corner(bits);
+              for (int axis: order)
+              {
+                bits |= 1 << axis;
+                *peind++ = corner(bits);
+              }
+            }
+          }
+    }
+
+    return py::make_tuple(eptr.as_array(), eind.as_array(),
+        (nx + 1)*(ny + 1)*(nz + 1));
+  }
 
-        if (m_buf.get())
-        {
-          m_size = m_buf->m_buf.len / sizeof(T);
-        }
-        else
-        {
-          m_vec.reset(new std::vector<T>);
-          for (auto it: obj)
-            m_vec->push_back(py::cast<T>(*it));
+  // }}}
 
-          m_size = m_vec->size();
-        }
+
+  // {{{ mesh partitioning
+
+  /**
+   * Mesh in METIS's (eptr, eind) format, pinned for use by METIS.
+   */
+  struct mesh_input : public noncopyable
+  {
+    array_from_py<idx_t> eptr, eind;
+    idx_t ne, nn;
+
+    mesh_input(array_from_py<idx_t> &&eptr_, array_from_py<idx_t> &&eind_,
+        idx_t ne_, idx_t nn_)
+    : eptr(std::move(eptr_)), eind(std::move(eind_)), ne(ne_), nn(nn_)
+    {
+      if (eptr.size() != size_t(ne) + 1)
+        throw py::value_error("eptr must have length n_elements+1");
+      if (eind.size() < size_t(eptr.get()[ne]))
+        throw py::value_error("eind is shorter than indicated by eptr");
+    }
+
+    /**
+     * Build from *connectivity_py*, which may be a two-dimensional array of
+     * shape ``(ne, nodes_per_element)`` (used without copying, if possible)
+     * or a sequence of per-element node sequences. If *connectivity_py* is
+     * None, use *eptr_py* and *eind_py* instead. If *n_vertices_py* is None,
+     * the number of nodes is taken to be one more than the largest node
+     * index.
+     */
+    static std::shared_ptr<mesh_input> from_py(
+        const py::object &connectivity_py,
+        const py::object &eptr_py,
+        const py::object &eind_py,
+        const py::object &n_vertices_py,
+        bool warn_on_copies)
+    {
+      idx_t bound = std::numeric_limits<idx_t>::max();
+      if (!n_vertices_py.is_none())
+      {
+        bound = py::cast<idx_t>(n_vertices_py);
+        if (bound < 0)
+          throw py::value_error("n_vertices must be non-negative");
       }
 
-      T *get() const
+      std::unique_ptr<array_from_py<idx_t>> eptr, eind;
+      idx_t ne;
+      idx_t max_node;
+
+      if (connectivity_py.is_none())
       {
-        if (m_buf.get())
-          return reinterpret_cast<T *>(m_buf->m_buf.buf);
-        else if (m_vec.get())
-          return m_vec->empty() ? nullptr: m_vec->data();
-        else
-          return nullptr;
+        eptr.reset(new array_from_py<idx_t>("eptr", eptr_py, warn_on_copies));
+        eind.reset(new array_from_py<idx_t>("eind", eind_py, warn_on_copies));
+        if (eptr->size() == 0)
+          throw py::value_error("eptr cannot be empty");
+        ne = eptr->size() - 1;
+
+        const idx_t *peptr = eptr->get();
+        if (peptr[0] != 0)
+          throw py::value_error("eptr must start at zero");
+        for (idx_t i = 0; i < ne; ++i)
+          if (peptr[i+1] < peptr[i])
+            throw py::value_error("eptr must be non-decreasing");
+        if (eind->size() < size_t(peptr[ne]))
+          throw py::value_error("eind is shorter than indicated by eptr");
+
+        max_node = check_indices(eind->get(), peptr[ne], bound, "eind");
       }
+      else if (PyObject_CheckBuffer(connectivity_py.ptr()))
+      {
+        eind.reset(new array_from_py<idx_t>(
+              "connectivity", connectivity_py, warn_on_copies));
+        idx_t nodes_per_element = eind->ncols();
+        if (nodes_per_element == 0 && eind->size() != 0)
+          throw py::value_error("connectivity arrays must be two-dimensional");
+        ne = nodes_per_element ? eind->size() / nodes_per_element : 0;
 
-      size_t size() const
+        std::vector<idx_t> eptr_vec(ne + 1);
+        for (idx_t i = 0; i <= ne; ++i)
+          eptr_vec[i] = i * nodes_per_element;
+        eptr.reset(new array_from_py<idx_t>(std::move(eptr_vec)));
+
+        max_node = check_indices(eind->get(), eind->size(), bound, "connectivity");
+      }
+      else
       {
-        return m_size;
+        py_rows rows(connectivity_py);
+        ne = rows.size();
+
+        std::vector<idx_t> eptr_vec(ne + 1);
+        rows.get_starts(eptr_vec.data());
+        std::vector<idx_t> eind_vec(eptr_vec[ne]);
+        max_node = rows.flatten(
+            eptr_vec.data(), eind_vec.data(), bound, "connectivity");
+
+        eptr.reset(new array_from_py<idx_t>(std::move(eptr_vec)));
+        eind.reset(new array_from_py<idx_t>(std::move(eind_vec)));
       }
 
+      return std::make_shared<mesh_input>(
+          std::move(*eptr), std::move(*eind), ne,
+          n_vertices_py.is_none() ? max_node + 1 : bound);
+    }
   };
 
 
   /**
-   * This function verifies that the partitioning was computed correctly.
+   * Return the weight ``costs[k]`` of each element with *k* vertices in the
+   * mesh given by *connectivity_py* (or *eptr_py* if that is None), as
+   * accepted by :meth:`mesh_input::from_py`. Negative entries of *costs*
+   * mark arities without a cost, *default_cost* (if non-negative) applies
+   * to arities beyond the end of *costs*.
    */
-  int
-  wrap_verify_nd(const py::object &perm_py, const py::object &iperm_py)
+  py::object
+  wrap_element_weights_from_arity(
+      const py::object &connectivity_py,
+      const py::object &eptr_py,
+      const py::object &costs_py,
+      idx_t default_cost)
   {
-    int rcode=0;
-    idx_t i;
-    idx_t nvtxs = py::len(perm_py);
+    array_from_py<idx_t> costs("costs", costs_py, false);
+    const idx_t *pcosts = costs.get();
+    idx_t ncosts = costs.size();
 
-    array_from_py<idx_t> perm_ary("perm", perm_py, false);
-    array_from_py<idx_t> iperm_ary("iperm", iperm_py, false);
-    idx_t *perm = perm_ary.get();
-    idx_t *iperm = iperm_ary.get();
+    auto lookup = [&](idx_t arity)
+    {
+      idx_t cost = arity < ncosts ? pcosts[arity] : default_cost;
+      if (cost < 0)
+        throw py::value_error("no cost given for elements with "
+            + std::to_string(arity) + " vertices");
+      return cost;
+    };
 
-    for (i=0; i<nvtxs; i++)
-      if (i != perm[iperm[i]])
-        rcode = 1;
+    if (connectivity_py.is_none())
+    {
+      array_from_py<idx_t> eptr("eptr", eptr_py, false);
+      if (eptr.size() == 0)
+        throw py::value_error("eptr cannot be empty");
+      idx_t ne = eptr.size() - 1;
+      const idx_t *peptr = eptr.get();
 
-    for (i=0; i<nvtxs; i++)
-      if (i != iperm[perm[i]])
-        rcode = 2;
+      array_for_py<idx_t> weights(ne);
+      idx_t *pweights = weights.get();
+      for (idx_t i = 0; i < ne; ++i)
+      {
+        idx_t arity = peptr[i+1] - peptr[i];
+        if (arity < 0)
+          throw py::value_error("eptr must be non-decreasing");
+        pweights[i] = lookup(arity);
+      }
+      return weights.as_array();
+    }
+    else if (PyObject_CheckBuffer(connectivity_py.ptr()))
+    {
+      array_from_py<idx_t> conn("connectivity", connectivity_py, false);
+      idx_t arity = conn.ncols();
+      if (arity == 0 && conn.size() != 0)
+        throw py::value_error("connectivity arrays must be two-dimensional");
+      idx_t ne = arity ? conn.size() / arity : 0;
 
-    return rcode;
+      array_for_py<idx_t> weights(ne);
+      std::fill(weights.get(), weights.get() + ne, ne ? lookup(arity) : 0);
+      return weights.as_array();
+    }
+    else
+    {
+      py_rows rows(connectivity_py);
+      idx_t ne = rows.size();
+      std::vector<idx_t> starts(ne + 1);
+      rows.get_starts(starts.data());
+
+      array_for_py<idx_t> weights(ne);
+      idx_t *pweights = weights.get();
+      for (idx_t i = 0; i < ne; ++i)
+        pweights[i] = lookup(starts[i+1] - starts[i]);
+      return weights.as_array();
+    }
   }
 
 
-  py::object
-  wrap_node_nd(const py::object &xadj_py, const py::object &adjncy_py,
-      const py::object &vwgt_py,
-      metis_options &options)
+  /**
+   * Hand the *size* entries of METIS-allocated *data* to Python. With
+   * :mod:`numpy`, this is zero-copy, and the memory is released through
+   * METIS_Free once the array is garbage-collected.
+   */
+  py::object adopt_metis_array(idx_t *data, size_t size)
   {
-    array_from_py<idx_t> xadj("xadj", xadj_py, false);
-    if (xadj.size() == 0)
-      throw py::value_error("xadj cannot be empty");
+    std::unique_ptr<idx_t, int (*)(void *)> owned(data, METIS_Free);
 
-    idx_t nvtxs = xadj.size() - 1;
+    if (have_numpy())
+    {
+      py::capsule base(data, [](void *p) { METIS_Free(p); });
+      owned.release();
+      return py::array_t<idx_t>(size, data, base);
+    }
 
-    array_from_py<idx_t> adjncy("adjncy", adjncy_py, false);
+    array_for_py<idx_t> result(size);
+    std::copy(data, data + size, result.get());
+    return result.as_array();
+  }
 
-    array_from_py<idx_t> vwgt("vwgt", vwgt_py, false, false);
 
-    if (vwgt.size() != 0 && vwgt.size() != nvtxs)
-      throw py::value_error("vwgt must be empty or have length nvtxs");
+  /**
+   * Convert a mesh (as accepted by :meth:`mesh_input::from_py`) to
+   * ``(eptr, eind, nn)``, with freshly allocated arrays.
+   */
+  py::object
+  wrap_mesh_csr(
+      const py::object &connectivity_py,
+      const py::object &eptr_py,
+      const py::object &eind_py,
+      const py::object &n_vertices_py,
+      bool warn_on_copies)
+  {
+    std::shared_ptr<mesh_input> mesh = mesh_input::from_py(
+        connectivity_py, eptr_py, eind_py, n_vertices_py, warn_on_copies);
 
-    array_for_py<idx_t> perm(nvtxs), iperm(nvtxs);
+    const idx_t *peptr = mesh->eptr.get();
+    array_for_py<idx_t> eptr(mesh->ne + 1), eind(peptr[mesh->ne]);
+    std::copy(peptr, peptr + mesh->ne + 1, eptr.get());
+    std::copy(mesh->eind.get(), mesh->eind.get() + peptr[mesh->ne], eind.get());
 
-    int info = METIS_NodeND(
-      &nvtxs, xadj.get(), adjncy.get(), vwgt.get(), options.m_options,
-      perm.get(), iperm.get());
+    return py::make_tuple(eptr.as_array(), eind.as_array(), mesh->nn);
+  }
 
-    assert_ok(info, "METIS_NodeND failed");
 
-    return py::make_tuple(perm.as_array(), iperm.as_array());
+  /**
+   * Build the dual graph (if *dual*) or the nodal graph of a mesh with
+   * METIS_MeshToDual/METIS_MeshToNodal, and return it as ``(xadj, adjncy)``.
+   */
+  py::object
+  wrap_mesh_to_graph(
+      const py::object &eptr_py,
+      const py::object &eind_py,
+      idx_t nn,
+      bool dual,
+      idx_t ncommon,
+      bool warn_on_copies)
+  {
+    array_from_py<idx_t> eptr("eptr", eptr_py, warn_on_copies);
+    array_from_py<idx_t> eind("eind", eind_py, warn_on_copies);
+    if (eptr.size() == 0)
+      throw py::value_error("eptr cannot be empty");
+    idx_t ne = eptr.size() - 1;
+    if (eind.size() < size_t(eptr.get()[ne]))
+      throw py::value_error("eind is shorter than indicated by eptr");
+    check_indices(eind.get(), eptr.get()[ne], nn, "eind");
+    if (dual && ncommon < 1)
+      throw py::value_error("ncommon must be positive");
+
+    idx_t numflag = 0;
+    idx_t *xadj = nullptr, *adjncy = nullptr;
+    int info;
+    {
+      py::gil_scoped_release release;
+      if (dual)
+        info = METIS_MeshToDual(&ne, &nn, eptr.get(), eind.get(),
+            &ncommon, &numflag, &xadj, &adjncy);
+      else
+        info = METIS_MeshToNodal(&ne, &nn, eptr.get(), eind.get(),
+            &numflag, &xadj, &adjncy);
+    }
+    assert_ok(info, dual ? "METIS_MeshToDual failed" : "METIS_MeshToNodal failed");
+
+    idx_t nvtxs = dual ? ne : nn;
+    idx_t nedges = xadj[nvtxs];
+    py::object xadj_py = adopt_metis_array(xadj, nvtxs + 1);
+    py::object adjncy_py = adopt_metis_array(adjncy, nedges);
+    return py::make_tuple(xadj_py, adjncy_py);
   }
 
-  py::object
-  wrap_part_graph(
-      idx_t nparts,
-      const py::object &xadj_py,
-      const py::object &adjncy_py,
-      const py::object &vwgt_py,
-      const py::object &vsize_py,
-      const py::object &adjwgt_py,
-      const py::object &tpwgts_py,
-      metis_options &options,
-      bool recursive,
-      bool warn_on_copies
-    )
+
+  /**
+   * One call to METIS_PartMesh{Nodal,Dual}, see :class:`part_graph_job`.
+   */
+  struct part_mesh_job : public noncopyable
   {
-    array_from_py<idx_t> xadj("xadj", xadj_py, warn_on_copies);
-    if (xadj.size() == 0)
-      throw py::value_error("xadj cannot be empty");
+    std::shared_ptr<mesh_input> mesh;
+    idx_t nparts;
+    idx_t gtype;
+    idx_t ncommon;
+    array_from_py<real_t> tpwgts;
+    array_from_py<idx_t> elmwgt, elmsize;
+    metis_options options;
 
-    idx_t nvtxs = xadj.size() - 1;
+    array_for_py<idx_t> elem_part, vert_part;
+    idx_t objval = 0;
+    int info = METIS_OK;
+
+    part_mesh_job(
+        std::shared_ptr<mesh_input> mesh_,
+        idx_t nparts_, idx_t gtype_, idx_t ncommon_,
+        const py::object &tpwgts_py,
+        const py::object &elmwgt_py,
+        const py::object &elmsize_py,
+        const metis_options &options_,
+        bool warn_on_copies,
+        const py::object &elem_part_out_py = py::none(),
+        const py::object &vert_part_out_py = py::none())
+    : mesh(mesh_), nparts(nparts_), gtype(gtype_), ncommon(ncommon_),
+      tpwgts("tpwgts", tpwgts_py, false, false),
+      elmwgt("element_weights", elmwgt_py, warn_on_copies, false),
+      elmsize("element_sizes", elmsize_py, warn_on_copies, false),
+      options(options_),
+      elem_part("elem_part_out", elem_part_out_py, mesh->ne),
+      vert_part("vert_part_out", vert_part_out_py, mesh->nn)
+    {
+      if (gtype != METIS_GTYPE_NODAL && gtype != METIS_GTYPE_DUAL)
+        throw py::value_error("Invalid value. "
+            "`gtype` is supposed to be either `METIS_GTYPE_NODAL`"
+            " or `METIS_GTYPE_DUAL`.");
+      if (tpwgts.size() != 0 && tpwgts.size() != size_t(nparts))
+        throw py::value_error("tpwgts must be empty or have length nparts");
 
-    array_from_py<idx_t> adjncy("adjncy", adjncy_py, warn_on_copies);
-    array_from_py<idx_t> vwgt("vwgt", vwgt_py, warn_on_copies, false);
-    array_from_py<idx_t> vsize("vsize", vsize_py, warn_on_copies, false);
-    array_from_py<idx_t> adjwgt("adjwgt", adjwgt_py, warn_on_copies, false);
-    array_from_py<real_t> tpwgts("tpwgts", tpwgts_py, warn_on_copies, false);
+      // For nodal partitioning, METIS's vwgt/vsize refer to mesh nodes,
+      // which is not what we offer.
+      if (gtype == METIS_GTYPE_NODAL && (elmwgt.size() || elmsize.size()))
+        throw py::value_error(
+            "element weights and sizes require `METIS_GTYPE_DUAL`");
+      if (elmwgt.size() != 0 && elmwgt.size() != size_t(mesh->ne))
+        throw py::value_error(
+            "element_weights must be empty or have length n_elements");
+      if (elmsize.size() != 0 && elmsize.size() != size_t(mesh->ne))
+        throw py::value_error(
+            "element_sizes must be empty or have length n_elements");
+      for (const array_from_py<idx_t> *a: {&elmwgt, &elmsize})
+        if (std::any_of(a->get(), a->get() + a->size(),
+              [](idx_t w) { return w < 0; }))
+          throw py::value_error(
+              "element weights and sizes must be non-negative");
+    }
 
-    // partition weights
-    idx_t ncon = 1;
+    void run()
+    {
+      if (nparts < 2)
+      {
+        std::fill(elem_part.get(), elem_part.get() + mesh->ne, 0);
+        std::fill(vert_part.get(), vert_part.get() + mesh->nn, 0);
+        objval = 0;
+        return;
+      }
 
-    real_t *pubvec = nullptr;
+      idx_t ne = mesh->ne;
+      idx_t nn = mesh->nn;
 
-    idx_t edgecut;
-    array_for_py<idx_t> part(nvtxs);
+      if (gtype == METIS_GTYPE_NODAL)
+        info = METIS_PartMeshNodal(&ne, &nn,
+          mesh->eptr.get(), mesh->eind.get(),
+          nullptr, nullptr, &nparts, tpwgts.get(), options.m_options,
+          &objval, elem_part.get(), vert_part.get());
+      else
+        info = METIS_PartMeshDual(&ne, &nn,
+          mesh->eptr.get(), mesh->eind.get(),
+          elmwgt.get(), elmsize.get(), &ncommon, &nparts, tpwgts.get(),
+          options.m_options,
+          &objval, elem_part.get(), vert_part.get());
+    }
 
-    if (recursive)
+    const char *failure_message() const
     {
-      int info = METIS_PartGraphRecursive(
-        &nvtxs, &ncon, xadj.get(), adjncy.get(),
-        vwgt.get(), vsize.get(), adjwgt.get(), &nparts, tpwgts.get(),
-        pubvec, options.m_options, &edgecut, part.get());
+      return gtype == METIS_GTYPE_NODAL
+        ? "METIS_PartMeshNodal failed"
+        : "METIS_PartMeshDual failed";
+    }
 
-      assert_ok(info, "METIS_PartGraphRecursive failed");
+    py::object result()
+    {
+      assert_ok(info, failure_message());
+      return py::make_tuple(objval, elem_part.as_array(), vert_part.as_array());
     }
-    else
+  };
+
+
+  py::object
+  wrap_part_mesh(
+      idx_t nparts,
+      const py::object &connectivity_py,
+      const py::object &eptr_py,
+      const py::object &eind_py,
+      const py::object &n_vertices_py,
+      const py::object &tpwgts_py,
+      const py::object &elmwgt_py,
+      const py::object &elmsize_py,
+      idx_t gtype,
+      idx_t ncommon,
+      metis_options &options,
+      bool warn_on_copies,
+      const py::object &elem_part_out_py,
+      const py::object &vert_part_out_py,
+      bool collect_timings,
+      size_t max_memory)
+  {
+    part_mesh_job job(
+        mesh_input::from_py(
+          connectivity_py, eptr_py, eind_py, n_vertices_py, warn_on_copies),
+        nparts, gtype, ncommon, tpwgts_py, elmwgt_py, elmsize_py, options,
+        warn_on_copies, elem_part_out_py, vert_part_out_py);
+
+    std::unique_ptr<timing_collector> timings;
+    if (collect_timings)
     {
-      int info = METIS_PartGraphKway(
-        &nvtxs, &ncon, xadj.get(), adjncy.get(),
-        vwgt.get(), vsize.get(), adjwgt.get(), &nparts, tpwgts.get(),
-        pubvec, options.m_options, &edgecut, part.get());
+      timing_collector::enable(job.options);
+      timings.reset(new timing_collector);
+    }
+
+    std::unique_ptr<memory_monitor> memory;
+    if (collect_timings || max_memory)
+      memory.reset(new memory_monitor(max_memory));
 
-      assert_ok(info, "METIS_PartGraphKway failed");
+    {
+      py::gil_scoped_release release;
+      job.run();
     }
 
-    return py::make_tuple(edgecut, part.as_array());
+    if (memory)
+      memory->check();
+    if (timings)
+      return py::make_tuple(job.result(), timings->as_tuple(*memory));
+    return job.result();
   }
 
-  py::object
-  wrap_part_mesh(idx_t &nParts,
-    const py::object &connectivityOffsets_py,
-    const py::object &connectivity_py,
-    const py::object &tpwgts_py,
-    idx_t &gtype,
-    idx_t &nElements,
-    idx_t &nVertex,
-    idx_t &ncommon,
-    metis_options &options)
-  {
-    idx_t edgeCuts = 0;
-    array_for_py<idx_t> elemPart(nElements), vertPart(nVertex);
-
-    array_from_py<idx_t> connectivityOffsets("connectivityOffsets", connectivityOffsets_py, false);
-    array_from_py<idx_t> connectivity("connectivity", connectivity_py, false);
-    array_from_py<real_t> tpwgts("tpwgts", tpwgts_py, false);
-
-
-    if(gtype == METIS_GTYPE_NODAL)
-    {
-        int info = METIS_PartMeshNodal(&nElements, &nVertex,
-          connectivityOffsets.get(), connectivity.get(),
-          nullptr, nullptr, &nParts, tpwgts.get(), options.m_options,
-          &edgeCuts, elemPart.get(), vertPart.get());
-        assert_ok(info, "METIS_PartMeshNodal failed");
-    }
-    else if(gtype == METIS_GTYPE_DUAL)
-    {
-        idx_t objval = 1;
-        int info = METIS_PartMeshDual(&nElements, &nVertex,
-          connectivityOffsets.get(), connectivity.get(),
-          nullptr, nullptr, &ncommon, &nParts, tpwgts.get(), options.m_options,
-          &objval, elemPart.get(), vertPart.get());
-        assert_ok(info, "METIS_PartMeshNodal failed");
-    }
-    else {
-        assert_ok(METIS_ERROR_INPUT, "Invalid value. "\
-            "`gtype` is supposed to be either `METIS_GTYPE_NODAL`"\
-            " or `METIS_GTYPE_DUAL`.");
+
+  py::list
+  wrap_part_mesh_many(
+      const py::sequence &nparts_py,
+      const py::sequence &connectivities_py,
+      const py::sequence &eptrs_py,
+      const py::sequence &einds_py,
+      const py::sequence &n_vertices_py,
+      const py::sequence &tpwgts_py,
+      const py::sequence &elmwgts_py,
+      const py::sequence &elmsizes_py,
+      const py::sequence &gtypes_py,
+      const py::sequence &ncommons_py,
+      const py::sequence &options_py,
+      size_t nthreads,
+      bool warn_on_copies)
+  {
+    size_t njobs = py::len(connectivities_py);
+    for (const py::sequence *seq: {
+        &nparts_py, &eptrs_py, &einds_py, &n_vertices_py, &tpwgts_py,
+        &elmwgts_py, &elmsizes_py, &gtypes_py, &ncommons_py, &options_py})
+      if (py::len(*seq) != njobs)
+        throw py::value_error("all per-mesh arguments must have the same length");
+
+    std::vector<std::unique_ptr<part_mesh_job>> jobs;
+    jobs.reserve(njobs);
+    for (size_t i = 0; i < njobs; ++i)
+      jobs.emplace_back(new part_mesh_job(
+          mesh_input::from_py(
+            connectivities_py[i], eptrs_py[i], einds_py[i], n_vertices_py[i],
+            warn_on_copies),
+          py::cast<idx_t>(nparts_py[i]),
+          py::cast<idx_t>(gtypes_py[i]),
+          py::cast<idx_t>(ncommons_py[i]),
+          tpwgts_py[i],
+          elmwgts_py[i],
+          elmsizes_py[i],
+          py::cast<const metis_options &>(options_py[i]),
+          warn_on_copies));
+
+    {
+      py::gil_scoped_release release;
+      run_in_parallel(njobs, nthreads, [&](size_t i) { jobs[i]->run(); });
     }
 
-    return py::make_tuple(edgeCuts,
-                          elemPart.as_array(),
-                          vertPart.as_array()
-                          );
+    py::list result;
+    for (size_t i = 0; i < njobs; ++i)
+    {
+      assert_ok(jobs[i]->info,
+          (std::string(jobs[i]->failure_message())
+           + " for mesh " + std::to_string(i)).c_str());
+      result.append(jobs[i]->result());
+    }
+    return result;
   }
 
+  // }}}
+
+
   class options_indices { };
   class Status { };
   class OPType { };
@@ -608,8 +4101,75 @@ PYBIND11_MODULE(_internal, m)
   #pragma clang diagnostic pop
 
   m.def("verify_nd", wrap_verify_nd);
-  m.def("node_nd", wrap_node_nd);
-  m.def("edge_nd", wrap_node_nd);  // DEPRECATED
+  m.def("node_nd", wrap_node_nd,
+        py::arg("xadj"),
+        py::arg("adjncy"),
+        py::arg("vwgt"),
+        py::arg("options"),
+        py::arg("perm_out")=py::none(),
+        py::arg("iperm_out")=py::none(),
+        py::arg("return_stats")=false,
+        py::arg("collect_timings")=false,
+        py::arg("max_memory")=0
+        );
+  m.def("node_ndp", wrap_node_ndp,
+        py::arg("xadj"),
+        py::arg("adjncy"),
+        py::arg("vwgt"),
+        py::arg("npes"),
+        py::arg("options"),
+        py::arg("perm_out")=py::none(),
+        py::arg("iperm_out")=py::none(),
+        py::arg("return_stats")=false,
+        py::arg("collect_timings")=false,
+        py::arg("max_memory")=0
+        );
+  m.def("ordering_stats", wrap_ordering_stats,
+        py::arg("xadj"),
+        py::arg("adjncy"),
+        py::arg("perm"),
+        py::arg("iperm")
+        );
+  m.def("symbolic_analysis", wrap_symbolic_analysis,
+        py::arg("xadj"),
+        py::arg("adjncy"),
+        py::arg("perm"),
+        py::arg("iperm")
+        );
+  m.def("cache_friendly_reordering", wrap_cache_friendly_reordering,
+        py::arg("xadj"),
+        py::arg("adjncy"),
+        py::arg("part"),
+        py::arg("vwgt"),
+        py::arg("adjwgt"),
+        py::arg("permute_graph")
+        );
+  m.def("compute_vertex_separator", wrap_compute_vertex_separator,
+        py::arg("xadj"),
+        py::arg("adjncy"),
+        py::arg("vwgt"),
+        py::arg("options"),
+        py::arg("out")=py::none()
+        );
+  m.def("node_refine", wrap_node_refine,
+        py::arg("xadj"),
+        py::arg("adjncy"),
+        py::arg("vwgt"),
+        py::arg("part"),
+        py::arg("ubfactor"),
+        py::arg("out")=py::none()
+        );
+  m.def("edge_nd", wrap_node_nd,  // DEPRECATED
+        py::arg("xadj"),
+        py::arg("adjncy"),
+        py::arg("vwgt"),
+        py::arg("options"),
+        py::arg("perm_out")=py::none(),
+        py::arg("iperm_out")=py::none(),
+        py::arg("return_stats")=false,
+        py::arg("collect_timings")=false,
+        py::arg("max_memory")=0
+        );
   m.def("part_graph", wrap_part_graph,
         py::arg("nparts"),
         py::arg("xadj"),
@@ -618,10 +4178,176 @@ PYBIND11_MODULE(_internal, m)
         py::arg("vsize"),
         py::arg("adjwgt"),
         py::arg("tpwgts"),
+        py::arg("ubvec"),
+        py::arg("options"),
+        py::arg("recursive"),
+        py::arg("warn_on_copies")=false,
+        py::arg("out")=py::none(),
+        py::arg("collect_timings")=false,
+        py::arg("max_memory")=0
+        );
+  m.def("part_mesh", wrap_part_mesh,
+        py::arg("nparts"),
+        py::arg("connectivity"),
+        py::arg("eptr"),
+        py::arg("eind"),
+        py::arg("n_vertices"),
+        py::arg("tpwgts"),
+        py::arg("element_weights"),
+        py::arg("element_sizes"),
+        py::arg("gtype"),
+        py::arg("ncommon"),
+        py::arg("options"),
+        py::arg("warn_on_copies")=false,
+        py::arg("elem_part_out")=py::none(),
+        py::arg("vert_part_out")=py::none(),
+        py::arg("collect_timings")=false,
+        py::arg("max_memory")=0
+        );
+  m.def("mesh_csr", wrap_mesh_csr,
+        py::arg("connectivity"),
+        py::arg("eptr"),
+        py::arg("eind"),
+        py::arg("n_vertices"),
+        py::arg("warn_on_copies")=false
+        );
+  m.def("mesh_to_graph", wrap_mesh_to_graph,
+        py::arg("eptr"),
+        py::arg("eind"),
+        py::arg("nn"),
+        py::arg("dual"),
+        py::arg("ncommon"),
+        py::arg("warn_on_copies")=false
+        );
+  m.def("partition_stats", wrap_partition_stats,
+        py::arg("xadj"),
+        py::arg("adjncy"),
+        py::arg("part"),
+        py::arg("vwgt"),
+        py::arg("vsize"),
+        py::arg("adjwgt"),
+        py::arg("nparts"),
+        py::arg("warn_on_copies")=false
+        );
+  m.def("refine_kway", wrap_refine_kway,
+        py::arg("xadj"),
+        py::arg("adjncy"),
+        py::arg("vwgt"),
+        py::arg("adjwgt"),
+        py::arg("part"),
+        py::arg("nparts"),
+        py::arg("tpwgts"),
+        py::arg("ubvec"),
+        py::arg("options"),
+        py::arg("warn_on_copies")=false,
+        py::arg("out")=py::none()
+        );
+  m.def("remap_partition", wrap_remap_partition,
+        py::arg("old_part"),
+        py::arg("new_part"),
+        py::arg("vsize"),
+        py::arg("nparts"),
+        py::arg("remap"),
+        py::arg("out")=py::none()
+        );
+  m.def("make_contiguous", wrap_make_contiguous,
+        py::arg("xadj"),
+        py::arg("adjncy"),
+        py::arg("part"),
+        py::arg("vwgt"),
+        py::arg("adjwgt"),
+        py::arg("nparts"),
+        py::arg("warn_on_copies")=false,
+        py::arg("out")=py::none()
+        );
+  m.def("element_weights_from_arity", wrap_element_weights_from_arity,
+        py::arg("connectivity"),
+        py::arg("eptr"),
+        py::arg("costs"),
+        py::arg("default_cost")
+        );
+  m.def("part_graph_many", wrap_part_graph_many,
+        py::arg("nparts"),
+        py::arg("xadjs"),
+        py::arg("adjncys"),
+        py::arg("vwgts"),
+        py::arg("vsizes"),
+        py::arg("adjwgts"),
+        py::arg("tpwgts"),
+        py::arg("ubvecs"),
+        py::arg("options"),
+        py::arg("recursive"),
+        py::arg("nthreads"),
+        py::arg("warn_on_copies")=false
+        );
+  m.def("part_graph_best_of", wrap_part_graph_best_of,
+        py::arg("nparts"),
+        py::arg("xadj"),
+        py::arg("adjncy"),
+        py::arg("vwgt"),
+        py::arg("vsize"),
+        py::arg("adjwgt"),
+        py::arg("tpwgts"),
+        py::arg("ubvec"),
         py::arg("options"),
         py::arg("recursive"),
+        py::arg("seeds"),
+        py::arg("nthreads"),
+        py::arg("warn_on_copies")=false
+        );
+  m.def("part_mesh_many", wrap_part_mesh_many,
+        py::arg("nparts"),
+        py::arg("connectivities"),
+        py::arg("eptrs"),
+        py::arg("einds"),
+        py::arg("n_vertices"),
+        py::arg("tpwgts"),
+        py::arg("element_weights"),
+        py::arg("element_sizes"),
+        py::arg("gtypes"),
+        py::arg("ncommons"),
+        py::arg("options"),
+        py::arg("nthreads"),
         py::arg("warn_on_copies")=false
         );
-  m.def("part_mesh", wrap_part_mesh);
+  m.def("csr_from_adjacency", wrap_csr_from_adjacency,
+        py::arg("adjacency"));
   m.def("_idx_type_width", []() { return IDXTYPEWIDTH; });
+  m.def("read_graph", wrap_read_graph,
+        py::arg("filename"));
+  m.def("read_mesh", wrap_read_mesh,
+        py::arg("filename"));
+  m.def("write_index_file", wrap_write_index_file,
+        py::arg("filename"),
+        py::arg("values"));
+  m.def("grid_graph", wrap_grid_graph,
+        py::arg("nx"),
+        py::arg("ny"),
+        py::arg("nz")
+        );
+  m.def("random_geometric_graph", wrap_random_geometric_graph,
+        py::arg("nvtxs"),
+        py::arg("radius"),
+        py::arg("dim"),
+        py::arg("seed")
+        );
+  m.def("power_law_graph", wrap_power_law_graph,
+        py::arg("nvtxs"),
+        py::arg("m"),
+        py::arg("seed")
+        );
+  m.def("tet_mesh", wrap_tet_mesh,
+        py::arg("nx"),
+        py::arg("ny"),
+        py::arg("nz")
+        );
+  m.def("hash_array", wrap_hash_array,
+        py::arg("array"),
+        py::arg("real")=false
+        );
+  m.def("metis_version", []()
+      {
+        return py::make_tuple(
+            METIS_VER_MAJOR, METIS_VER_MINOR, METIS_VER_SUBMINOR);
+      });
 }
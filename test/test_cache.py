@@ -0,0 +1,139 @@
+import numpy as np
+import pytest
+
+import pymetis
+from pymetis.cache import PartitionCache
+
+
+def _grid_adjacency(n):
+    return [
+        [(i + di) * n + j + dj
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < n and 0 <= j + dj < n]
+        for i in range(n) for j in range(n)]
+
+
+def test_hash_array():
+    from pymetis._internal import hash_array
+
+    tp = pymetis.zero_copy_dtype()
+    a = np.arange(1000, dtype=tp)
+    assert hash_array(a) == hash_array(list(range(1000)))
+    assert hash_array(a) == hash_array(a.astype(np.int32))
+    assert hash_array(a) != hash_array(a[::-1].copy())
+    assert hash_array(a.reshape(500, 2)) != hash_array(a)
+    assert hash_array(None) == hash_array([])
+
+    b = a.copy()
+    b[517] += 1
+    assert hash_array(a) != hash_array(b)
+
+    assert hash_array([0.5, 0.5], real=True) != hash_array([0.25, 0.75], real=True)
+
+
+def test_part_graph_cache():
+    csr = pymetis.to_csr_adjacency(_grid_adjacency(20))
+    cache = PartitionCache(max_entries=2)
+
+    opts = pymetis.Options(seed=3)
+    first = pymetis.part_graph(4, csr, options=opts, cache=cache)
+    second = pymetis.part_graph(4, csr, options=opts, cache=cache)
+    assert cache.stats()[:3] == (1, 0, 1)
+    assert second.edge_cuts == first.edge_cuts
+    assert np.array_equal(second.vertex_part, first.vertex_part)
+    # the cached result is not shared with the caller
+    second.vertex_part[:] = 0
+    third = pymetis.part_graph(4, csr, options=opts, cache=cache)
+    assert np.array_equal(third.vertex_part, first.vertex_part)
+
+    out = np.empty(400, dtype=pymetis.zero_copy_dtype())
+    result = pymetis.part_graph(4, csr, options=opts, cache=cache, out=out)
+    assert result.vertex_part is out
+    assert np.array_equal(out, first.vertex_part)
+
+    # out is checked as on a miss, not reinterpreted
+    hits = cache.hits
+    with pytest.raises(TypeError):
+        pymetis.part_graph(4, csr, options=opts, cache=cache,
+                           out=np.zeros(out.nbytes // 4, np.float32))
+    with pytest.raises(TypeError):
+        pymetis.part_graph(4, csr, options=opts, cache=cache,
+                           out=np.zeros(2 * 400, pymetis.zero_copy_dtype())[::2])
+    with pytest.raises(ValueError):
+        pymetis.part_graph(4, csr, options=opts, cache=cache,
+                           out=np.zeros(399, pymetis.zero_copy_dtype()))
+    assert cache.hits == hits + 3
+
+    # any change of the inputs is a miss
+    pymetis.part_graph(4, csr, options=pymetis.Options(seed=4), cache=cache)
+    pymetis.part_graph(3, csr, options=opts, cache=cache)
+    pymetis.part_graph(4, csr, vweights=np.full(400, 2), options=opts, cache=cache)
+    assert cache.misses == 4
+
+    # least recently used results are evicted
+    assert cache.stats().entries == 2
+    pymetis.part_graph(4, csr, options=opts, cache=cache)
+    assert cache.misses == 5
+
+
+def test_part_mesh_cache():
+    # elements of differing arity
+    connectivity = [[0, 1, 2], [1, 2, 3, 4], [2, 4, 5], [3, 4, 6, 7]]
+    cache = PartitionCache()
+
+    first = pymetis.part_mesh(2, connectivity, cache=cache)
+    uncached = pymetis.part_mesh(2, connectivity)
+    assert first.edge_cuts == uncached.edge_cuts
+    assert np.array_equal(first.element_part, uncached.element_part)
+    assert np.array_equal(first.vertex_part, uncached.vertex_part)
+
+    # the same mesh in CSR form has the same key
+    tp = pymetis.zero_copy_dtype()
+    csr = pymetis.CSRMesh(
+        elem_starts=np.array([0, 3, 7, 10, 14], dtype=tp),
+        elem_vertices=np.array(
+            [vertex for elem in connectivity for vertex in elem], dtype=tp))
+    second = pymetis.part_mesh(2, csr, cache=cache)
+    assert cache.stats()[:3] == (1, 0, 1)
+    assert np.array_equal(second.element_part, first.element_part)
+
+
+def test_disk_cache(tmp_path):
+    adjacency = _grid_adjacency(12)
+    cache = PartitionCache(directory=tmp_path)
+
+    perm, iperm = pymetis.nested_dissection(adjacency, cache=cache)
+    ordering, stats = pymetis.nested_dissection(
+        adjacency, npes=4, return_stats=True, cache=cache)
+    assert cache.stats().disk_bytes > 0
+
+    # a new cache (e.g. in another process) finds the results on disk
+    cache = PartitionCache(directory=tmp_path)
+    cached_perm, cached_iperm = pymetis.nested_dissection(adjacency, cache=cache)
+    cached_ordering, cached_stats = pymetis.nested_dissection(
+        adjacency, npes=4, return_stats=True, cache=cache)
+    assert cache.disk_hits == 2
+    assert np.array_equal(cached_perm, perm)
+    assert np.array_equal(cached_iperm, iperm)
+    assert isinstance(cached_ordering, pymetis.SeparatorTreeOrdering)
+    assert np.array_equal(cached_ordering.sizes, ordering.sizes)
+    assert cached_stats == stats
+
+    pymetis.nested_dissection(adjacency, cache=cache)
+    assert cache.hits == 1
+
+    # eviction keeps the store below its size limit
+    small = PartitionCache(directory=tmp_path, max_disk_bytes=3000)
+    connectivity = [[0, 1, 2], [1, 2, 3], [2, 3, 4], [3, 4, 5]]
+    mesh_part = pymetis.part_mesh(2, connectivity, cache=small)
+    assert small.stats().disk_bytes <= 3000
+    assert small.stats().disk_bytes > 0
+
+    small.clear(disk=True)
+    assert small.stats()[3:] == (0, 0)
+    cached = pymetis.part_mesh(2, connectivity, cache=small)
+    assert cached.edge_cuts == mesh_part.edge_cuts
+    assert np.array_equal(cached.element_part, mesh_part.element_part)
+
+    with pytest.raises(ValueError):
+        PartitionCache(max_entries=-1)
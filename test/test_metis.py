@@ -20,6 +20,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 THE SOFTWARE.
 """
 
+from itertools import pairwise
 from warnings import catch_warnings
 
 import numpy as np
@@ -138,11 +139,210 @@ def test_part_graph_with_weights():
     adj = grid_adjacency(9, 9)
     tpwgts = [0.8, 0.2]
     _cuts, parts = pymetis.part_graph(2, adjacency=adj, tpwgts=tpwgts)
-    counts = [parts.count(it) for it in range(2)]
+    counts = [int(np.count_nonzero(parts == it)) for it in range(2)]
     nvert = len(adj)
     assert counts == [int(nvert * tpwgts[0]), int(nvert * tpwgts[1])]
 
 
+def test_threaded_part_graph():
+    from concurrent.futures import ThreadPoolExecutor
+
+    def grid_adjacency(n):
+        adj = []
+        for j in range(n):
+            for i in range(n):
+                nbr = []
+                if i > 0:
+                    nbr.append(i - 1 + j * n)
+                if i < n - 1:
+                    nbr.append(i + 1 + j * n)
+                if j > 0:
+                    nbr.append(i + (j - 1) * n)
+                if j < n - 1:
+                    nbr.append(i + (j + 1) * n)
+                adj.append(nbr)
+        return adj
+
+    graphs = [grid_adjacency(n) for n in range(20, 36)]
+
+    def partition(adj):
+        return pymetis.part_graph(5, adj, options=pymetis.Options(seed=17))
+
+    serial = [partition(adj) for adj in graphs]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for _ in range(3):
+            threaded = list(pool.map(partition, graphs))
+            for ser, thr in zip(serial, threaded, strict=True):
+                assert ser.edge_cuts == thr.edge_cuts
+                assert list(ser.vertex_part) == list(thr.vertex_part)
+
+
+def test_part_graph_many():
+    tp = pymetis.zero_copy_dtype()
+
+    graphs = [
+        [[1, 2], [0, 2], [0, 1]],
+        pymetis.CSRAdjacency(
+            adj_starts=np.array([0, 2, 4, 6, 6], tp),
+            adjacent=np.array([1, 2, 0, 2, 1, 3], tp)),
+        [[1], [0, 2], [1, 3], [2]],
+        ]
+    nparts = [2, 1, 3]
+    vweights = [None, None, [1, 2, 3, 4]]
+
+    results = pymetis.part_graph_many(nparts, graphs, vweights=vweights,
+                                      nthreads=2)
+
+    assert len(results) == len(graphs)
+    for result, adj, np_, vw in zip(results, graphs, nparts, vweights,
+                                    strict=True):
+        expected = pymetis.part_graph(np_, adj, vweights=vw)
+        assert isinstance(result, pymetis.GraphPartition)
+        assert result.edge_cuts == expected.edge_cuts
+        assert list(result.vertex_part) == list(expected.vertex_part)
+
+    with pytest.raises(ValueError):
+        pymetis.part_graph_many([2, 2], graphs)
+
+    with pytest.raises(ValueError):
+        pymetis.part_graph_many(2, graphs, vweights=[None, None, [1, 2]])
+
+
+@pytest.mark.parametrize("objtype", ["cut", "vol"])
+def test_part_graph_best_of(objtype):
+    n = 30
+    adj = [
+        [i + dx + (j + dy) * n
+         for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + dx < n and 0 <= j + dy < n]
+        for j in range(n) for i in range(n)]
+
+    opts = pymetis.Options(objtype=getattr(pymetis.ObjType, objtype.upper()))
+    seeds = [3, 5, 8, 13, 21]
+    result = pymetis.part_graph_best_of(6, adj, seeds=seeds, options=opts,
+                                        recursive=False, nthreads=3)
+
+    assert list(result.seeds) == seeds
+    assert len(result.trial_objvals) == len(seeds)
+    assert result.edge_cuts == min(result.trial_objvals)
+    assert result.trial_objvals[result.best_trial] == result.edge_cuts
+
+    for seed, objval in zip(seeds, result.trial_objvals, strict=True):
+        opts.seed = seed
+        single = pymetis.part_graph(6, adj, options=opts, recursive=False)
+        assert single.edge_cuts == objval
+
+    with pytest.raises(ValueError):
+        pymetis.part_graph_best_of(6, adj, trials=2, seeds=seeds)
+
+
+def test_part_graph_multi_constraint():
+    n = 24
+    adj = [
+        [i + dx + (j + dy) * n
+         for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + dx < n and 0 <= j + dy < n]
+        for j in range(n) for i in range(n)]
+    nvtxs = len(adj)
+
+    tp = pymetis.zero_copy_dtype()
+    vweights = np.empty((nvtxs, 2), dtype=tp)
+    vweights[:, 0] = 1
+    # memory footprint concentrated in one corner of the grid
+    vweights[:, 1] = np.where(np.arange(nvtxs) % n < n // 4, 10, 1)
+
+    nparts = 4
+    for recursive in [True, False]:
+        _cuts, part = pymetis.part_graph(
+            nparts, adj, vweights=vweights, ubvec=[1.05, 1.1],
+            recursive=recursive)
+        part = np.asarray(part)
+
+        for icon, ub in enumerate([1.05, 1.1]):
+            loads = np.bincount(part, weights=vweights[:, icon],
+                                minlength=nparts)
+            assert loads.max() <= ub * loads.sum() / nparts + vweights[:, icon].max()
+
+    # per-constraint target weights
+    tpwgts = np.array([[0.4, 0.25], [0.2, 0.25], [0.2, 0.25], [0.2, 0.25]])
+    _cuts, part = pymetis.part_graph(
+        nparts, adj, vweights=vweights, tpwgts=tpwgts, recursive=False)
+    loads = np.bincount(np.asarray(part), weights=vweights[:, 0],
+                        minlength=nparts)
+    assert loads[0] == pytest.approx(0.4 * nvtxs, rel=0.1)
+
+    # zero-copy for C-contiguous arrays
+    with catch_warnings(record=True) as wlist:
+        csr = pymetis.CSRAdjacency(
+            adj_starts=np.cumsum([0] + [len(a) for a in adj], dtype=tp),
+            adjacent=np.concatenate(adj).astype(tp))
+        pymetis.part_graph(nparts, csr, vweights=vweights,
+                           ubvec=np.array([1.05, 1.1]), tpwgts=tpwgts,
+                           warn_on_copies=True)
+        assert not wlist
+
+    # nested lists are flattened the same way
+    _cuts, part_list = pymetis.part_graph(
+        nparts, adj, vweights=vweights.tolist(), recursive=False)
+    _cuts, part_ary = pymetis.part_graph(
+        nparts, adj, vweights=vweights, recursive=False)
+    assert list(part_list) == list(part_ary)
+
+    with pytest.raises(ValueError):
+        pymetis.part_graph(nparts, adj, vweights=vweights, ubvec=[1.05])
+    with pytest.raises(ValueError):
+        pymetis.part_graph(nparts, adj, vweights=vweights[:-1])
+    with pytest.raises(ValueError):
+        pymetis.part_graph(nparts, adj, vweights=vweights,
+                           tpwgts=np.full((nparts, 3), 1 / nparts))
+
+    # floating point buffers are not truncated to integers
+    with pytest.raises(TypeError):
+        pymetis.part_graph(nparts, adj, vweights=vweights + 0.5)
+    with pytest.raises(TypeError):
+        pymetis.part_graph(nparts, pymetis.CSRAdjacency(
+            adj_starts=csr.adj_starts,
+            adjacent=np.asarray(csr.adjacent, dtype=np.float64)))
+
+
+def test_to_csr_adjacency():
+    tp = pymetis.zero_copy_dtype()
+    expected_starts = [0, 2, 3, 3, 6]
+    expected_adjacent = [1, 3, 0, 0, 1, 2]
+
+    rows = [[1, 3], [0], [], [0, 1, 2]]
+    for adjacency in [
+            rows,
+            tuple(rows),
+            dict(enumerate(rows)),
+            [np.array(r, dtype=np.int32) for r in rows],
+            [np.array(r, dtype=np.uint16) for r in rows],
+            [np.array(r, dtype=np.int64) for r in rows],
+            [np.array(r, dtype=np.float64) for r in rows],
+            [tuple(np.int64(i) for i in r) for r in rows],
+            ]:
+        csr = pymetis.to_csr_adjacency(adjacency)
+        assert isinstance(csr, pymetis.CSRAdjacency)
+        assert csr.adj_starts.dtype == tp
+        assert csr.adjacent.dtype == tp
+        assert list(csr.adj_starts) == expected_starts
+        assert list(csr.adjacent) == expected_adjacent
+
+    csr = pymetis.to_csr_adjacency(rows)
+    assert pymetis.to_csr_adjacency(csr) is csr
+    assert (list(pymetis.part_graph(2, csr).vertex_part)
+            == list(pymetis.part_graph(2, rows).vertex_part))
+
+    for bad in [[[1], [2]], [[-1], [0]], [np.array([0, 5])]]:
+        with pytest.raises(ValueError):
+            pymetis.to_csr_adjacency(bad)
+    with pytest.raises(ValueError):
+        pymetis.to_csr_adjacency([np.array([5], dtype=np.uint8)])
+
+    with pytest.raises(KeyError):
+        pymetis.to_csr_adjacency({1: [0], 2: [1]})
+
+
 def test_zero_copy():
     tp = pymetis.zero_copy_dtype()
 
@@ -170,6 +370,43 @@ def test_zero_copy():
         assert not wlist
 
 
+def test_output_arrays():
+    tp = pymetis.zero_copy_dtype()
+    adjacency = pymetis.CSRAdjacency(
+        adj_starts=np.array([0, 2, 4, 6, 8], tp),
+        adjacent=np.array([1, 3, 0, 2, 1, 3, 2, 0], tp))
+
+    _cuts, part = pymetis.part_graph(2, adjacency)
+    assert isinstance(part, np.ndarray)
+    assert part.dtype == tp
+
+    out = np.full(4, -1, dtype=tp)
+    _cuts, part = pymetis.part_graph(2, adjacency, out=out)
+    assert part is out
+    assert set(out) == {0, 1}
+
+    # nparts == 1 is special-cased, but should still honor out
+    out.fill(-1)
+    _cuts, part = pymetis.part_graph(1, adjacency, out=out)
+    assert part is out
+    assert not out.any()
+
+    perm_out = np.empty(4, dtype=tp)
+    iperm_out = np.empty(4, dtype=tp)
+    perm, iperm = pymetis.nested_dissection(
+        adjacency, perm_out=perm_out, iperm_out=iperm_out)
+    assert perm is perm_out
+    assert iperm is iperm_out
+    assert (perm[iperm] == np.arange(4)).all()
+
+    with pytest.raises(ValueError):
+        pymetis.part_graph(2, adjacency, out=np.empty(5, dtype=tp))
+    with pytest.raises(TypeError):
+        pymetis.part_graph(2, adjacency, out=np.empty(4, dtype=np.int16))
+    with pytest.raises(TypeError):
+        pymetis.part_graph(2, adjacency, out=np.empty(8, dtype=tp)[::2])
+
+
 @pytest.mark.parametrize("weighted", [True, False])
 def test_nested_dissection(weighted):
     pytest.importorskip("scipy")
@@ -192,6 +429,755 @@ def test_nested_dissection(weighted):
     assert np.all(perm[iperm] == np.array(range(perm.size)))
 
 
+def test_nested_dissection_npes():
+    n = 20
+    adjacency = [
+        [(i + di) * n + j + dj
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < n and 0 <= j + dj < n]
+        for i in range(n) for j in range(n)]
+
+    perm, iperm, sizes = pymetis.nested_dissection(adjacency, npes=4)
+    assert sorted(perm) == list(range(n * n))
+    assert len(sizes) == 7
+    assert sum(sizes) == n * n
+    assert min(sizes[:4]) > 0.15 * n * n
+
+    # label each vertex with its node in the separator tree, in postorder
+    postorder = [0, 1, 4, 2, 3, 5, 6]
+    block = np.repeat(postorder, [sizes[i] for i in postorder])[np.asarray(iperm)]
+
+    # vertices in different subtrees must not be adjacent
+    subtree = {0: {0}, 1: {1}, 2: {2}, 3: {3}, 4: {0, 1, 4}, 5: {2, 3, 5}}
+    for v, neighbors in enumerate(adjacency):
+        for w in neighbors:
+            bv, bw = int(block[v]), int(block[w])
+            if bv in subtree and bw in subtree:
+                assert bv in subtree[bw] or bw in subtree[bv]
+
+    with pytest.raises(ValueError):
+        pymetis.nested_dissection(adjacency, npes=3)
+
+
+def _random_symmetric_pattern(n, density, seed):
+    rng = np.random.default_rng(seed)
+    dense = rng.random((n, n)) < density
+    dense = dense | dense.T
+    np.fill_diagonal(dense, False)
+    return dense
+
+
+def _symbolic_cholesky(dense, perm):
+    """Return the nonzero pattern of the Cholesky factor of the reordered
+    matrix, and its elimination tree, by brute force.
+    """
+    n = len(dense)
+    pattern = dense[np.ix_(perm, perm)] | np.eye(n, dtype=bool)
+    for k in range(n):
+        below = np.flatnonzero(pattern[k + 1:, k]) + k + 1
+        pattern[np.ix_(below, below)] = True
+    lower = np.tril(pattern)
+
+    parent = [below[0] if len(below := np.flatnonzero(lower[k + 1:, k]) + k + 1)
+              else -1 for k in range(n)]
+    return lower, parent
+
+
+def test_ordering_stats():
+    n = 60
+    dense = _random_symmetric_pattern(n, 0.05, seed=17)
+    adjacency = [np.flatnonzero(row) for row in dense]
+
+    perm, iperm = pymetis.nested_dissection(adjacency)
+
+    lower, parent = _symbolic_cholesky(dense, perm)
+    colcount = lower.sum(axis=0)
+    depth = [0] * n
+    for k in reversed(range(n)):
+        depth[k] = 1 if parent[k] == -1 else depth[parent[k]] + 1
+
+    stats = pymetis.ordering_stats(adjacency, perm, iperm)
+    assert stats == (lower.sum(), (colcount ** 2).sum(), colcount.max(), max(depth))
+    assert pymetis.ordering_stats(adjacency, perm) == stats
+
+    (perm2, _iperm2), stats2 = pymetis.nested_dissection(
+        adjacency, return_stats=True)
+    assert list(perm2) == list(perm)
+    assert stats2 == stats
+
+    _ordering, stats4 = pymetis.nested_dissection(
+        adjacency, npes=2, return_stats=True)
+    assert stats4.nnz_l >= n
+
+    with pytest.raises(ValueError):
+        pymetis.ordering_stats(adjacency, perm, perm[::-1].copy())
+
+
+def test_symbolic_analysis():
+    n = 80
+    dense = _random_symmetric_pattern(n, 0.04, seed=5)
+    csr = pymetis.to_csr_adjacency([np.flatnonzero(row) for row in dense])
+
+    perm, iperm = pymetis.nested_dissection(csr)
+    parent, postorder, colcount, sn_starts = pymetis.symbolic_analysis(
+        csr, perm, iperm)
+
+    lower, ref_parent = _symbolic_cholesky(dense, perm)
+    assert list(parent) == ref_parent
+    assert list(colcount) == list(lower.sum(axis=0))
+
+    # children precede parents in the postorder, and subtrees are contiguous
+    assert sorted(postorder) == list(range(n))
+    position = np.empty(n, dtype=int)
+    position[postorder] = np.arange(n)
+    for k in range(n):
+        if parent[k] != -1:
+            assert position[k] < position[parent[k]]
+    subtree_size = np.ones(n, dtype=int)
+    for k in range(n):
+        if parent[k] != -1:
+            subtree_size[parent[k]] += subtree_size[k]
+    for k in range(n):
+        assert (sorted(postorder[position[k] - subtree_size[k] + 1:position[k] + 1])
+                == sorted(j for j in range(n)
+                          if any(a == k for a in _ancestors(parent, j))))
+
+    # columns in a fundamental supernode have nested structure
+    assert sn_starts[0] == 0
+    assert sn_starts[-1] == n
+    for start, end in pairwise(sn_starts):
+        for j in range(start, end - 1):
+            assert parent[j] == j + 1
+            assert np.array_equal(lower[j + 2:, j], lower[j + 2:, j + 1])
+
+    assert pymetis.symbolic_analysis(csr, perm).parent.tolist() == list(parent)
+
+
+def _ancestors(parent, j):
+    while j != -1:
+        yield j
+        j = parent[j]
+
+
+def test_partition_stats():
+    n = 12
+    adjacency = [
+        [(i + di) * n + j + dj
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < n and 0 <= j + dj < n]
+        for i in range(n) for j in range(n)]
+    csr = pymetis.to_csr_adjacency(adjacency)
+    tp = pymetis.zero_copy_dtype()
+
+    rng = np.random.default_rng(9)
+    vweights = rng.integers(1, 5, size=(n * n, 2)).astype(tp)
+    eweights = rng.integers(1, 5, size=len(csr.adjacent)).astype(tp)
+    # make edge weights symmetric
+    starts = csr.adj_starts
+    for u in range(n * n):
+        for j in range(starts[u], starts[u + 1]):
+            v = csr.adjacent[j]
+            if v < u:
+                rev = starts[v] + list(csr.adjacent[starts[v]:starts[v + 1]]).index(u)
+                eweights[j] = eweights[rev]
+    vsize = rng.integers(1, 3, size=n * n).astype(tp)
+
+    edge_cuts, part = pymetis.part_graph(4, csr, eweights=eweights,
+                                         options=pymetis.Options(seed=1))
+    assert pymetis.partition_stats(csr, part, eweights=eweights).edge_cut \
+        == edge_cuts
+
+    # make part 3 disconnected
+    part[0] = 3
+    part[-1] = 3
+
+    stats = pymetis.partition_stats(csr, part, vweights, eweights, vsize,
+                                    nparts=5, warn_on_copies=True)
+
+    # reference values, the slow way
+    cut = volume = 0
+    comm_volume = [0] * 5
+    neighbors = [set() for _ in range(5)]
+    boundary = [0] * 5
+    for u in range(n * n):
+        foreign = set()
+        for j in range(starts[u], starts[u + 1]):
+            v = csr.adjacent[j]
+            if part[v] != part[u]:
+                cut += eweights[j]
+                foreign.add(int(part[v]))
+        neighbors[part[u]] |= foreign
+        boundary[part[u]] += bool(foreign)
+        comm_volume[part[u]] += vsize[u] * len(foreign)
+        volume += vsize[u] * len(foreign)
+
+    part_weights = np.array([vweights[part == ip].sum(axis=0) for ip in range(5)])
+
+    assert stats.edge_cut == cut // 2
+    assert stats.total_comm_volume == volume
+    assert list(stats.comm_volume) == comm_volume
+    assert stats.max_comm_volume == max(comm_volume)
+    assert np.array_equal(stats.part_weights, part_weights)
+    assert np.allclose(stats.imbalance,
+                       part_weights.max(axis=0) * 5 / part_weights.sum(axis=0))
+    assert list(stats.boundary_vertices) == boundary
+    assert list(stats.neighbor_parts) == [len(nb) for nb in neighbors]
+    assert stats.components[3] >= 2
+    assert stats.components[4] == 0
+
+    unweighted = pymetis.partition_stats(adjacency, part)
+    assert len(unweighted.comm_volume) == 4
+    assert list(unweighted.part_weights) == [
+        np.count_nonzero(part == ip) for ip in range(4)]
+
+    with pytest.raises(ValueError):
+        pymetis.partition_stats(csr, part, nparts=3)
+
+
+def test_make_contiguous():
+    n = 12
+    adjacency = [
+        [(i + di) * n + j + dj
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < n and 0 <= j + dj < n]
+        for i in range(n) for j in range(n)]
+    # an isolated vertex, which cannot be merged with anything
+    adjacency.append([])
+    csr = pymetis.to_csr_adjacency(adjacency)
+
+    _cuts, part = pymetis.part_graph(4, csr, options=pymetis.Options(seed=1))
+    part = np.array(part, dtype=pymetis.zero_copy_dtype())
+    part[-1] = 0
+    # scatter a few strays into the other parts
+    rng = np.random.default_rng(3)
+    for v in rng.choice(n * n, size=10, replace=False):
+        part[v] = (part[v] + 1) % 4
+    assert max(pymetis.partition_stats(csr, part).components) > 1
+
+    fixed, moved = pymetis.make_contiguous(csr, part)
+    stats = pymetis.partition_stats(csr, fixed)
+    assert moved > 0
+    # the isolated vertex is a component of part 0 of its own
+    assert stats.components[0] == 2
+    assert list(stats.components[1:]) == [1, 1, 1]
+    assert fixed[-1] == 0
+
+    # already contiguous: nothing to do, in place
+    again = fixed.copy()
+    result = pymetis.make_contiguous(csr, again, out=again)
+    assert result.moved_components == 0
+    assert result.vertex_part is again
+    assert np.array_equal(again, fixed)
+
+    with pytest.raises(ValueError):
+        pymetis.make_contiguous(csr, part, nparts=2)
+
+    # a split part is repaired even if another part is empty
+    path = pymetis.to_csr_adjacency(
+        [[1], [0, 2], [1, 3], [2, 4], [3, 5], [4]])
+    for split, nparts in [([0, 0, 1, 1, 0, 0], 3), ([0, 0, 2, 2, 0, 0], None)]:
+        fixed, moved = pymetis.make_contiguous(path, split, nparts=nparts)
+        assert moved == 1
+        stats = pymetis.partition_stats(path, fixed, nparts=3)
+        assert max(stats.components) == 1
+
+
+def test_refine_partition():
+    n = 30
+    adjacency = [
+        [(i + di) * n + j + dj
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < n and 0 <= j + dj < n]
+        for i in range(n) for j in range(n)]
+    csr = pymetis.to_csr_adjacency(adjacency)
+
+    cuts, part = pymetis.part_graph(4, csr, options=pymetis.Options(seed=1))
+
+    # perturb the boundary, as a small change of the graph would
+    rng = np.random.default_rng(5)
+    perturbed = np.array(part, dtype=pymetis.zero_copy_dtype())
+    for v in rng.choice(n * n, size=60, replace=False):
+        perturbed[v] = perturbed[rng.choice(adjacency[v])]
+    perturbed_cut = pymetis.partition_stats(csr, perturbed).edge_cut
+    assert perturbed_cut > cuts
+
+    refined_cut, refined = pymetis.refine_partition(csr, perturbed, 4)
+    stats = pymetis.partition_stats(csr, refined)
+    assert refined_cut == stats.edge_cut
+    assert refined_cut < perturbed_cut
+    assert stats.imbalance[0] <= 1.03 + 1e-12
+    # only boundary vertices move
+    assert np.count_nonzero(refined != perturbed) < n * n // 4
+
+    # refining an overweight partition restores the balance
+    skewed = np.array(part, dtype=pymetis.zero_copy_dtype())
+    skewed[np.flatnonzero(skewed == 1)[:40]] = 0
+    balanced = pymetis.refine_partition(
+        csr, skewed, options=pymetis.Options(niter=50)).vertex_part
+    assert pymetis.partition_stats(csr, balanced).imbalance[0] \
+        < pymetis.partition_stats(csr, skewed).imbalance[0]
+
+    # in place, with multiple constraints
+    vweights = np.ones((n * n, 2), dtype=pymetis.zero_copy_dtype())
+    result = pymetis.refine_partition(csr, perturbed, vweights=vweights,
+                                      ubvec=[1.05, 1.05], out=perturbed)
+    assert result.vertex_part is perturbed
+
+    with pytest.raises(ValueError):
+        pymetis.refine_partition(csr, perturbed, 2)
+
+
+def test_repartition():
+    n = 30
+    adjacency = [
+        [(i + di) * n + j + dj
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < n and 0 <= j + dj < n]
+        for i in range(n) for j in range(n)]
+    csr = pymetis.to_csr_adjacency(adjacency)
+    tp = pymetis.zero_copy_dtype()
+
+    _cuts, old_part = pymetis.part_graph(4, csr, options=pymetis.Options(seed=1))
+
+    # the load drifts towards one corner
+    rows, cols = np.divmod(np.arange(n * n), n)
+    vweights = np.where((rows < n // 3) & (cols < n // 3), 3, 1).astype(tp)
+    vsize = np.full(n * n, 2, dtype=tp)
+
+    results = [
+        pymetis.repartition(csr, old_part, 4, vweights, vsize, itr=itr,
+                            options=pymetis.Options(seed=2))
+        for itr in [1e-3, 1e6]]
+
+    for result in results:
+        stats = pymetis.partition_stats(csr, result.vertex_part, vweights)
+        assert result.edge_cuts == stats.edge_cut
+        assert result.migration_volume == 2 * np.count_nonzero(
+            result.vertex_part != old_part)
+        assert stats.imbalance[0] < 1.1
+
+    cheap_migration, cheap_cut = results
+    assert cheap_migration.migration_volume <= cheap_cut.migration_volume
+    assert cheap_cut.edge_cuts <= cheap_migration.edge_cuts
+    assert cheap_migration.migration_volume < n * n
+
+    # relabeled parts do not count as migration
+    relabeled = (np.asarray(old_part) + 1) % 4
+    result = pymetis.repartition(csr, relabeled, 4, itr=1e6,
+                                 options=pymetis.Options(seed=1))
+    assert result.migration_volume < n
+
+
+def test_reorder_for_locality():
+    n = 15
+    adjacency = [
+        [(i + di) * n + j + dj
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < n and 0 <= j + dj < n]
+        for i in range(n) for j in range(n)]
+    csr = pymetis.to_csr_adjacency(adjacency)
+    _cuts, part = pymetis.part_graph(3, csr)
+
+    old2new, new2old = pymetis.reorder_for_locality(csr, part)[:2]
+    assert sorted(new2old) == list(range(n * n))
+    assert list(np.asarray(old2new)[new2old]) == list(range(n * n))
+    assert np.all(np.diff(part[new2old]) >= 0)
+
+    # without a partition, this is a plain BFS-based ordering
+    assert sorted(pymetis.reorder_for_locality(adjacency).new2old) \
+        == list(range(n * n))
+
+    rng = np.random.default_rng(3)
+    vweights = rng.integers(1, 10, size=(n * n, 2))
+    eweights = rng.integers(1, 10, size=len(csr.adjacent))
+    result = pymetis.reorder_for_locality(
+        csr, part, vweights=vweights, eweights=eweights, permute_graph=True)
+
+    def edges(adj, o2n, ew):
+        return {
+            (int(o2n[u]), int(o2n[adj.adjacent[j]]), int(ew[j]))
+            for u in range(n * n)
+            for j in range(adj.adj_starts[u], adj.adj_starts[u + 1])}
+
+    identity = np.arange(n * n)
+    assert (edges(result.adjacency, identity, result.eweights)
+            == edges(csr, result.old2new, eweights))
+    assert np.array_equal(result.vweights, vweights[result.new2old])
+
+    with pytest.raises(ValueError):
+        pymetis.reorder_for_locality(csr, part[:-1])
+
+
+def test_compute_vertex_separator():
+    n = 20
+    adjacency = [
+        [(i + di) * n + j + dj
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < n and 0 <= j + dj < n]
+        for i in range(n) for j in range(n)]
+
+    sep_size, part = pymetis.compute_vertex_separator(
+        adjacency, options=pymetis.Options(seed=3))
+    part = np.asarray(part)
+
+    assert set(part.tolist()) == {0, 1, 2}
+    assert sep_size == np.count_nonzero(part == 2)
+    assert sep_size < 2 * n
+
+    for v, neighbors in enumerate(adjacency):
+        if part[v] != 2:
+            assert all(part[w] in (part[v], 2) for w in neighbors)
+
+    side_sizes = [np.count_nonzero(part == side) for side in (0, 1)]
+    assert min(side_sizes) > 0.3 * n * n
+
+    # heavy separator vertices make the separator weight larger
+    out = np.empty(n * n, dtype=pymetis.zero_copy_dtype())
+    weighted = pymetis.compute_vertex_separator(
+        adjacency, vweights=np.full(n * n, 3), out=out)
+    assert weighted.part is out
+    assert weighted.separator_size == 3 * np.count_nonzero(out == 2)
+
+
+def test_refine_vertex_separator():
+    n = 20
+    adjacency = [
+        [(i + di) * n + j + dj
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < n and 0 <= j + dj < n]
+        for i in range(n) for j in range(n)]
+
+    # a needlessly thick separator: two full columns
+    cols = np.tile(np.arange(n), n)
+    part = np.where(cols < n // 2, 0, np.where(cols > n // 2 + 1, 1, 2))
+    part = part.astype(pymetis.zero_copy_dtype())
+
+    sep_size, refined = pymetis.refine_vertex_separator(adjacency, part)
+    refined = np.asarray(refined)
+    assert sep_size == np.count_nonzero(refined == 2)
+    assert sep_size <= n
+    for v, neighbors in enumerate(adjacency):
+        if refined[v] != 2:
+            assert all(refined[w] in (refined[v], 2) for w in neighbors)
+
+    result = pymetis.refine_vertex_separator(adjacency, part, out=part)
+    assert result.part is part
+
+    with pytest.raises(ValueError):
+        pymetis.refine_vertex_separator(adjacency, np.where(cols < n // 2, 0, 1))
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_graph(tmp_path, mmap):
+    import warnings
+
+    n = 15
+    adjacency = [
+        [(i + di) * n + j + dj
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < n and 0 <= j + dj < n]
+        for i in range(n) for j in range(n)]
+    csr = pymetis.to_csr_adjacency(adjacency)
+
+    rng = np.random.default_rng(7)
+    vweights = rng.integers(1, 5, size=(n * n, 2))
+    eweights = np.ones(len(csr.adjacent), dtype=np.int32)
+
+    path = tmp_path / "grid.bin"
+    pymetis.save_graph(path, adjacency, vweights, eweights=eweights)
+    graph = pymetis.load_graph(path, mmap=mmap)
+
+    assert np.array_equal(graph.adjacency.adj_starts, csr.adj_starts)
+    assert np.array_equal(graph.adjacency.adjacent, csr.adjacent)
+    assert np.array_equal(graph.vweights, vweights)
+    assert np.array_equal(graph.eweights, eweights)
+    assert graph.vsize is None
+    assert isinstance(graph.adjacency.adjacent, np.memmap) == mmap
+
+    # the loaded arrays go to METIS without copying
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", BytesWarning)
+        cuts, _part = pymetis.part_graph(
+            2, graph.adjacency, vweights=graph.vweights, eweights=graph.eweights,
+            warn_on_copies=True)
+    assert cuts == pymetis.part_graph(
+        2, csr, vweights=vweights, eweights=eweights).edge_cuts
+
+    pymetis.save_graph(path, pymetis.CSRAdjacency([0], []), vsize=[])
+    empty = pymetis.load_graph(path, mmap=mmap)
+    assert list(empty.adjacency.adj_starts) == [0]
+    assert len(empty.vsize) == 0
+
+    with pytest.raises(ValueError):
+        pymetis.save_graph(path, csr, eweights=[1, 2])
+    path.write_bytes(b"not a graph")
+    with pytest.raises(ValueError):
+        pymetis.load_graph(path, mmap=mmap)
+
+    # corrupt idx_t width and alignment
+    pymetis.save_graph(path, csr)
+    data = path.read_bytes()
+    for pos, value in [(12, b"\x03"), (14, b"\x00\x00")]:
+        path.write_bytes(data[:pos] + value + data[pos + len(value):])
+        with pytest.raises(ValueError):
+            pymetis.load_graph(path, mmap=mmap)
+
+
+def test_metis_text_files(tmp_path):
+    n = 6
+    adjacency = [
+        [(i + di) * n + j + dj
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < n and 0 <= j + dj < n]
+        for i in range(n) for j in range(n)]
+    # an isolated vertex, whose line is empty
+    adjacency.append([])
+    nvtxs = len(adjacency)
+    nedges = sum(len(nbrs) for nbrs in adjacency) // 2
+
+    rng = np.random.default_rng(4)
+    vsize = rng.integers(1, 4, size=nvtxs)
+    vweights = rng.integers(0, 5, size=(nvtxs, 2))
+    eweights = [[1 + (u + v) % 3 for v in nbrs] for u, nbrs in enumerate(adjacency)]
+
+    lines = ["% a comment", f"{nvtxs} {nedges} 111 2"]
+    for u, nbrs in enumerate(adjacency):
+        fields = [vsize[u], *vweights[u]]
+        for v, w in zip(nbrs, eweights[u], strict=True):
+            fields += [v + 1, w]
+        lines.append(" ".join(str(f) for f in fields))
+        if u == 3:
+            lines.append("% another comment")
+    path = tmp_path / "grid.graph"
+    path.write_text("\n".join(lines) + "\n")
+
+    graph = pymetis.read_graph(path)
+    csr = pymetis.to_csr_adjacency(adjacency)
+    assert np.array_equal(graph.adjacency.adj_starts, csr.adj_starts)
+    assert np.array_equal(graph.adjacency.adjacent, csr.adjacent)
+    assert np.array_equal(graph.vweights, vweights)
+    assert np.array_equal(graph.vsize, vsize)
+    assert list(graph.eweights) == [w for ws in eweights for w in ws]
+
+    # plain format
+    path.write_text(f"{nvtxs} {nedges}\n" + "".join(
+        " ".join(str(v + 1) for v in nbrs) + "\n" for nbrs in adjacency))
+    plain = pymetis.read_graph(path)
+    assert np.array_equal(plain.adjacency.adjacent, csr.adjacent)
+    assert plain.vweights is None
+    assert plain.eweights is None
+    assert plain.vsize is None
+
+    # without trailing newline
+    path.write_text("2 1\n2\n1")
+    assert list(pymetis.read_graph(path).adjacency.adjacent) == [1, 0]
+
+    path.write_text("3 2\n2\n1 3\n2 1\n")
+    with pytest.raises(ValueError, match=":4:"):
+        pymetis.read_graph(path)
+    path.write_text("3 2\n2\n1 x\n")
+    with pytest.raises(ValueError, match="unexpected character"):
+        pymetis.read_graph(path)
+    with pytest.raises(OSError):
+        pymetis.read_graph(tmp_path / "missing.graph")
+
+    _cuts, part = pymetis.part_graph(3, plain.adjacency)
+    pymetis.write_partition(tmp_path / "grid.graph.part.3", part)
+    assert (tmp_path / "grid.graph.part.3").read_text().split() \
+        == [str(p) for p in part]
+
+    _perm, iperm = pymetis.nested_dissection(plain.adjacency)
+    pymetis.write_permutation(tmp_path / "grid.graph.iperm", iperm)
+    assert [int(i) for i in (tmp_path / "grid.graph.iperm").read_text().split()] \
+        == list(iperm)
+
+
+def test_command_line(tmp_path, capsys):
+    import json
+
+    from pymetis.__main__ import main
+
+    n = 8
+    adjacency = [
+        [(i + di) * n + j + dj
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < n and 0 <= j + dj < n]
+        for i in range(n) for j in range(n)]
+    graph_path = tmp_path / "grid.graph"
+    graph_path.write_text(
+        f"{len(adjacency)} {sum(len(nbrs) for nbrs in adjacency) // 2}\n"
+        + "".join(" ".join(str(v + 1) for v in nbrs) + "\n" for nbrs in adjacency))
+    binary_path = tmp_path / "grid.pmg"
+    pymetis.save_graph(binary_path, adjacency)
+
+    assert main(["part-graph", str(graph_path), "4", "--ptype", "rb",
+                 "--ufactor", "10", "--contig", "--seed", "1", "--repeat", "3",
+                 "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["timings"]["metis"]["count"] == 3
+    assert {"input", "conversion", "output"} <= set(report["timings"])
+    part = [int(p) for p in (tmp_path / "grid.graph.part.4").read_text().split()]
+    stats = pymetis.partition_stats(adjacency, part)
+    assert report["quality"]["edge_cut"] == stats.edge_cut
+    assert report["quality"]["disconnected_parts"] == 0
+
+    assert main(["part-graph", str(binary_path), "2", "-o",
+                 str(tmp_path / "out.part")]) == 0
+    assert "edge_cut" in capsys.readouterr().out
+    assert len((tmp_path / "out.part").read_text().split()) == n * n
+
+    assert main(["nd", str(binary_path), "--no-mmap", "--nooutput", "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["quality"]["nnz_l"] >= n * n
+    assert "output" not in report["timings"]
+    assert not (tmp_path / "grid.pmg.iperm").exists()
+
+    mesh_path = tmp_path / "strip.mesh"
+    mesh_path.write_text("4\n1 2 3\n2 3 4\n3 4 5\n4 5 6\n")
+    assert main(["part-mesh", str(mesh_path), "2", "--ncommon", "2"]) == 0
+    capsys.readouterr()
+    assert len((tmp_path / "strip.mesh.epart.2").read_text().split()) == 4
+    assert len((tmp_path / "strip.mesh.npart.2").read_text().split()) == 6
+
+    assert main(["part-graph", str(tmp_path / "missing.graph"), "2"]) == 1
+    with pytest.raises(SystemExit):
+        main(["part-graph", str(graph_path), "2", "--ctype", "bogus"])
+
+
+def test_generators():
+    from pymetis import generators
+
+    def edges(csr):
+        starts = np.asarray(csr.adj_starts)
+        sources = np.repeat(np.arange(len(starts) - 1), np.diff(starts))
+        return set(zip(sources.tolist(), np.asarray(csr.adjacent).tolist(),
+                       strict=True))
+
+    grid = generators.grid_graph((4, 3))
+    assert edges(grid) == edges(pymetis.to_csr_adjacency([
+        [(j + dj) * 4 + i + di
+         for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+         if 0 <= i + di < 4 and 0 <= j + dj < 3]
+        for j in range(3) for i in range(4)]))
+    assert len(generators.grid_graph((5, 6, 7)).adjacent) \
+        == 2 * (4 * 6 * 7 + 5 * 5 * 7 + 5 * 6 * 6)
+
+    for csr in [
+            generators.random_geometric_graph(2000, seed=3),
+            generators.random_geometric_graph(2000, dim=3, seed=3),
+            generators.power_law_graph(2000, 4, seed=3),
+            ]:
+        graph_edges = edges(csr)
+        assert all((v, u) in graph_edges for u, v in graph_edges)
+        assert all(u != v for u, v in graph_edges)
+        assert 4 <= len(graph_edges) / 2000 <= 10
+        pymetis.part_graph(4, csr)
+
+    # deterministic for a given seed
+    a = generators.random_geometric_graph(500, 0.1, seed=5)
+    b = generators.random_geometric_graph(500, 0.1, seed=5)
+    assert np.array_equal(a.adjacent, b.adjacent)
+    assert len(a.adjacent) != len(
+        generators.random_geometric_graph(500, 0.1, seed=6).adjacent)
+
+    # power-law graphs have a heavy tail of high-degree vertices
+    degrees = np.diff(generators.power_law_graph(10000, 3).adj_starts)
+    assert degrees.min() == 3
+    assert degrees.max() > 100
+
+    with pytest.raises(ValueError):
+        generators.grid_graph((0, 3))
+    with pytest.raises(ValueError):
+        generators.random_geometric_graph(10, 0.1, dim=4)
+
+
+def test_collect_timings(capfd):
+    from pymetis.cache import PartitionCache
+    from pymetis.generators import grid_graph
+
+    csr = grid_graph((60, 60))
+    cache = PartitionCache()
+
+    for recursive in [False, True]:
+        opts = pymetis.Options(seed=1)
+        plain = pymetis.part_graph(8, csr, recursive=recursive, options=opts)
+        result, timings = pymetis.part_graph(
+            8, csr, recursive=recursive, options=opts, cache=cache,
+            collect_timings=True)
+        assert np.array_equal(result.vertex_part, plain.vertex_part)
+        assert isinstance(timings, pymetis.MetisTimings)
+        assert timings.total >= timings.coarsening >= timings.matching >= 0
+        assert timings.uncoarsening >= timings.refinement >= 0
+        assert timings.levels > 0
+        assert 0 < timings.coarsest_vertices < 3600
+        assert timings.coarsest_edges > 0
+        # one coarsening per bisection
+        assert timings.coarsenings == (7 if recursive else 1)
+
+        # the options are left unchanged
+        assert opts.dbglvl == -1
+
+    # METIS is run even if the cache has the result
+    _result, timings = pymetis.part_graph(
+        8, csr, recursive=True, options=pymetis.Options(seed=1), cache=cache,
+        collect_timings=True)
+    assert timings.coarsenings == 7
+
+    _ordering, stats, timings = pymetis.nested_dissection(
+        csr, npes=4, return_stats=True, collect_timings=True)
+    assert isinstance(stats, pymetis.OrderingStats)
+    assert timings.coarsenings > 1
+    assert timings.splitting > 0
+
+    (_perm, _iperm), timings = pymetis.nested_dissection(csr, collect_timings=True)
+    assert timings.levels > 0
+
+    from pymetis.generators import tet_mesh
+    _mesh_part, timings = pymetis.part_mesh(
+        4, tet_mesh((4, 4, 4)), gtype=pymetis.GType.DUAL, ncommon=3,
+        collect_timings=True)
+    assert timings.coarsenings >= 1
+
+    # nothing is printed
+    out, _err = capfd.readouterr()
+    assert "Timing" not in out
+
+
+def test_max_memory():
+    from pymetis.generators import grid_graph, tet_mesh
+
+    csr = grid_graph((60, 60))
+    nedges = len(csr.adjacent)
+
+    _result, timings = pymetis.part_graph(8, csr, collect_timings=True)
+    estimate = pymetis.estimate_memory("part_graph", 3600, nedges, 8)
+    assert 0.5 < timings.peak_memory / estimate < 2
+
+    result = pymetis.part_graph(8, csr, max_memory=2 * estimate)
+    assert result.edge_cuts > 0
+
+    # refused up front
+    with pytest.raises(MemoryError, match="estimated"):
+        pymetis.part_graph(8, csr, max_memory=estimate // 2)
+    with pytest.raises(MemoryError, match="estimated"):
+        pymetis.nested_dissection(csr, max_memory=1000)
+
+    # aborted by METIS: the estimate takes the dual graph to be much smaller
+    # than it is with ncommon=1
+    mesh = tet_mesh((6, 6, 6))
+    _mesh_part, timings = pymetis.part_mesh(4, mesh, gtype=pymetis.GType.DUAL,
+                                            collect_timings=True)
+    with pytest.raises(MemoryError, match="would have allocated"):
+        pymetis.part_mesh(4, mesh, gtype=pymetis.GType.DUAL,
+                          max_memory=timings.peak_memory // 2)
+
+    # METIS is still usable afterwards
+    assert pymetis.part_graph(8, csr).edge_cuts == result.edge_cuts
+
+    with pytest.raises(ValueError):
+        pymetis.estimate_memory("part_graph", -1, 0)
+
+
 def test_options():
     opt = pymetis.Options()
     assert opt.numbering == -1  # apparently the default
@@ -14,8 +14,8 @@ def test_2d_quad_mesh_nodal(vis=False):
         None, None, pymetis.GType.NODAL)
 
     print(n_cuts)
-    print([elem_part.count(it) for it in range(n_part)])
-    print([vert_part.count(it) for it in range(n_part)])
+    print([int(np.count_nonzero(elem_part == it)) for it in range(n_part)])
+    print([int(np.count_nonzero(vert_part == it)) for it in range(n_part)])
 
     if vis:
         import pyvtk
@@ -38,14 +38,14 @@ def test_2d_quad_mesh_nodal(vis=False):
     # Test that the partition assigns approx the same number of elements/vertices
     # to each partition
     n_elem = n_cells_x * n_cells_y
-    elem_count = [elem_part.count(it) for it in range(n_part)]
+    elem_count = [int(np.count_nonzero(elem_part == it)) for it in range(n_part)]
     assert elem_count == pytest.approx(
         [float(n_elem) / float(n_part)] * n_part, rel=0.1)
 
     # Test that the partition assigns approx the same number of elements/vertices
     # to each partition
     n_vert = (n_cells_x + 1) * (n_cells_y + 1)
-    vert_count = [vert_part.count(it) for it in range(n_part)]
+    vert_count = [int(np.count_nonzero(vert_part == it)) for it in range(n_part)]
     assert vert_count == pytest.approx(
         [float(n_vert) / float(n_part)] * n_part, rel=0.1)
 
@@ -60,8 +60,8 @@ def test_2d_quad_mesh_dual(vis=False):
         None, None, pymetis.GType.DUAL)
 
     print(n_cuts)
-    print([elem_part.count(it) for it in range(n_part)])
-    print([vert_part.count(it) for it in range(n_part)])
+    print([int(np.count_nonzero(elem_part == it)) for it in range(n_part)])
+    print([int(np.count_nonzero(vert_part == it)) for it in range(n_part)])
 
     if vis:
         import pyvtk
@@ -84,18 +84,186 @@ def test_2d_quad_mesh_dual(vis=False):
     # Test that the partition assigns approx the same number of elements/vertices
     # to each partition
     n_elem = n_cells_x * n_cells_y
-    elem_count = [elem_part.count(it) for it in range(n_part)]
+    elem_count = [int(np.count_nonzero(elem_part == it)) for it in range(n_part)]
     assert elem_count == pytest.approx(
         [float(n_elem) / float(n_part)] * n_part, rel=0.1)
 
     # Test that the partition assigns approx the same number of elements/vertices
     # to each partition
     n_vert = (n_cells_x + 1) * (n_cells_y + 1)
-    vert_count = [vert_part.count(it) for it in range(n_part)]
+    vert_count = [int(np.count_nonzero(vert_part == it)) for it in range(n_part)]
     assert vert_count == pytest.approx(
         [float(n_vert) / float(n_part)] * n_part, rel=0.1)
 
 
+def test_part_mesh_out():
+    n_cells_x, n_cells_y = 8, 6
+    _points, connectivity = generate_mesh_2d(n_cells_x, n_cells_y)
+    tp = pymetis.zero_copy_dtype()
+
+    elem_part_out = np.empty(n_cells_x * n_cells_y, dtype=tp)
+    vert_part_out = np.empty((n_cells_x + 1) * (n_cells_y + 1), dtype=tp)
+    _n_cuts, elem_part, vert_part = pymetis.part_mesh(
+        3, connectivity, elem_part_out=elem_part_out,
+        vert_part_out=vert_part_out)
+    assert elem_part is elem_part_out
+    assert vert_part is vert_part_out
+    assert set(elem_part) == {0, 1, 2}
+
+    with pytest.raises(ValueError):
+        pymetis.part_mesh(3, connectivity, elem_part_out=vert_part_out)
+
+
+def test_part_mesh_many():
+    meshes = [generate_mesh_2d(nx, ny)[1] for nx, ny in [(10, 7), (4, 4), (12, 3)]]
+
+    results = pymetis.part_mesh_many(
+        [4, 2, 3], meshes, gtype=[pymetis.GType.NODAL, pymetis.GType.DUAL,
+                                  pymetis.GType.DUAL],
+        ncommon=2)
+
+    assert len(results) == len(meshes)
+    for result, conn, n_part in zip(results, meshes, [4, 2, 3], strict=True):
+        assert isinstance(result, pymetis.MeshPartition)
+        assert len(result.element_part) == len(conn)
+        assert max(result.element_part) == n_part - 1
+        assert len(result.vertex_part) == max(max(el) for el in conn) + 1
+
+
+def test_part_mesh_array_and_csr():
+    import warnings
+
+    n_cells_x, n_cells_y = 9, 7
+    _points, connectivity = generate_mesh_2d(n_cells_x, n_cells_y)
+    n_vert = (n_cells_x + 1) * (n_cells_y + 1)
+    tp = pymetis.zero_copy_dtype()
+
+    opts = pymetis.Options(seed=17)
+    ref = pymetis.part_mesh(3, connectivity, opts, gtype=pymetis.GType.DUAL,
+                            ncommon=2)
+
+    conn_array = np.array(connectivity, dtype=tp)
+    csr = pymetis.CSRMesh(
+        elem_starts=np.arange(0, conn_array.size + 1, 4, dtype=tp),
+        elem_vertices=conn_array.reshape(-1))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        for conn in [conn_array, csr]:
+            result = pymetis.part_mesh(3, conn, opts, gtype=pymetis.GType.DUAL,
+                                       ncommon=2, warn_on_copies=True)
+            assert result.edge_cuts == ref.edge_cuts
+            assert list(result.element_part) == list(ref.element_part)
+            assert list(result.vertex_part) == list(ref.vertex_part)
+
+    # non-native integer widths are converted
+    result = pymetis.part_mesh(3, conn_array.astype(np.int32), opts,
+                               gtype=pymetis.GType.DUAL, ncommon=2)
+    assert list(result.element_part) == list(ref.element_part)
+
+    # extra, unreferenced vertices
+    result = pymetis.part_mesh(3, conn_array, n_vertices=n_vert + 5)
+    assert len(result.vertex_part) == n_vert + 5
+
+    with pytest.raises(ValueError):
+        pymetis.part_mesh(3, conn_array, n_vertices=n_vert - 1)
+    with pytest.raises(ValueError):
+        pymetis.part_mesh(3, [[0, 1, 2], [2, -1, 3]])
+    with pytest.raises(ValueError):
+        pymetis.part_mesh(3, pymetis.CSRMesh(
+            elem_starts=np.array([0, 3, 2], dtype=tp),
+            elem_vertices=np.array([0, 1, 2], dtype=tp)))
+
+    results = pymetis.part_mesh_many(
+        3, [conn_array, csr, connectivity], n_vertices=[None, n_vert, n_vert],
+        options=opts, gtype=pymetis.GType.DUAL, ncommon=2)
+    for result in results:
+        assert list(result.element_part) == list(ref.element_part)
+
+
+def test_part_mesh_element_weights():
+    n_cells_x, n_cells_y = 20, 10
+    _points, quads = generate_mesh_2d(n_cells_x, n_cells_y)
+
+    # split the right half of the quads into triangles, which we pretend are
+    # much more expensive
+    connectivity = []
+    for i, (a, b, c, d) in enumerate(quads):
+        if i % n_cells_x >= n_cells_x // 2:
+            connectivity += [[a, b, c], [a, c, d]]
+        else:
+            connectivity.append([a, b, c, d])
+
+    weights = pymetis.element_weights_from_arity(connectivity, {3: 5, 4: 1})
+    assert list(weights) == [5 if len(el) == 3 else 1 for el in connectivity]
+    assert list(pymetis.element_weights_from_arity(
+        np.array(quads), {3: 5}, default=2)) == [2] * len(quads)
+    with pytest.raises(ValueError):
+        pymetis.element_weights_from_arity(connectivity, {4: 1})
+
+    n_part = 2
+    _n_cuts, elem_part, _vert_part = pymetis.part_mesh(
+        n_part, connectivity, gtype=pymetis.GType.DUAL, ncommon=2,
+        element_weights=weights, element_sizes=weights)
+
+    part_weights = [
+        sum(int(w) for w, p in zip(weights, elem_part, strict=True) if p == ip)
+        for ip in range(n_part)]
+    assert part_weights == pytest.approx(
+        [sum(part_weights) / n_part] * n_part, rel=0.1)
+
+    with pytest.raises(ValueError):
+        pymetis.part_mesh(n_part, connectivity, gtype=pymetis.GType.NODAL,
+                          element_weights=weights)
+    with pytest.raises(ValueError):
+        pymetis.part_mesh(n_part, connectivity, gtype=pymetis.GType.DUAL,
+                          element_weights=weights[:-1])
+
+
+def test_mesh_graphs():
+    n_cells_x, n_cells_y = 6, 4
+    _points, connectivity = generate_mesh_2d(n_cells_x, n_cells_y)
+    mesh = pymetis.Mesh(connectivity)
+
+    assert mesh.n_elements == n_cells_x * n_cells_y
+    assert mesh.n_vertices == (n_cells_x + 1) * (n_cells_y + 1)
+
+    def neighbors(graph, i):
+        starts = graph.adj_starts
+        return set(graph.adjacent[starts[i]:starts[i + 1]].tolist())
+
+    # quads sharing an edge
+    dual = mesh.dual_graph(2)
+    assert mesh.dual_graph(2) is dual
+    assert len(dual.adj_starts) == mesh.n_elements + 1
+    assert neighbors(dual, 0) == {1, n_cells_x}
+    assert dual.adjacent.dtype == pymetis.zero_copy_dtype()
+
+    # quads sharing a vertex
+    assert neighbors(mesh.dual_graph(), 0) == {1, n_cells_x, n_cells_x + 1}
+
+    nodal = mesh.nodal_graph()
+    assert mesh.nodal_graph() is nodal
+    assert len(nodal.adj_starts) == mesh.n_vertices + 1
+    assert neighbors(nodal, 0) == {1, n_cells_x + 1, n_cells_x + 2}
+
+    opts = pymetis.Options(seed=5)
+    _n_cuts, elem_part = pymetis.part_graph(3, dual, options=opts)
+    assert len(elem_part) == mesh.n_elements
+    perm, _iperm = pymetis.nested_dissection(nodal)
+    assert sorted(perm) == list(range(mesh.n_vertices))
+
+    ref = pymetis.part_mesh(3, connectivity, opts, gtype=pymetis.GType.DUAL,
+                            ncommon=2)
+    result = pymetis.part_mesh(3, mesh, opts, gtype=pymetis.GType.DUAL,
+                               ncommon=2)
+    assert list(result.element_part) == list(ref.element_part)
+
+    mesh = pymetis.Mesh(connectivity, n_vertices=mesh.n_vertices + 2)
+    assert len(mesh.nodal_graph().adj_starts) == mesh.n_vertices + 1
+    assert len(pymetis.part_mesh(2, mesh).vertex_part) == mesh.n_vertices
+
+
 def test_2d_quad_mesh_dual_with_ncommon(vis=False):
     """
     Generate simple 2D `mesh` connectivity with rectangular elements, eg
@@ -125,8 +293,8 @@ def test_2d_quad_mesh_dual_with_ncommon(vis=False):
         None, None, pymetis.GType.DUAL, ncommon)
 
     print(n_cuts)
-    print([elem_part.count(it) for it in range(n_part)])
-    print([vert_part.count(it) for it in range(n_part)])
+    print([int(np.count_nonzero(elem_part == it)) for it in range(n_part)])
+    print([int(np.count_nonzero(vert_part == it)) for it in range(n_part)])
 
     if vis:
         import pyvtk
@@ -149,7 +317,7 @@ def test_2d_quad_mesh_dual_with_ncommon(vis=False):
     # Test that the partition assigns approx the same number of elements/vertices
     # to each partition
     n_elem = n_cells_x * n_cells_y
-    elem_count = [elem_part.count(it) for it in range(n_part)]
+    elem_count = [int(np.count_nonzero(elem_part == it)) for it in range(n_part)]
     assert elem_count == pytest.approx(
         [float(n_elem) / float(n_part)] * n_part, rel=0.1)
 
@@ -165,8 +333,8 @@ def test_2d_quad_mesh_nodal_with_weights(vis=False):
         None, tpwgts, pymetis.GType.NODAL)
 
     print(n_cuts)
-    print([elem_part.count(it) for it in range(n_part)])
-    print([vert_part.count(it) for it in range(n_part)])
+    print([int(np.count_nonzero(elem_part == it)) for it in range(n_part)])
+    print([int(np.count_nonzero(vert_part == it)) for it in range(n_part)])
 
     if vis:
         import pyvtk
@@ -189,14 +357,14 @@ def test_2d_quad_mesh_nodal_with_weights(vis=False):
     # Test that element/vertex ratio among the partitions
     # agrees with the weights (`tpwgts`)
     n_elem = n_cells_x * n_cells_y
-    elem_count = [elem_part.count(it) for it in range(n_part)]
+    elem_count = [int(np.count_nonzero(elem_part == it)) for it in range(n_part)]
     assert elem_count == pytest.approx(
         [float(n_elem) * tpwgts[it] for it in range(n_part)], rel=0.1)
 
     # Test that element/vertex ratio among the partitions
     # agrees with the weights (`tpwgts`)
     n_vert = (n_cells_x + 1) * (n_cells_y + 1)
-    vert_count = [vert_part.count(it) for it in range(n_part)]
+    vert_count = [int(np.count_nonzero(vert_part == it)) for it in range(n_part)]
     assert vert_count == pytest.approx(
         [float(n_vert) * tpwgts[it] for it in range(n_part)], rel=0.1)
 
@@ -212,8 +380,8 @@ def test_2d_quad_mesh_dual_with_weights(vis=False):
         None, tpwgts, pymetis.GType.DUAL)
 
     print(n_cuts)
-    print([elem_part.count(it) for it in range(n_part)])
-    print([vert_part.count(it) for it in range(n_part)])
+    print([int(np.count_nonzero(elem_part == it)) for it in range(n_part)])
+    print([int(np.count_nonzero(vert_part == it)) for it in range(n_part)])
 
     if vis:
         import pyvtk
@@ -236,14 +404,14 @@ def test_2d_quad_mesh_dual_with_weights(vis=False):
     # Test that element/vertex ratio among the partitions
     # agrees with the weights (`tpwgts`)
     n_elem = n_cells_x * n_cells_y
-    elem_count = [elem_part.count(it) for it in range(n_part)]
+    elem_count = [int(np.count_nonzero(elem_part == it)) for it in range(n_part)]
     assert elem_count == pytest.approx(
         [float(n_elem) * tpwgts[it] for it in range(n_part)], rel=0.1)
 
     # Test that element/vertex ratio among the partitions
     # agrees with the weights (`tpwgts`)
     n_vert = (n_cells_x + 1) * (n_cells_y + 1)
-    vert_count = [vert_part.count(it) for it in range(n_part)]
+    vert_count = [int(np.count_nonzero(vert_part == it)) for it in range(n_part)]
     assert vert_count == pytest.approx(
         [float(n_vert) * tpwgts[it] for it in range(n_part)], rel=0.1)
 
@@ -255,8 +423,8 @@ def test_2d_trivial_mesh_part():
 
     n_cuts, elem_part, vert_part = pymetis.part_mesh(1, connectivity)
     assert n_cuts == 0
-    assert elem_part == [0] * (n_cells_x * n_cells_y)
-    assert vert_part == [0] * ((n_cells_x + 1) * (n_cells_y + 1))
+    assert list(elem_part) == [0] * (n_cells_x * n_cells_y)
+    assert list(vert_part) == [0] * ((n_cells_x + 1) * (n_cells_y + 1))
 
 
 def test_3d_hex_mesh_part_nodal(vis=False):
@@ -290,14 +458,14 @@ def test_3d_hex_mesh_part_nodal(vis=False):
     # Test that the partition assigns approx the same number of elements/vertices
     # to each partition
     n_elem = n_cells_x * n_cells_y * n_cells_z
-    elem_count = [elem_part.count(it) for it in range(n_part)]
+    elem_count = [int(np.count_nonzero(elem_part == it)) for it in range(n_part)]
     assert elem_count == pytest.approx(
         [float(n_elem) / float(n_part)] * n_part, rel=0.1)
 
     # Test that the partition assigns approx the same number of elements/vertices
     # to each partition
     n_vert = (n_cells_x + 1) * (n_cells_y + 1) * (n_cells_z + 1)
-    vert_count = [vert_part.count(it) for it in range(n_part)]
+    vert_count = [int(np.count_nonzero(vert_part == it)) for it in range(n_part)]
     assert vert_count == pytest.approx(
         [float(n_vert) / float(n_part)] * n_part, rel=0.1)
 
@@ -333,14 +501,14 @@ def test_3d_hex_mesh_part_dual(vis=False):
     # Test that the partition assigns approx the same number of elements/vertices
     # to each partition
     n_elem = n_cells_x * n_cells_y * n_cells_z
-    elem_count = [elem_part.count(it) for it in range(n_part)]
+    elem_count = [int(np.count_nonzero(elem_part == it)) for it in range(n_part)]
     assert elem_count == pytest.approx(
         [float(n_elem) / float(n_part)] * n_part, rel=0.1)
 
     # Test that the partition assigns approx the same number of elements/vertices
     # to each partition
     n_vert = (n_cells_x + 1) * (n_cells_y + 1) * (n_cells_z + 1)
-    vert_count = [vert_part.count(it) for it in range(n_part)]
+    vert_count = [int(np.count_nonzero(vert_part == it)) for it in range(n_part)]
     assert vert_count == pytest.approx(
         [float(n_vert) / float(n_part)] * n_part, rel=0.1)
 
@@ -377,14 +545,14 @@ def test_3d_hex_mesh_part_nodal_with_weights(vis=False):
     # Test that element/vertex ratio among the partitions
     # agrees with the weights ratio (`tpwgts`)
     n_elem = n_cells_x * n_cells_y * n_cells_z
-    elem_count = [elem_part.count(it) for it in range(n_part)]
+    elem_count = [int(np.count_nonzero(elem_part == it)) for it in range(n_part)]
     assert elem_count == pytest.approx(
         [float(n_elem) * tpwgts[it] for it in range(n_part)], rel=0.1)
 
     # Test that element/vertex ratio among the partitions
     # agrees with the weights ratio (`tpwgts`)
     n_vert = (n_cells_x + 1) * (n_cells_y + 1) * (n_cells_z + 1)
-    vert_count = [vert_part.count(it) for it in range(n_part)]
+    vert_count = [int(np.count_nonzero(vert_part == it)) for it in range(n_part)]
     assert vert_count == pytest.approx(
         [float(n_vert) * tpwgts[it] for it in range(n_part)], rel=0.1)
 
@@ -421,14 +589,14 @@ def test_3d_hex_mesh_part_dual_with_weights(vis=False):
     # Test that element/vertex ratio among the partitions
     # agrees with the weights ratio (`tpwgts`)
     n_elem = n_cells_x * n_cells_y * n_cells_z
-    elem_count = [elem_part.count(it) for it in range(n_part)]
+    elem_count = [int(np.count_nonzero(elem_part == it)) for it in range(n_part)]
     assert elem_count == pytest.approx(
         [float(n_elem) * tpwgts[it] for it in range(n_part)], rel=0.1)
 
     # Test that element/vertex ratio among the partitions
     # agrees with the weights ratio (`tpwgts`)
     n_vert = (n_cells_x + 1) * (n_cells_y + 1) * (n_cells_z + 1)
-    vert_count = [vert_part.count(it) for it in range(n_part)]
+    vert_count = [int(np.count_nonzero(vert_part == it)) for it in range(n_part)]
     assert vert_count == pytest.approx(
         [float(n_vert) * tpwgts[it] for it in range(n_part)], rel=0.1)
 
@@ -441,8 +609,8 @@ def test_part_mesh_named_tuple():
     partition = pymetis.part_mesh(1, connectivity)
     assert isinstance(partition, pymetis.MeshPartition)
     assert partition.edge_cuts == 0
-    assert partition.element_part == [0] * (n_cells_x * n_cells_y)
-    assert partition.vertex_part == [0] * ((n_cells_x + 1) * (n_cells_y + 1))
+    assert list(partition.element_part) == [0] * (n_cells_x * n_cells_y)
+    assert list(partition.vertex_part) == [0] * ((n_cells_x + 1) * (n_cells_y + 1))
 
     partition = pymetis.part_mesh(2, connectivity, None, None,
         pymetis.GType.NODAL)
@@ -553,3 +721,54 @@ def generate_mesh_3d(nx, ny, nz):
     ]
 
     return points, connectivity
+
+
+def test_read_mesh(tmp_path):
+    path = tmp_path / "two.mesh"
+    path.write_text("% two quads and a triangle\n3 1\n"
+                    "2 1 2 5 4\n1 2 3 6 5\n% comment\n4 5 6 7\n")
+
+    mesh, element_weights = pymetis.read_mesh(path)
+    assert list(mesh.csr.elem_starts) == [0, 4, 8, 11]
+    assert list(mesh.csr.elem_vertices) == [0, 1, 4, 3, 1, 2, 5, 4, 4, 5, 6]
+    assert mesh.n_vertices == 7
+    assert list(element_weights) == [2, 1, 4]
+
+    _n_cuts, elem_part, _vert_part = pymetis.part_mesh(
+        2, mesh, element_weights=element_weights, gtype=pymetis.GType.DUAL,
+        ncommon=2)
+    assert len(elem_part) == 3
+
+    path.write_text("1\n1 2 3\n")
+    unweighted = pymetis.read_mesh(path)
+    assert unweighted.element_weights is None
+    assert unweighted.mesh.n_elements == 1
+
+    path.write_text("2\n1 2 3\n")
+    with pytest.raises(ValueError, match="premature end"):
+        pymetis.read_mesh(path)
+
+
+def test_tet_mesh():
+    from pymetis.generators import tet_mesh
+
+    mesh = tet_mesh((3, 4, 5))
+    assert mesh.n_elements == 6 * 3 * 4 * 5
+    assert mesh.n_vertices == 4 * 5 * 6
+
+    elements = np.asarray(mesh.csr.elem_vertices).reshape(-1, 4)
+    assert all(len(set(elem)) == 4 for elem in elements.tolist())
+
+    # conforming: each interior face is shared by exactly two elements
+    faces: dict[tuple[int, ...], int] = {}
+    for elem in elements.tolist():
+        for i in range(4):
+            face = tuple(sorted(elem[:i] + elem[i + 1:]))
+            faces[face] = faces.get(face, 0) + 1
+    n_boundary_faces = sum(1 for count in faces.values() if count == 1)
+    assert n_boundary_faces == 4 * (3 * 4 + 4 * 5 + 3 * 5)
+    assert max(faces.values()) == 2
+
+    _n_cuts, elem_part, _vert_part = pymetis.part_mesh(
+        4, mesh, gtype=pymetis.GType.DUAL, ncommon=3)
+    assert set(elem_part) == {0, 1, 2, 3}